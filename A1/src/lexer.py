@@ -4,6 +4,12 @@
 # ------------------------------------------------------------------
 import ply.lex as lex
 import sys
+import os
+import re
+import mmap
+import json
+import multiprocessing
+from collections import Counter
 # import itertools
 
 # THE LIST OF RESERVED KEYWORDS IN C# 
@@ -211,8 +217,10 @@ def t_PREPROCESSOR(t):
 	t.lineno += 1
 
 # Error handling rule
+# (errors go to stderr instead when the output is JSON)
+errstream = sys.stdout
 def t_error(t):
-	print("Illegal character '%s'" % t.value[0])
+	print("Illegal character '%s'" % t.value[0], file=errstream)
 	t.lexer.skip(1)
 
 
@@ -220,53 +228,153 @@ def t_error(t):
 lexer = lex.lex()
 
 # File I/O
-# Input filename from terminal
-strinputfile = sys.argv[1]
-inputfile = open(strinputfile, 'r')
+# The file is memory-mapped and lexed in chunks that end after a newline
+# outside any comment, so only one chunk of the source is in memory at a time.
+# The same as PyCS_1.0/src/source.py: each assignment runs on its own.
+CHUNK_SIZE = 1 << 20
+markers = re.compile(rb'/\*[\s\S]*?\*/|"(?:[^\\\n]|\\.)*?"|\'(?:[^\\\n]|\\.)*?\'|\#.*?\n|/\*')
 
-#data = "using System; namespace HelloWorld"
-#Convert file to string as lexer takes only string inputs.
-data = inputfile.read()
+def boundary(m, start, stop):
+	limit = stop
+	comments = []
+	for match in markers.finditer(m, start, stop):
+		if match.group() == b'/*':
+			# comment not closed inside this region
+			limit = match.start()
+			break
+		if match.group().startswith(b'/*'):
+			comments.append(match.span())
+	cut = m.rfind(b'\n', start, limit)
+	for (begin, end) in reversed(comments):
+		if begin < cut < end:
+			cut = m.rfind(b'\n', start, begin)
+	if cut == -1:
+		return -1
+	return cut + 1
 
-#Giving file (in string form) as input to our lexer
-lexer.input(data)
+def chunks(filename, size=CHUNK_SIZE):
+	with open(filename, 'rb') as f:
+		f.seek(0, 2)
+		if f.tell() == 0:
+			return
+		m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			start = 0
+			released = 0
+			length = len(m)
+			while start < length:
+				window = size
+				stop = min(start + window, length)
+				while stop < length:
+					cut = boundary(m, start, stop)
+					if cut != -1:
+						stop = cut
+						break
+					window = window*2
+					stop = min(start + window, length)
+				# Newlines are translated as when reading the file in text mode
+				yield m[start:stop].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+				# Mapped pages count towards the resident set until released
+				done = stop - stop % mmap.PAGESIZE
+				if hasattr(m, 'madvise') and done > released:
+					m.madvise(mmap.MADV_DONTNEED, released, done - released)
+					released = done
+				start = stop
+		finally:
+			m.close()
 
-#Data Structures for various counts.
-#Stores {token_type : token_count} pairs for each token
-tokentype = {}
+def tokens_of(filename):
+	for data in chunks(filename):
+		#Giving each chunk as input to our lexer
+		lexer.input(data)
+		while True:
+			tok = lexer.token() #Get token
+			if not tok:			#No token?
+				break      # End of this chunk
+			yield tok
 
-#The key here is the token_type(like IDENTIFIER, INT, etc.). Value is a LIST of lexemes that match the token.
-lexeme = {}			
+#Data Structures for various counts.
+#tokentype : Counter of {token_type : number of tokens seen}
+#lexeme : {token_type : {lexeme : None}}, the distinct lexemes of each type in the
+#order they were first seen (a dict is used as an ordered set, so checking for a
+#repeated lexeme is O(1) and the whole count is linear in the number of tokens)
 
 #This stores those token types which are not be recounted of they occur more than once. For example, a variable name.
 non_recountable = ['IDENTIFIER']
-#Tokenize input!
-while True:
-	tok = lexer.token() #Get token
-	if not tok:			#No token?
-		break      # No more input
-	tokname = tok.value 		#store the lexeme
-	toktype = tok.type 			#stores the token_type
-	if toktype not in tokentype:		
-		tokentype[toktype] = 1			#initianlize count of token to 1
-		lexeme[toktype]=[]				#initialize the list in the lexeme dictionary
-		lexeme[toktype].append(tokname)	#append lexeme to the lexeme dictionary
-		# print(tokname+"\t"+toktype+"NOT here previously")
-	else:
-		if tokname not in lexeme[toktype]:	
-			lexeme[toktype].append(tokname)		#if not present add. above check avoids repetitions
-			tokentype[toktype] += 1			#add another token seen of that type
+
+#Tokenize one file and count its tokens
+def count_tokens(filename):
+	tokentype = Counter()
+	lexeme = {}
+	for tok in tokens_of(filename):
+		tokentype[tok.type] += 1
+		lexeme.setdefault(tok.type, {})[tok.value] = None
+	return tokentype, lexeme
+
+#Merge the counts of many files: token counts add up, lexemes are a union
+def merge_counts(results):
+	tokentype = Counter()
+	lexeme = {}
+	for (counts, lexemes) in results:
+		tokentype.update(counts)
+		for toktype in lexemes:
+			lexeme.setdefault(toktype, {}).update(lexemes[toktype])
+	total = sum(tokentype.values())
+	#Token types that are not recounted are counted once per distinct lexeme
+	for toktype in non_recountable:
+		if toktype in lexeme:
+			tokentype[toktype] = len(lexeme[toktype])
+	return tokentype, lexeme, total
+
+#Pool initializer for JSON output: keep stdout for the JSON document only
+def errors_to_stderr():
+	global errstream
+	errstream = sys.stderr
+
+#Expand the directories among the arguments into the .cs files they contain
+def input_files(paths):
+	files = []
+	for path in paths:
+		if os.path.isdir(path):
+			for root, dirs, names in sorted(os.walk(path)):
+				dirs.sort()
+				files += [os.path.join(root, name) for name in sorted(names) if name.endswith('.cs')]
 		else:
-			if toktype not in non_recountable:			#if this token type is not to be recounted
-				tokentype[toktype] +=1			#add token seen.
+			files.append(path)
+	return files
+
+if __name__ == '__main__':
+	#Options: --json for machine readable output, --jobs=N worker processes
+	paths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+	jobs = None
+	for arg in sys.argv[1:]:
+		if arg.startswith('--jobs='):
+			jobs = int(arg[len('--jobs='):])
+	if len(paths) == 0:
+		print("Usage: bin/lexer [--json] [--jobs=N] file.cs|directory ...")
+		exit(0)
+	files = input_files(paths)
+	if '--json' in sys.argv:
+		errors_to_stderr()
+
+	if len(files) == 1:
+		tokentype, lexeme, total = merge_counts([count_tokens(files[0])])
+	else:
+		#Lex the files in a process pool, merging per-file counts as they arrive
+		with multiprocessing.Pool(jobs, errors_to_stderr if '--json' in sys.argv else None) as pool:
+			tokentype, lexeme, total = merge_counts(pool.imap(count_tokens, files, chunksize=4))
 
-# print(tokentype)
-# print(lexeme)
+	if '--json' in sys.argv:
+		stats = {'files': len(files), 'tokens': total, 'types': {}}
+		for types in lexeme:
+			stats['types'][types] = {'count': tokentype[types], 'lexemes': list(lexeme[types])}
+		print(json.dumps(stats, indent=1))
+		exit(0)
 
-#printing the tokens
-for types in tokentype:
+	#printing the tokens
+	for types in lexeme:
+		print("----------------------------------------")
+		print("{0:<20s} {1:>5s}".format(types, (str)(tokentype[types])))
+		for lexlist in lexeme[types]:
+			print("{0:>40s}".format(lexlist))
 	print("----------------------------------------")
-	print("{0:<20s} {1:>5s}".format(types, (str)(tokentype[types])))
-	for lexlist in lexeme[types]:
-		print("{0:>40s}".format(lexlist))
-print("----------------------------------------")
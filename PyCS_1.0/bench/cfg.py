@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+# Control flow graph benchmark: writes a TAC listing of about N instructions
+# (whole functions of loops, branches and calls, as the parser emits them),
+# reads it back and times cfg.build on it.
+# Usage: bench/cfg.py [instructions ...]
+###################################################################################################
+
+import os
+import sys
+import time
+import tempfile
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import ir
+import cfg
+
+# One loop of a function: about 20 instructions and 5 blocks
+loop = """label, L{0}
+ifgoto, >=, i, 100, L{1}
+*, t{2}, i, 4
+member, t{3}, a, t{2}
++, t{3}, t{3}, s
+ifgoto, <=, t{3}, 10, L{2}
+param, t{3}
+call, f{4}
+retval, t{5}
+=, s, t{5}
+goto, L{3}
+label, L{2}
+-, t{3}, s, 1
+=, s, t{3}
+label, L{3}
++, t{2}, i, 1
+=, i, t{2}
+print, s
+goto, L{0}
+label, L{1}
+"""
+
+def listing(n):
+	lines = ["call, Main", "exit"]
+	label = temp = function = 0
+	while len(lines) < n:
+		lines += ["function, f" + str(function), "arg, 1, n", "=, i, 0", "=, s, 0"]
+		for j in range(8):
+			lines += loop.format(label, label + 1, label + 2, label + 3, function + 1, temp + 1).split("\n")[:-1]
+			label += 4
+			temp += 2
+		lines += ["return, s"]
+		function += 1
+	return "".join(str(i+1) + ", " + lines[i] + "\n" for i in range(len(lines)))
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [250000, 500000, 1000000]
+
+print("%10s %10s %10s %10s %12s" % ("instrs", "functions", "blocks", "read", "cfg.build"))
+for n in sizes:
+	f = tempfile.NamedTemporaryFile('w', suffix='.ir', delete=False)
+	f.write(listing(n))
+	f.close()
+	begin = time.perf_counter()
+	code = ir.parse_listing(open(f.name).read())
+	middle = time.perf_counter()
+	graphs = cfg.build(code)
+	end = time.perf_counter()
+	os.unlink(f.name)
+	blocks = sum(len(graph.blocks) for graph in graphs)
+	print("%10d %10d %10d %9.2fs %11.2fs" % (len(code), len(graphs), blocks, middle - begin, end - middle))
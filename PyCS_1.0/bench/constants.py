@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+# Constant folding benchmark: a Main of N statements computing with literal
+# subexpressions (unit conversions, masks, bounds), compiled with and without
+# folding. Reports the instructions, the .data variables and the time of IR
+# generation and code generation.
+# Usage: bench/constants.py [statements...]
+###################################################################################################
+
+import os
+import sys
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+import codegen
+
+statements = [
+	"x = 60 * 60 * 24;",
+	"y = x * (1000 / 8) + (1 << 10) - 365 % 7;",
+	"z = (y - 2147483647 - 1) / (4 * 4 + 2 * -8 + 3);",
+	"m = (x >> 3) + ((1 << 16) - 1) * 2;",
+	"if (y > 7 * 24 * 60 && z != -(3 - 5) * 10) { x = x - 1; }",
+	"w = (10 < 20) + (3 == 4) * 2 + x;",
+]
+
+def program(n):
+	body = "\n".join("\t\t\t" + statements[i % len(statements)] for i in range(n))
+	return ("namespace Bench\n{\n\tclass Bench\n\t{\n\t\tint Main()\n\t\t{\n"
+		"\t\t\tint x = 0;\n\t\t\tint y = 0;\n\t\t\tint z = 0;\n\t\t\tint m = 0;\n\t\t\tint w = 0;\n"
+		+ body + "\n\t\t\treturn 0;\n\t\t}\n\t}\n}\n")
+
+def measure(text, fold):
+	begin = time.perf_counter()
+	program = parser.compile_to_ir(text, fold_constants=fold, eliminate_dead_code=False)
+	middle = time.perf_counter()
+	generator = codegen.Generator(program.code)
+	generator.generate()
+	end = time.perf_counter()
+	return len(program.code), len(generator.varlist), middle - begin, end - middle
+
+# Builds the tables before timing
+parser.compile_to_ir(program(1))
+sizes = [int(arg) for arg in sys.argv[1:]] or [600, 3000]
+print("%-10s %16s %14s %20s %20s" % ("statements", "instrs", ".data vars", "IR time", "codegen time"))
+for n in sizes:
+	text = program(n)
+	size0, vars0, ir0, gen0 = measure(text, False)
+	size1, vars1, ir1, gen1 = measure(text, True)
+	print("%-10d %7d -> %6d %6d -> %5d %7.0fms -> %7.0fms %7.0fms -> %7.0fms"
+		% (n, size0, size1, vars0, vars1, ir0*1000, ir1*1000, gen0*1000, gen1*1000))
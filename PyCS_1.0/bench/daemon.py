@@ -0,0 +1,38 @@
+#!/usr/bin/python3
+# Daemon benchmark: wall time to compile every program in test/ to assembly
+# with src/compiler.py (one process per program) and with src/client.py
+# talking to a warm compile daemon.
+# Usage: bench/daemon.py [rounds]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+import tempfile
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+programs = sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs')))
+
+def timed(command):
+	begin = time.perf_counter()
+	for i in range(rounds):
+		for program in programs:
+			subprocess.run(command + [program], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+	return (time.perf_counter() - begin) / (rounds * len(programs))
+
+env = dict(os.environ, PYCS_SOCKET=os.path.join(tempfile.mkdtemp(), 'pycs.sock'))
+client = [sys.executable, os.path.join(src, 'client.py'), '--asm']
+# Start the daemon and let it load the tables
+subprocess.run(client + [programs[0]], stdout=subprocess.DEVNULL, env=env)
+try:
+	single = timed([sys.executable, os.path.join(src, 'compiler.py')])
+	daemon = timed(client)
+finally:
+	subprocess.run(client[:2] + ['--stop'], env=env)
+
+print("%d programs, %d rounds" % (len(programs), rounds))
+print("compiler.py:  %8.1f ms per program" % (single * 1000))
+print("daemon:       %8.1f ms per program" % (daemon * 1000))
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# Dataflow benchmark: one function of N temporaries (loops over long chains
+# of arithmetic whose values are read again in later loops), timing liveness,
+# reaching definitions and available expressions, with the peak memory of
+# the analyses. For comparison, the last column is the number of entries the
+# per-instruction next use dictionaries of codegen.py would hold.
+# Usage: bench/dataflow.py [temporaries ...]
+###################################################################################################
+
+import os
+import sys
+import time
+import tracemalloc
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import ir
+import cfg
+import dataflow
+
+# A loop of chain temporaries: each reads the one before and one of the
+# previous loop, so values stay live across the loops
+def function(temps, chain=50):
+	lines = ["function, Main", "=, i, 0", "=, s, 0"]
+	t = 0
+	label = 0
+	while t < temps:
+		lines += ["label, L" + str(label), "ifgoto, >=, i, 10, L" + str(label + 1)]
+		for j in range(chain):
+			before = "t" + str(t - 1) if j > 0 else "s"
+			older = "t" + str(t - chain) if t >= chain else "i"
+			lines += ["+, t" + str(t) + ", " + before + ", " + older]
+			if j % 10 == 9:
+				lines += ["ifgoto, >, t" + str(t) + ", 1000, L" + str(label + 2), "*, s, s, i", "label, L" + str(label + 2)]
+			t += 1
+		lines += ["+, i, i, 1", "goto, L" + str(label), "label, L" + str(label + 1), "=, i, 0", "=, s, t" + str(t - 1)]
+		label += 3
+	lines += ["print, s", "return, 0"]
+	return [ir.parse(line) for line in lines]
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [10000, 40000]
+
+print("%8s %8s %8s %10s %10s %10s %10s %14s" % ("temps", "instrs", "blocks", "liveness", "reaching", "available", "peak", "nextuse dicts"))
+for n in sizes:
+	code = function(n)
+	graph = cfg.build(code)[-1]
+	times = []
+	for analysis in [dataflow.liveness, dataflow.reaching_definitions, dataflow.available_expressions]:
+		begin = time.perf_counter()
+		analysis(graph)
+		times.append(time.perf_counter() - begin)
+	# Traced separately, tracing slows the analyses down
+	tracemalloc.start()
+	for analysis in [dataflow.liveness, dataflow.reaching_definitions, dataflow.available_expressions]:
+		analysis(graph)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	names = len(dataflow.Numbering(graph))
+	print("%8d %8d %8d %9.2fs %9.2fs %9.2fs %8.1fMB %14d" % (n, len(code), len(graph.blocks), times[0], times[1], times[2], peak/1000000, len(code)*names))
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+# Copy propagation and dead code elimination benchmark: the instructions and
+# the lines and bytes of assembly of each program of test/ without and with
+# the passes (copyprop.py, dce.py), then the time they take next to the rest
+# of the compilation on a Main of N statements over arrays and variables.
+# Each program is also assembled, linked and run both ways (as ./compile
+# does, or against runtime.s where gcc -m32 cannot link), and the outputs
+# compared: "same", "DIFFERS", or "-" if it could not be linked.
+# Usage: bench/dce.py [statements ...]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+import shutil
+import tempfile
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+import copyprop
+import dce
+from codegen import compile_to_asm
+
+statements = [
+	"{0} = {1} + {2} * 3;",
+	"a[{0} % 4] = {1};",
+	"{0} = a[{1} % 4] + a[2];",
+	"if ({0} > {1} && {2} != 4) {{ {2} = {0} - 1; }} else {{ {1} = {2}; }}",
+	"while ({0} < 10) {{ {0} = {0} + 1; {1} = {0}; }}",
+	"Writeline({0});",
+]
+names = ['b', 'c', 'd', 'e', 'f', 'g', 'h', 'k']
+
+runtime = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runtime.s')
+
+def succeeds(command):
+	try:
+		return subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+	except OSError:
+		return False
+
+# Assembles and links the assembly of a program in directory; the path of
+# the executable, or None
+def link(asm, directory, name):
+	source = os.path.join(directory, name + '.s')
+	binary = os.path.join(directory, name)
+	open(source, 'w').write(asm)
+	if succeeds(['gcc', '-m32', source, '-o', binary]):
+		return binary
+	objects = [os.path.join(directory, name + '.o'), os.path.join(directory, 'runtime.o')]
+	if (succeeds(['as', '--32', source, '-o', objects[0]]) and succeeds(['as', '--32', runtime, '-o', objects[1]])
+		and succeeds(['ld', '-m', 'elf_i386'] + objects + ['-o', binary])):
+		return binary
+	return None
+
+# What a program prints reading 5 (read.cs), and how it ended if not by exit
+def run(binary):
+	try:
+		result = subprocess.run([binary], input=b"5\n", stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10)
+	except subprocess.TimeoutExpired:
+		return "timed out"
+	if result.returncode < 0:
+		return result.stdout.decode() + "signal %d" % -result.returncode
+	return result.stdout.decode()
+
+def source(n):
+	body = []
+	for i in range(n):
+		chosen = [names[(i*j + j) % len(names)] for j in (1, 3, 5)]
+		body.append("\t\t\t" + statements[i % len(statements)].format(*chosen))
+	decls = "\t\t\tint[] a = {1, 2, 3, 4};\n" + "".join("\t\t\tint " + name + " = " + str(i) + ";\n" for i, name in enumerate(names))
+	return ("namespace Bench\n{\n\tclass Bench\n\t{\n\t\tint Main()\n\t\t{\n" + decls
+		+ "\n".join(body) + "\n\t\t\treturn 0;\n\t\t}\n\t}\n}\n")
+
+print("%-22s %16s %16s %18s %8s" % ("program", "instrs", "asm lines", "asm bytes", "output"))
+directory = tempfile.mkdtemp()
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	text = open(filename, 'r').read()
+	try:
+		before = parser.compile_to_ir(text, eliminate_dead_code=False)
+	except parser.CompileError:
+		continue
+	after = parser.compile_to_ir(text)
+	asm = [str(compile_to_asm(program)) for program in (before, after)]
+	binaries = [link(asm[i], directory, "%s.%d" % (os.path.basename(filename), i)) for i in (0, 1)]
+	if None in binaries:
+		output = "-"
+	elif run(binaries[0]) == run(binaries[1]):
+		output = "same"
+	else:
+		output = "DIFFERS"
+	print("%-22s %7d -> %6d %7d -> %6d %8d -> %7d %8s" % (os.path.basename(filename), len(before.code), len(after.code),
+		asm[0].count("\n"), asm[1].count("\n"), len(asm[0]), len(asm[1]), output))
+shutil.rmtree(directory)
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [500, 2000, 8000]
+
+print()
+print("%10s %16s %10s %10s %10s" % ("statements", "instrs", "parse", "passes", "codegen"))
+for n in sizes:
+	begin = time.perf_counter()
+	program = parser.compile_to_ir(source(n), eliminate_dead_code=False)
+	parsed = time.perf_counter()
+	before = len(program.code)
+	program.code = dce.eliminate(copyprop.propagate(program.code))
+	passed = time.perf_counter()
+	compile_to_asm(program)
+	end = time.perf_counter()
+	print("%10d %7d -> %6d %9.2fs %9.2fs %9.2fs" % (n, before, len(program.code), parsed - begin, passed - parsed, end - passed))
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+# Early emission benchmark: peak RSS of compiling a class of N methods to a
+# TAC listing kept whole until the end vs written method by method as the
+# parser reduces them (compile_to_ir(emit=...)).
+# Usage: bench/emit.py [methods ...]
+###################################################################################################
+
+import os
+import sys
+import tempfile
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+snippet = """
+import sys
+import parser, tac
+data = open(sys.argv[2]).read()
+out = open('/dev/null', 'w')
+if sys.argv[1] == 'whole':
+	out.write(str(parser.compile_to_ir(data)))
+else:
+	parser.compile_to_ir(data, emit=tac.listing_writer(out))
+# Peak resident set of this process (ru_maxrss would include the parent's)
+status = open('/proc/self/status').read()
+print(status.split('VmHWM:')[1].split()[0])
+"""
+
+method = """
+		int f%d(int n)
+		{
+			int i;
+			int s = 0;
+			int m = n;
+			int[] a = {0, 0, 0, 0, 0, 0, 0, 0};
+			for (i = 0; i < 8; ++i)
+			{
+				a[i] = i * n + s;
+				if (a[i] > 10 && n != 3) { s = s + a[i]; } else { s = s - 1; }
+			}
+			while (m > 0) { s = s + m %% 7; m = m - 1; }
+			return s;
+		}
+"""
+
+def program(n):
+	return ("namespace Bench\n{\n\tclass Bench\n\t{"
+		+ "".join(method % i for i in range(n))
+		+ "\n\t\tint Main()\n\t\t{\n\t\t\treturn f0(3);\n\t\t}\n\t}\n}\n")
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [1000, 4000, 16000]
+
+print("%8s %12s %12s" % ("methods", "whole", "emit"))
+for n in sizes:
+	f = tempfile.NamedTemporaryFile('w', suffix='.cs', delete=False)
+	f.write(program(n))
+	f.close()
+	peak = {}
+	for mode in ['whole', 'emit']:
+		out = subprocess.run([sys.executable, '-c', snippet, mode, f.name], cwd=src, stdout=subprocess.PIPE, check=True)
+		peak[mode] = int(out.stdout.split()[-1])
+	os.unlink(f.name)
+	print("%8d %10.1fMB %10.1fMB" % (n, peak['whole']/1024, peak['emit']/1024))
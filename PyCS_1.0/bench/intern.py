@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+# Identifier interning benchmark: memory held by the identifier values of a
+# program with 100k references to a few hundred names, and the time to look
+# every reference up in a nested symbol table, with and without interning.
+# Usage: bench/intern.py [references] [names]
+###################################################################################################
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import lexer
+import scanner
+import symtab
+
+if len(sys.argv) == 3:
+	references, names = int(sys.argv[1]), int(sys.argv[2])
+else:
+	references, names = 100000, 300
+
+random.seed(0)
+identifiers = ["variable_" + str(i) for i in range(names)]
+program = " ".join("int " + name + ";" for name in identifiers) + "\n"
+program = program + "\n".join(random.choice(identifiers) + " = " + random.choice(identifiers) + ";" for i in range(references//2))
+
+def run(intern):
+	lexer.intern = intern
+	tracemalloc.start()
+	lx = scanner.Scanner()
+	lx.input(program)
+	values = [tok.value for tok in lx if tok.type == 'IDENTIFIER']
+	memory = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	# Declarations go into the outermost scope, references are looked up three scopes deeper
+	env = symtab.environ()
+	for name in values[:names]:
+		env.insert_variable('int', name)
+	for i in range(3):
+		env.begin_scope()
+	uses = values[names:]
+	begin = time.perf_counter()
+	for name in uses:
+		env.lookup(name, env.curr_table)
+	elapsed = time.perf_counter() - begin
+	return len(uses), memory, elapsed
+
+print("%-10s %10s %14s %14s" % ("", "references", "values memory", "lookup time"))
+for mode, intern in [("fresh", lambda s: s), ("interned", sys.intern)]:
+	count, memory, elapsed = run(intern)
+	print("%-10s %10d %12.2fMB %12.1fms" % (mode, count, memory/1000000, elapsed*1000))
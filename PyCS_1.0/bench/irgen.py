@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+# IR generation scaling benchmark: compile time of a single method with a
+# growing number of statements. Linear code generation keeps the time per
+# statement flat as the method grows.
+# Usage: bench/irgen.py [statements ...]
+###################################################################################################
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+def program(statements):
+	body = ["\t\t\tint x = 0;", "\t\t\tint y = 1;"]
+	for i in range(statements):
+		if i % 2 == 0:
+			body.append("\t\t\tx = x + y * " + str(i % 7) + ";")
+		else:
+			body.append("\t\t\ty = (x - y) / 3;")
+	return "namespace Bench\n{\n\tclass Bench\n\t{\n\t\tint Main()\n\t\t{\n" + "\n".join(body) + "\n\t\t\treturn 0;\n\t\t}\n\t}\n}\n"
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [5000, 10000, 20000, 50000]
+
+print("%10s %10s %14s" % ("statements", "time", "per statement"))
+for size in sizes:
+	f = tempfile.NamedTemporaryFile('w', suffix='.cs', delete=False)
+	f.write(program(size))
+	f.close()
+	begin = time.perf_counter()
+	subprocess.run([sys.executable, os.path.join(src, 'parser.py'), '--scanner', f.name], stdout=subprocess.DEVNULL, check=True)
+	elapsed = time.perf_counter() - begin
+	os.unlink(f.name)
+	print("%10d %9.2fs %12.1fus" % (size, elapsed, elapsed/size*1000000))
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+# Lexer throughput benchmark: PLY lexer vs the hand-written scanner, in MB/s
+# over the test programs repeated to the requested size.
+# Usage: bench/lexer.py [megabytes]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import lexer
+import scanner
+
+if len(sys.argv) == 2:
+	size = float(sys.argv[1])*1000000
+else:
+	size = 4000000
+
+sample = ""
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	sample = sample + open(filename).read() + "\n"
+data = sample*int(size/len(sample) + 1)
+
+def throughput(lx):
+	lx.input(data)
+	lx.lineno = 1
+	token = lx.token
+	count = 0
+	begin = time.perf_counter()
+	while token():
+		count += 1
+	elapsed = time.perf_counter() - begin
+	return count, len(data)/elapsed/1000000
+
+print("%.1f MB input" % (len(data)/1000000))
+for name, lx in [("ply", lexer.get_lexer()), ("scanner", scanner.Scanner())]:
+	count, mbs = throughput(lx)
+	print("%-8s %9d tokens %8.2f MB/s" % (name, count, mbs))
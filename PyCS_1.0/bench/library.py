@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+# Library benchmark: compiling every program in test/ to assembly through the
+# two command line stages (parser.py, then codegen.py on its listing) against
+# compiler.compile_source in one process, which reuses the lexer and parser.
+# Usage: bench/library.py [rounds]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import compiler
+
+rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+programs = []
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	text = open(filename).read()
+	try:
+		compiler.compile_to_ir(text)
+	except compiler.CompileError:
+		continue
+	programs.append((filename, text))
+
+begin = time.perf_counter()
+for i in range(rounds):
+	for filename, text in programs:
+		listing = subprocess.run([sys.executable, os.path.join(src, 'parser.py'), filename], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True).stdout
+		subprocess.run([sys.executable, os.path.join(src, 'codegen.py'), '/dev/stdin'], input=listing, stdout=subprocess.DEVNULL, check=True)
+processes = (time.perf_counter() - begin) / (rounds * len(programs))
+
+begin = time.perf_counter()
+for i in range(rounds):
+	for filename, text in programs:
+		compiler.compile_source(text)
+library = (time.perf_counter() - begin) / (rounds * len(programs))
+
+print("%d programs, %d rounds" % (len(programs), rounds))
+print("two processes: %8.2f ms per program" % (processes * 1000))
+print("in process:    %8.2f ms per program" % (library * 1000))
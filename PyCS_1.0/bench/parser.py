@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+# Parser throughput benchmark: the PLY grammar of syntax.py vs the
+# hand-written parser of descent.py, in tokens/s. Both build the syntax tree
+# of the test programs they accept; the tokens are lexed beforehand and
+# replayed, so only parsing is timed.
+# Usage: bench/parser.py [rounds]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import lexer
+import syntax
+import descent
+
+# Hands out the tokens of a program again, as a lexer would
+class replay:
+	def __init__(self, tokens):
+		self.tokens = tokens
+
+	def input(self, text):
+		pass
+
+	def reset(self):
+		self.token = iter(self.tokens + [None]).__next__
+		return self
+
+def tokens_of(data):
+	lx = lexer.get_lexer().clone()
+	lx.input(data)
+	return list(iter(lx.token, None))
+
+if len(sys.argv) == 2:
+	rounds = int(sys.argv[1])
+else:
+	rounds = 200
+
+programs = []
+ply = syntax.get_parser()
+ply.errorfunc = lambda tok: None
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	tokens = tokens_of(open(filename).read())
+	if ply.parse(lexer=replay(tokens).reset()) != None:
+		programs.append(replay(tokens))
+count = sum(len(program.tokens) for program in programs)*rounds
+
+def throughput(parse):
+	begin = time.perf_counter()
+	for i in range(rounds):
+		for program in programs:
+			parse(program.reset())
+	return count/(time.perf_counter() - begin)
+
+print("%d programs, %d tokens" % (len(programs), count))
+for name, parse in [("ply", lambda lx: ply.parse(lexer=lx)), ("descent", lambda lx: descent.Parser(lx).parse())]:
+	print("%-8s %12.0f tokens/s" % (name, throughput(parse)))
@@ -0,0 +1,56 @@
+# The printf("%d\n", n) and exit the compiled programs call, without libc,
+# for bench/dce.py where gcc -m32 cannot link: as --32 and ld -m elf_i386.
+# printf returns the count in %eax and clobbers %ecx and %edx, as cdecl
+# allows.
+.section .text
+.globl _start
+_start:
+	call main
+.globl exit
+exit:
+	movl $1, %eax
+	movl $0, %ebx
+	int $0x80
+.globl printf
+printf:
+	pushl %ebx
+	pushl %esi
+	pushl %edi
+	movl 20(%esp), %eax
+	movl $digits+15, %edi
+	movb $10, (%edi)
+	movl %eax, %esi
+	testl %eax, %eax
+	jns 1f
+	negl %eax
+1:
+	movl $10, %ecx
+2:
+	xorl %edx, %edx
+	divl %ecx
+	addb $48, %dl
+	decl %edi
+	movb %dl, (%edi)
+	testl %eax, %eax
+	jnz 2b
+	testl %esi, %esi
+	jns 3f
+	decl %edi
+	movb $45, (%edi)
+3:
+	movl $digits+16, %edx
+	subl %edi, %edx
+	pushl %edx
+	movl $4, %eax
+	movl $1, %ebx
+	movl %edi, %ecx
+	int $0x80
+	popl %eax
+	movl $0x5a5a5a5a, %ecx
+	movl $0x5a5a5a5a, %edx
+	popl %edi
+	popl %esi
+	popl %ebx
+	ret
+.section .bss
+digits: .space 16
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# Constant propagation benchmark: what sccp.py removes from each program of
+# test/ (instructions, folded branches, unreachable blocks), then the time it
+# takes on a Main of N statements mixing constants and loops.
+# Usage: bench/sccp.py [statements ...]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+import sccp
+
+statements = [
+	"{0} = {1} * 4 + 1;",
+	"if ({0} > 2 && {1} != 4) {{ {2} = {0} - 1; }} else {{ {2} = {1} % 7; }}",
+	"while ({0} < 10) {{ {0} = {0} + 1; if (k == 3 || {1} > 3) {{ {1} = {2}; }} }}",
+	"for ({0} = 0; {0} < 5; ++{0}) {{ {1} = {1} + {0}; }}",
+	"if (k < 2) {{ {0} = 9; }}",
+]
+names = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+
+def program(n):
+	body = []
+	for i in range(n):
+		chosen = [names[(i*j + j) % len(names)] for j in (1, 3, 5)]
+		body.append("\t\t\t" + statements[i % len(statements)].format(*chosen))
+	decls = "".join("\t\t\tint " + name + " = " + str(i) + ";\n" for i, name in enumerate(names + ['k']))
+	return ("namespace Bench\n{\n\tclass Bench\n\t{\n\t\tint Main()\n\t\t{\n" + decls
+		+ "\n".join(body) + "\n\t\t\tWriteline(a);\n\t\t\treturn 0;\n\t\t}\n\t}\n}\n")
+
+print("%-22s %8s %8s %8s %8s" % ("program", "instrs", "removed", "branches", "blocks"))
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	try:
+		code = parser.compile_to_ir(open(filename, 'r').read(), eliminate_dead_code=False).code
+	except parser.CompileError:
+		continue
+	result, report = sccp.propagate(code)
+	print("%-22s %8d %8d %8d %8d" % (os.path.basename(filename), len(code), report.instructions, report.branches, report.blocks))
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [500, 2000, 8000]
+
+print()
+print("%10s %8s %8s %8s %10s" % ("statements", "instrs", "removed", "branches", "time"))
+for n in sizes:
+	code = parser.compile_to_ir(program(n), eliminate_dead_code=False).code
+	begin = time.perf_counter()
+	result, report = sccp.propagate(code)
+	end = time.perf_counter()
+	print("%10d %8d %8d %8d %9.2fs" % (n, len(code), report.instructions, report.branches, end - begin))
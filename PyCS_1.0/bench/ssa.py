@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# SSA benchmark: a Main of N statements (loops, branches and && / || over a
+# dozen variables), compiled to TAC, then timed through dominators and
+# frontiers, construction and destruction. Checks that going into SSA form
+# and back gives the code it started from (but for copies of a name to
+# itself).
+# Usage: bench/ssa.py [statements ...]
+###################################################################################################
+
+import os
+import sys
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+import cfg
+import ssa
+import tac
+from ir import Op
+
+names = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'k', 'm', 'n', 'p']
+
+statements = [
+	"{0} = {1} + {2} * 3;",
+	"if ({0} > {1} && {2} != 4) {{ {0} = {1} - 1; }} else {{ {2} = {0} % 7; }}",
+	"while ({0} < 10) {{ {0} = {0} + 1; if ({1} == {0} || {2} > 3) {{ {1} = {2}; }} }}",
+	"for ({0} = 0; {0} < 5; ++{0}) {{ {1} = {1} + {0}; }}",
+	"{0} = ({1} < {2}) + ({2} >= {0});",
+]
+
+def program(n):
+	body = []
+	for i in range(n):
+		chosen = [names[(i*k + k) % len(names)] for k in (1, 5, 7)]
+		body.append("\t\t\t" + statements[i % len(statements)].format(*chosen))
+	decls = "".join("\t\t\tint " + name + " = " + str(i) + ";\n" for i, name in enumerate(names))
+	return ("namespace Bench\n{\n\tclass Bench\n\t{\n\t\tint Main()\n\t\t{\n" + decls
+		+ "\n".join(body) + "\n\t\t\treturn 0;\n\t\t}\n\t}\n}\n")
+
+if len(sys.argv) > 1:
+	sizes = [int(x) for x in sys.argv[1:]]
+else:
+	sizes = [500, 2000, 8000]
+
+print("%10s %8s %8s %8s %12s %10s %10s %6s" % ("statements", "instrs", "blocks", "phis", "dominators", "construct", "destruct", "same"))
+for n in sizes:
+	code = parser.compile_to_ir(program(n), eliminate_dead_code=False).code
+	graph = cfg.build(code)[-1]
+	fresh = ssa.Fresh(code)
+	begin = time.perf_counter()
+	idom, order = ssa.dominators(graph)
+	ssa.frontiers(graph, idom)
+	middle = time.perf_counter()
+	origin = ssa.construct(graph, fresh)
+	constructed = time.perf_counter()
+	phis = sum(1 for block in graph.blocks for instr in block.code if instr.op == Op.PHI)
+	result = ssa.destruct(graph, origin, fresh)
+	end = time.perf_counter()
+	# Copies of a name to itself are dropped on the way
+	before = [instr for instr in cfg.flatten(cfg.build(code)[-1:]) if not (instr.op == Op.ASSIGN and instr.args[0] == instr.args[1])]
+	same = tac.listing(result) == tac.listing(before)
+	print("%10d %8d %8d %8d %11.2fs %9.2fs %9.2fs %6s" % (n, len(code), len(graph.blocks), phis,
+		middle - begin, constructed - middle, end - constructed, same))
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+# Startup benchmark: time from interpreter start to the first token, with the
+# lexer and parser tables built from scratch (cold) and read from the table
+# cache (warm).
+# Usage: bench/startup.py [runs]
+###################################################################################################
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+program = os.path.join(src, '..', 'test', 'basic.cs')
+
+snippet = """
+import time
+start = time.perf_counter()
+import parser
+lexer = parser.get_lexer()
+parser.get_parser()
+lexer.input(open(%r).read())
+lexer.token()
+print(time.perf_counter() - start)
+""" % program
+
+def run(cache):
+	env = dict(os.environ, PYCS_CACHE_DIR=cache)
+	begin = time.perf_counter()
+	out = subprocess.run([sys.executable, '-c', snippet], cwd=src, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+	wall = time.perf_counter() - begin
+	return float(out.stdout.decode().split()[-1]), wall
+
+def median(values):
+	values = sorted(values)
+	return values[len(values)//2]
+
+if len(sys.argv) == 2:
+	runs = int(sys.argv[1])
+else:
+	runs = 5
+
+cold = []
+warm = []
+for i in range(runs):
+	cache = tempfile.mkdtemp()
+	cold.append(run(cache))
+	warm.append(run(cache))
+	shutil.rmtree(cache)
+
+print("%-6s %12s %12s" % ("", "first token", "process"))
+for name, times in [("cold", cold), ("warm", warm)]:
+	print("%-6s %10.1fms %10.1fms" % (name, 1000*median([t[0] for t in times]), 1000*median([t[1] for t in times])))
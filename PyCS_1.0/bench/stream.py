@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+# Streaming input benchmark: peak RSS of lexing growing inputs read whole
+# into a string vs streamed from a memory-mapped file.
+# Usage: bench/stream.py [megabytes ...]
+###################################################################################################
+
+import os
+import sys
+import glob
+import tempfile
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+snippet = """
+import sys
+import scanner, source
+filename = sys.argv[2]
+if sys.argv[1] == 'read':
+	lexer = scanner.Scanner()
+	lexer.input(open(filename).read())
+else:
+	lexer = source.StreamLexer(scanner.Scanner(), filename)
+count = 0
+for tok in iter(lexer.token, None):
+	count += 1
+# Peak resident set of this process (ru_maxrss would include the parent's)
+status = open('/proc/self/status').read()
+print(count, status.split('VmHWM:')[1].split()[0])
+"""
+
+if len(sys.argv) > 1:
+	sizes = [float(x) for x in sys.argv[1:]]
+else:
+	sizes = [4, 16, 32]
+
+sample = ""
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	sample = sample + open(filename).read() + "\n"
+
+print("%8s %10s %12s %12s" % ("input", "tokens", "read", "stream"))
+for size in sizes:
+	f = tempfile.NamedTemporaryFile('w', suffix='.cs', delete=False)
+	for i in range(int(size*1000000/len(sample) + 1)):
+		f.write(sample)
+	f.close()
+	peak = {}
+	for mode in ['read', 'stream']:
+		out = subprocess.run([sys.executable, '-c', snippet, mode, f.name], cwd=src, stdout=subprocess.PIPE, check=True)
+		count, peak[mode] = [int(x) for x in out.stdout.split()]
+	os.unlink(f.name)
+	print("%6.0fMB %10d %10.1fMB %10.1fMB" % (size, count, peak['read']/1024, peak['stream']/1024))
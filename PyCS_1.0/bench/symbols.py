@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+# Symbol memory benchmark: memory kept by the symbol table of a class with N
+# fields (int, char and int[] of length 2 in turn), per declared symbol, measured with
+# tracemalloc once the code of the program has been dropped.
+# Usage: bench/symbols.py [fields]
+###################################################################################################
+
+import os
+import gc
+import sys
+import time
+import tracemalloc
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+
+def program(fields):
+	body = []
+	for i in range(fields):
+		if i % 3 == 0:
+			body.append("\t\tint f" + str(i) + ";")
+		elif i % 3 == 1:
+			body.append("\t\tchar f" + str(i) + ";")
+		else:
+			body.append("\t\tint[] f" + str(i) + " = {1, 2};")
+	return "namespace Bench\n{\n\tclass Bench\n\t{\n" + "\n".join(body) + "\n\t\tint Main()\n\t\t{\n\t\t\treturn 0;\n\t\t}\n\t}\n}\n"
+
+fields = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+text = program(fields)
+parser.get_parser()
+
+gc.collect()
+tracemalloc.start()
+base = tracemalloc.get_traced_memory()[0]
+begin = time.perf_counter()
+symbols = parser.compile_to_ir(text).symbols
+elapsed = time.perf_counter() - begin
+# The parser keeps its stacks until the next parse
+parser.compile_to_ir(program(0))
+gc.collect()
+kept = tracemalloc.get_traced_memory()[0] - base
+tracemalloc.stop()
+
+count = sum(len(t.hash) for t in [symbols.base_table] + symbols.base_table.children)
+print("%d fields, %d symbols with temporaries: %.1f MB kept, %.0f bytes per field, compiled in %.2fs" % (fields, count, kept/1e6, kept/fields, elapsed))
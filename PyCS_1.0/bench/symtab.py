@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+# Symbol table benchmark: compile time of a method whose statements sit D
+# blocks deep and use variables declared at the top of the method, with the
+# tree of scope tables (symtab.environ, lookup walks the parents) against the
+# scoped symbol table (symtab.scoped_environ, lookup is one dict hit).
+# Usage: bench/symtab.py [statements] [depth ...]
+###################################################################################################
+
+import os
+import sys
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+import symtab
+
+def program(statements, depth):
+	body = ["int x = 0;", "int y = 1;"] + ["{"] * depth
+	for i in range(statements):
+		if i % 2 == 0:
+			body.append("x = x + y * " + str(i % 7) + ";")
+		else:
+			body.append("y = (x - y) / 3;")
+	body += ["}"] * depth + ["return 0;"]
+	return "namespace Bench\n{\n\tclass Bench\n\t{\n\t\tint Main()\n\t\t{\n" + "\n".join(body) + "\n\t\t}\n\t}\n}\n"
+
+def best(text, environ, rounds=3):
+	times = []
+	for i in range(rounds):
+		begin = time.perf_counter()
+		parser.compile_to_ir(text, symbol_table=environ())
+		times.append(time.perf_counter() - begin)
+	return min(times)
+
+statements = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+depths = [int(x) for x in sys.argv[2:]] or [0, 10, 50, 200]
+
+print("%6s %10s %10s %8s" % ("depth", "tree", "scoped", "speedup"))
+for depth in depths:
+	text = program(statements, depth)
+	assert str(parser.compile_to_ir(text, symbol_table=symtab.environ())) == str(parser.compile_to_ir(text))
+	tree = best(text, symtab.environ)
+	scoped = best(text, symtab.scoped_environ)
+	print("%6d %9.1fms %9.1fms %7.2fx" % (depth, tree*1000, scoped*1000, tree/scoped))
@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+# Temporary recycling benchmark: the programs of test/ with the body of Main
+# repeated, compiled with and without reuse of freed temporaries. Reports
+# the variables in the .data section and the code generation time.
+# Usage: bench/temps.py [copies]
+###################################################################################################
+
+import os
+import sys
+import glob
+import time
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, src)
+import parser
+import codegen
+import symtab
+
+# The program with the body of Main repeated, each copy in its own block
+def scale(text, copies):
+	start = text.index('{', text.index('Main()')) + 1
+	depth = 1
+	end = start
+	while depth > 0:
+		if text[end] == '{':
+			depth += 1
+		elif text[end] == '}':
+			depth -= 1
+		end += 1
+	body = text[start:end-1]
+	return text[:start] + ("{" + body + "}\n") * copies + text[end-1:]
+
+def measure(text, recycle):
+	program = parser.compile_to_ir(text, symbol_table=symtab.scoped_environ(recycle), eliminate_dead_code=False)
+	begin = time.perf_counter()
+	generator = codegen.Generator(program.code)
+	generator.generate()
+	return len(program.code), len(generator.varlist), time.perf_counter() - begin
+
+copies = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+print("%-22s %6s %14s %18s" % ("program x" + str(copies), "instrs", ".data vars", "codegen time"))
+for filename in sorted(glob.glob(os.path.join(src, '..', 'test', '*.cs'))):
+	try:
+		text = scale(open(filename).read(), copies)
+		size, before, slow = measure(text, False)
+		size, after, fast = measure(text, True)
+	except (parser.CompileError, ValueError):
+		continue
+	print("%-22s %6d %6d -> %5d %7.0fms -> %5.0fms" % (os.path.basename(filename), size, before, after, slow*1000, fast*1000))
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+# Token buffer memory benchmark: peak RSS of holding a whole token stream as
+# a list of LexToken objects vs the array-backed TokenBuffer.
+# Usage: bench/tokbuf.py [tokens]
+###################################################################################################
+
+import os
+import sys
+import subprocess
+
+src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+snippet = """
+import sys, glob, resource
+import scanner, tokbuf
+sample = ""
+for filename in sorted(glob.glob('../test/*.cs')):
+	sample = sample + open(filename).read() + "\\n"
+tokens = %d
+lx = scanner.Scanner()
+lx.input(sample)
+per_copy = len(list(lx))
+data = sample*(tokens//per_copy + 1)
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.argv[1] == 'list':
+	lx = scanner.Scanner()
+	lx.input(data)
+	stream = list(lx)
+	count = len(stream)
+else:
+	stream = tokbuf.TokenBuffer().fill(scanner.Scanner(), data)
+	count = len(stream)
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(count, base, peak)
+"""
+
+if len(sys.argv) == 2:
+	tokens = int(sys.argv[1])
+else:
+	tokens = 1000000
+
+print("%-8s %10s %14s %14s" % ("mode", "tokens", "peak RSS", "token stream"))
+for mode in ['list', 'tokbuf']:
+	out = subprocess.run([sys.executable, '-c', snippet % tokens, mode], cwd=src, stdout=subprocess.PIPE, check=True)
+	count, base, peak = [int(x) for x in out.stdout.split()]
+	print("%-8s %10d %12.1fMB %12.1fMB" % (mode, count, peak/1024, (peak - base)/1024))
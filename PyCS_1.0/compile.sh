@@ -1,5 +1,4 @@
 #!/bin/bash
-src/parser.py test/$1 2> t > temp.ir
-src/codegen.py temp.ir > temp.s
+src/compiler.py --ir=temp.ir test/$1 > temp.s
 gcc -m32 -g temp.s -o temp
 ./temp
\ No newline at end of file
@@ -0,0 +1,138 @@
+#!/usr/bin/python3
+# Control flow graphs of three address code
+#
+# The code of a program is split into functions: the prologue (the call to
+# Main and the exit before the first function), then one graph from each
+# function instruction to the next. Each graph is a list of basic blocks in
+# program order, linked by explicit successor and predecessor edges:
+#
+#     label L        starts a block, the target of the jumps to L
+#     goto L         ends a block, one edge to the block of L
+#     ifgoto ... L   ends a block, edges to the block of L and the next one
+#     return, exit   end a block, no edges (the block is an exit of the graph)
+#     call f         stays inside its block, control comes back after it;
+#                    the callee is recorded in the calls of the graph
+#
+# Any other block falls through to the next block of its function. Building
+# takes one pass over the code to find the leaders and one to make the
+# blocks, so it is linear in the number of instructions. Passes may replace
+# the code of a block; flatten puts the program back together.
+#
+# Usage: ./cfg.py file.ir
+#     prints the blocks and edges of every function
+###################################################################################################
+
+import sys
+import ir
+from ir import Op
+
+# A basic block: code is its list of ir.Instr, line the number of its first
+# instruction in the listing it was built from, index its position in the
+# blocks of its graph
+class Block:
+	__slots__ = ('index', 'line', 'code', 'succs', 'preds')
+
+	def __init__(self, index, line, code):
+		self.index = index
+		self.line = line
+		self.code = code
+		self.succs = []
+		self.preds = []
+
+	def __repr__(self):
+		return "B" + str(self.index)
+
+# The blocks of one function: name is that of the function (None for the
+# prologue), blocks[0] its entry, labels the block of each label and calls
+# the names of the functions it calls, in order of first call
+class Graph:
+	def __init__(self, name):
+		self.name = name
+		self.blocks = []
+		self.labels = {}
+		self.calls = []
+
+	# The blocks without successors: those ending in return or exit, and a
+	# last block falling off the end of the function
+	def exits(self):
+		return [b for b in self.blocks if not b.succs]
+
+	def __len__(self):
+		return sum(len(b.code) for b in self.blocks)
+
+# Opcodes after which a new block starts
+enders = {Op.GOTO, Op.IFGOTO, Op.RETURN, Op.EXIT}
+
+# The graphs of the functions of a list of ir.Instr, in program order
+def build(code):
+	graphs = []
+	graph = Graph(None)
+	start = 0
+	for i in range(len(code)):
+		instr = code[i]
+		op = instr.op
+		if op == Op.FUNCTION:
+			if i > 0:
+				split(graph, code, start, i)
+				graphs.append(graph)
+			graph = Graph(instr.args[0])
+			start = i
+		elif op == Op.LABEL:
+			if i > start:
+				split(graph, code, start, i)
+			start = i
+		elif op in enders:
+			split(graph, code, start, i + 1)
+			start = i + 1
+		elif op == Op.CALL and instr.args[0] not in graph.calls:
+			graph.calls.append(instr.args[0])
+	if start < len(code) or not graph.blocks:
+		split(graph, code, start, len(code))
+	graphs.append(graph)
+	for graph in graphs:
+		link(graph)
+	return graphs
+
+# Adds code[start:end] to the graph as a block
+def split(graph, code, start, end):
+	if start == end and graph.blocks:
+		return
+	block = Block(len(graph.blocks), start + 1, code[start:end])
+	if block.code and block.code[0].op == Op.LABEL:
+		graph.labels[block.code[0].args[0]] = block
+	graph.blocks.append(block)
+
+def link(graph):
+	blocks = graph.blocks
+	for block in blocks:
+		last = block.code[-1] if block.code else None
+		op = last.op if last != None else None
+		if op == Op.GOTO or op == Op.IFGOTO:
+			target = graph.labels.get(last.args[-1])
+			if target == None:
+				raise ValueError("label " + last.args[-1] + " is not in function " + str(graph.name))
+			edge(block, target)
+		if op not in (Op.GOTO, Op.RETURN, Op.EXIT) and block.index + 1 < len(blocks):
+			edge(block, blocks[block.index + 1])
+
+def edge(source, target):
+	if target not in source.succs:
+		source.succs.append(target)
+		target.preds.append(source)
+
+# The instructions of the graphs, in order
+def flatten(graphs):
+	code = []
+	for graph in graphs:
+		for block in graph.blocks:
+			code.extend(block.code)
+	return code
+
+if __name__ == '__main__':
+	if len(sys.argv) != 2:
+		print("Usage: ./cfg.py file.ir")
+		exit(0)
+	for graph in build(ir.parse_listing(open(sys.argv[1], 'r').read())):
+		print("function", graph.name if graph.name != None else "(prologue)", "calls", graph.calls)
+		for block in graph.blocks:
+			print("   ", block, "lines", block.line, "-", block.line + len(block.code) - 1, "->", block.succs)
@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+# Client of the compile daemon (see daemon.py), a drop-in for ./compile:
+# writes temp.ir, temp.s and a.out to the current directory, or prints the
+# errors. The daemon is started in the background if it is not running, and
+# replaced if it runs other code than the client (see version).
+#
+# Usage: ./client.py [--ir | --asm] [--stop] file.cs
+#     --ir, --asm print the listing or the assembly instead of linking
+#     --stop stops the daemon
+###################################################################################################
+
+import os
+import sys
+import json
+import time
+import socket
+import hashlib
+import subprocess
+import tabcache
+
+# Socket used when none is given: $PYCS_SOCKET, else pycs.sock in the table cache
+def socket_path():
+	path = os.environ.get('PYCS_SOCKET')
+	if path:
+		return path
+	return os.path.join(tabcache.cache_dir() or '/tmp', 'pycs.sock')
+
+# Hash of the sources of the compiler. A daemon started before they were
+# edited, or from another checkout, has another one.
+def version():
+	h = hashlib.sha1()
+	directory = os.path.dirname(os.path.abspath(__file__))
+	for name in sorted(os.listdir(directory)):
+		if name.endswith('.py'):
+			with open(os.path.join(directory, name), 'rb') as f:
+				h.update(name.encode() + b'\0' + f.read())
+	return h.hexdigest()[:16]
+
+def connect(path):
+	s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	try:
+		s.connect(path)
+	except OSError:
+		s.close()
+		return None
+	return s
+
+# Connects to the daemon, starting it if needed
+def daemon(path, start=True, timeout=10):
+	s = connect(path)
+	if s != None or not start:
+		return s
+	script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'daemon.py')
+	subprocess.Popen([sys.executable, script, '--socket=' + path], stdin=subprocess.DEVNULL,
+		stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+	deadline = time.time() + timeout
+	while s == None and time.time() < deadline:
+		time.sleep(0.02)
+		s = connect(path)
+	return s
+
+# Stops the daemon and, once it no longer answers, starts a new one
+def restart(path, timeout=10):
+	s = connect(path)
+	if s != None:
+		request(s, {'command': 'stop'})
+	deadline = time.time() + timeout
+	s = connect(path)
+	while s != None and time.time() < deadline:
+		s.close()
+		time.sleep(0.02)
+		s = connect(path)
+	if s != None:
+		s.close()
+		return None
+	return daemon(path, timeout=timeout)
+
+# Sends one request and returns the answer
+def request(s, message):
+	s.sendall(json.dumps(message).encode())
+	s.shutdown(socket.SHUT_WR)
+	data = b''
+	while True:
+		chunk = s.recv(1 << 16)
+		if not chunk:
+			break
+		data += chunk
+	s.close()
+	return json.loads(data)
+
+if __name__ == '__main__':
+	path = socket_path()
+	if '--stop' in sys.argv:
+		s = daemon(path, start=False)
+		if s != None:
+			request(s, {'command': 'stop'})
+		exit(0)
+	args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+	if len(args) != 1:
+		print("Usage: ./client.py [--ir | --asm] [--stop] file.cs")
+		exit(0)
+	output = 'link'
+	if '--ir' in sys.argv:
+		output = 'ir'
+	elif '--asm' in sys.argv:
+		output = 'asm'
+
+	source = open(args[0], 'r').read()
+	s = daemon(path)
+	if s == None:
+		print("client: cannot reach the compile daemon at", path, file=sys.stderr)
+		exit(2)
+	message = {'source': source, 'output': output, 'dir': os.getcwd(), 'version': version()}
+	reply = request(s, message)
+	if reply['status'] == 'stale':
+		# The daemon runs other code: replace it
+		s = restart(path)
+		if s == None:
+			print("client: cannot restart the compile daemon at", path, file=sys.stderr)
+			exit(2)
+		reply = request(s, message)
+	if reply['status'] != 'ok':
+		for message in reply['messages']:
+			print(message)
+		exit(0)
+	for message in reply['messages']:
+		print(message, file=sys.stderr)
+	if output == 'ir':
+		sys.stdout.write(reply['ir'])
+	elif output == 'asm':
+		print(reply['asm'])
+	else:
+		sys.stderr.write(reply['log'])
+		exit(reply['returncode'])
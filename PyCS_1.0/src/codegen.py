@@ -3,1609 +3,1607 @@
 ###################################################################################################
 
 import sys 
+import ir
+import cfg
+import dataflow
+from ir import Op, isnumber
 
 ###################################################################################################
 
-# Get the intermediate code file name
-if len(sys.argv) == 2:
-	filename = str(sys.argv[1])
-else:
-	print("usage: python codegen.py irfile")
-	exit()
-
 # Define the list of registers
 reglist = ['%eax', '%ebx', '%ecx', '%edx']
-# Construct the register descriptor table
-registers = {}
-registers = registers.fromkeys(reglist)
 
 # Mathematical Operators
-mathops = ['+', '-', '*', '/', '%']
+mathops = [Op.ADD, Op.SUB, Op.MUL, Op.DIV, Op.MOD]
 relops = ['&&', '||', '~']
-# Variable 
-varlist = []
-array_list = []
-addressDescriptor = {}
-
-assembly = ""
-relcount = 1
-# Three address code keywords
-tackeywords = ['read', 'update', 'member', 'array', 'param', 'pop', 'retval', 'arg', 'ifgoto', 'goto', 'return', 'call', 'print', 'label', '<=', '>=', '==', '>', '<', '!=', '=', 'function', 'exit', '>>', '<<', '&&', '||', '!', '~'] + mathops
-
 ###################################################################################################
 
-def isnumber(num):
-	t = num.isdigit() or (num[1:].isdigit() and num[0] == "-")
-	return t
-
-# Sets the register descriptor entry as per the arguments
-def setregister(register, content):
-	registers[register] = content
-
-# getreg function... return register for the variable. spilling implemented here.
-def getReg(variable, instrno):
-	global assembly
-	#instrno is the line number!
-	if variable in registers.values():
-		for x in registers.keys():
-			if registers[x] == variable:
+# The x86 assembly of a program, as returned by compile_to_asm
+class Assembly:
+	def __init__(self, data, bss, text):
+		self.data = data
+		self.bss = bss
+		self.text = text
+
+	def __str__(self):
+		return self.data + self.bss + self.text
+
+# Code generation state for one program: the register and address
+# descriptors, its variables and arrays, basic blocks (see cfg.py) and next
+# use table
+class Generator:
+	def __init__(self, instrlist):
+		self.instrlist = instrlist
+		# Construct the register descriptor table
+		self.registers = dict.fromkeys(reglist)
+		self.assembly = ""
+		self.relcount = 1
+		self.array_list = []
+		self.nextuseTable = [None for i in range(len(instrlist))]
+
+		# Construct the variable list and the address discriptor table
+		# (in order of first use, so the output does not depend on string hashing)
+		varlist = []
+		for instr in instrlist:
+			if instr.op not in [Op.LABEL, Op.CALL, Op.IFGOTO, Op.GOTO, Op.ARRAY, Op.MEMBER, Op.UPDATE, Op.FUNCTION]:
+				varlist.extend(instr.names())
+			else:
+				# Not the array of member and update: a temporary may be
+				# assigned by member and only compared by an ifgoto
+				varlist.extend(dataflow.names(instr))
+		self.varlist = varlist = list(dict.fromkeys(varlist))
+		self.addressDescriptor = dict.fromkeys(varlist, "mem")
+		symbolTable = dict.fromkeys(varlist, ["live", None])
+
+		# The basic blocks as nodes, each a list of line numbers
+		self.nodes = nodes = []
+		for graph in cfg.build(instrlist):
+			for block in graph.blocks:
+				nodes.append(list(range(block.line, block.line + len(block.code))))
+
+		# Constructing the next use table
+		for node in nodes:
+			revlist=node.copy()
+			revlist.reverse()
+			for instrnumber in revlist:
+				# Get the current instruction and the operator and the operands
+				instr = instrlist[instrnumber - 1]
+				operator = instr.op
+				# Get the variable names in the current istruction
+				variables = instr.names()
+				# Set the next use values here
+				self.nextuseTable[instrnumber-1] = {var:symbolTable[var] for var in varlist}
+				# Rule for mathematical operations
+				if operator in mathops:
+					z = instr.args[0]
+					x = instr.args[1]
+					y = instr.args[2]
+					if z in variables:
+						symbolTable[z] = ["dead", None]
+					if x in variables:
+						symbolTable[x] = ["live", instrnumber]
+					if y in variables:
+						symbolTable[y] = ["live", instrnumber]
+				elif operator == Op.IFGOTO:
+					x = instr.args[1]
+					y = instr.args[2]
+					if x in variables:
+						symbolTable[x] = ["live", instrnumber]
+					if y in variables:
+						symbolTable[y] = ["live", instrnumber]
+				elif operator == Op.PRINT:
+					x = instr.args[0]
+					if x in variables:
+						symbolTable[x] = ["live", instrnumber]			
+				elif operator == Op.ASSIGN:
+					x = instr.args[0]
+					y = instr.args[1]
+					if x in variables:
+						symbolTable[x] = ["dead", None]
+					if y in variables:
+						symbolTable[y] = ["live", instrnumber]					
+
+	# Sets the register descriptor entry as per the arguments. Whatever the
+	# register held before is only in memory now.
+	def setregister(self, register, content):
+		old = self.registers[register]
+		if old != None and old != content and self.addressDescriptor.get(old) == register:
+			self.addressDescriptor[old] = "mem"
+		self.registers[register] = content
+
+	# getreg function... return register for the variable. A variable held in
+	# a register is always in memory too (every result is written through),
+	# so spilling is forgetting: the register taken is the one whose variable
+	# is used farthest away, and not by this instruction.
+	def getReg(self, variable, instrno):
+		#instrno is the line number!
+		for x in reglist:
+			if self.registers[x] == variable:
 				return x
-	for x in registers.keys():
-		if registers[x] == None:
-			return x
-	instrvardict = nextuseTable[instrno - 1]
-	farthestnextuse = max(instrvardict.keys())
-	for var in instrvardict:
-		if instrvardict[var] == farthestnextuse:
-			break;
-	#var is variable to be spilled!
-	for regspill in registers.keys():
-		if registers[regspill] == var:
-			break;
-	#regspill contais register to be spilled!!
-	assembly = assembly + "movl " + regspill + ", " + var + "\n"
-	addressDescriptor[var] = "mem"
-	return regspill
-
-# Returns the location of the variable from the addrss descriptor table
-def getlocation(variable):
-	return addressDescriptor[variable]
-
-# Sets the location entry in the adrdrss decriptor for a variable 
-def setlocation(variable, location):
-	addressDescriptor[variable] = location
-
-# Returns the nextuse of the variable
-def nextuse(variable, line):
-	return nextuseTable[line-1][variable]
+		for x in reglist:
+			if self.registers[x] == None:
+				return x
+		names = self.instrlist[instrno - 1].names()
+		instrvardict = self.nextuseTable[instrno - 1] or {}
+		regspill = None
+		farthestnextuse = -1
+		for x in reglist:
+			var = self.registers[x]
+			if var in names:
+				continue
+			status, use = instrvardict.get(var, ["dead", None])
+			if status == "dead" or use == None:
+				use = len(self.instrlist) + 1
+			if use > farthestnextuse:
+				regspill = x
+				farthestnextuse = use
+		#regspill contais register to be spilled!!
+		self.setlocation(self.registers[regspill], "mem")
+		return regspill
+
+	# Forgets what every register holds, which memory has too: where control
+	# arrives from elsewhere (a label, a function) and after what clobbers
+	# registers (a jump leaves them to its target, printf and the callee
+	# clobber %eax, %ecx and %edx, a system call all of them)
+	def clear(self):
+		for register in reglist:
+			self.registers[register] = None
+		for var in self.addressDescriptor:
+			self.addressDescriptor[var] = "mem"
+
+	# Returns the location of the variable from the addrss descriptor table
+	def getlocation(self, variable):
+		return self.addressDescriptor[variable]
+
+	# Sets the location entry in the adrdrss decriptor for a variable. A
+	# register it was in before no longer holds it.
+	def setlocation(self, variable, location):
+		old = self.addressDescriptor.get(variable, "mem")
+		if old != "mem" and old != location and self.registers[old] == variable:
+			self.registers[old] = None
+		self.addressDescriptor[variable] = location
+
+	# Returns the nextuse of the variable
+	def nextuse(self, variable, line):
+		return self.nextuseTable[line-1][variable]
+
+	# The function to translate a single line tac to x86 assembly
+	def translate(self, instruction, line):
+		assembly = ""
+		args = instruction.args
+		# Literal operands are used as immediates
+		literal = [kind == ir.LITERAL for kind in instruction.kinds]
+		# assembly = assembly + str(line) + "\n"
+		operator = instruction.op
+		# Generating assembly code if the tac is a mathematical operation
+		if operator in mathops:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			# Addition
+			if operator == Op.ADD:
+				if literal[1] and literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					assembly = assembly + "movl $" + str(int(operand1)+int(operand2)) + ", " + regdest + "\n"
+					# Update the address descriptor entry for result variable to say where it is stored no
+					self.setregister(regdest, result)
+					self.setlocation(result, regdest)
+				elif literal[1] and not literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					loc2 = self.getlocation(operand2)
+					# Move the first operand to the destination register
+					assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+					if loc2 != "mem":
+						assembly = assembly + "addl " + loc2 + ", " + regdest + "\n"
+					else:
+						assembly = assembly + "addl " + operand2 + ", " + regdest + "\n"
+					self.setregister(regdest, result)
+					self.setlocation(result, regdest)				
+				elif not literal[1] and literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					loc1 = self.getlocation(operand1)
+					# Move the first operand to the destination register
+					assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
+					# Add the other operand to the register content
+					if loc1 != "mem":
+						assembly = assembly + "addl " + loc1 + ", " + regdest + "\n"
+					else:
+						assembly = assembly + "addl " + operand1 + ", " + regdest + "\n"
+					self.setregister(regdest, result)
+					self.setlocation(result, regdest)				
+				elif not literal[1] and not literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					# Get the locations of the operands
+					loc1 = self.getlocation(operand1)
+					loc2 = self.getlocation(operand2)
+					if loc1 != "mem" and loc2 != "mem":
+						assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+						assembly = assembly + "addl " + loc2 + ", " + regdest + "\n"
+					elif loc1 == "mem" and loc2 != "mem":
+						assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+						assembly = assembly + "addl " + loc2 + ", " + regdest + "\n"
+					elif loc1 != "mem" and loc2 == "mem":
+						assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+						assembly = assembly + "addl " + loc1 + ", " + regdest + "\n"
+					elif loc1 == "mem" and loc2 == "mem":
+						assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+						assembly = assembly + "addl " + operand1 + ", " + regdest + "\n"					
+					# Update the register descriptor entry for regdest to say that it contains the result
+					self.setregister(regdest, result)
+					# Update the address descriptor entry for result variable to say where it is stored now
+					self.setlocation(result, regdest)	
+				assembly = assembly + "movl " + regdest + ", " + result + "\n"			
+			# Subtraction
+			elif operator == Op.SUB:
+				if literal[1] and literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					assembly = assembly + "movl $" + str(int(operand2)-int(operand1)) + ", " + regdest + "\n"
+					# Update the address descriptor entry for result variable to say where it is stored no
+					self.setregister(regdest, result)
+					self.setlocation(result, regdest)
+				elif literal[1] and not literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					loc2 = self.getlocation(operand2)
+					# Move the first operand to the destination register
+					if loc2 != "mem":
+						assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
+					else:
+						assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "subl $" + operand1 + ", " + regdest + "\n"
+					self.setregister(regdest, result)
+					self.setlocation(result, regdest)				
+				elif not literal[1] and literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					loc1 = self.getlocation(operand1)
+					# Move the first operand to the destination register
+					assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
+					# Add the other operand to the register content
+					if loc1 != "mem":
+						assembly = assembly + "subl " + loc1 + ", " + regdest + "\n"
+					else:
+						assembly = assembly + "subl " + operand1 + ", " + regdest + "\n"
+					self.setregister(regdest, result)
+					self.setlocation(result, regdest)				
+				elif not literal[1] and not literal[2]:
+					# Get the register to store the result
+					regdest = self.getReg(result, line)
+					# Get the locations of the operands
+					loc1 = self.getlocation(operand1)
+					loc2 = self.getlocation(operand2)
+					if loc1 != "mem" and loc2 != "mem":
+						assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
+						assembly = assembly + "subl " + loc1 + ", " + regdest + "\n"
+					elif loc1 == "mem" and loc2 != "mem":
+						assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
+						assembly = assembly + "subl " + operand1 + ", " + regdest + "\n"
+					elif loc1 != "mem" and loc2 == "mem":
+						assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+						assembly = assembly + "subl " + loc1 + ", " + regdest + "\n"
+					elif loc1 == "mem" and loc2 == "mem":
+						assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+						assembly = assembly + "subl " + operand1 + ", " + regdest + "\n"					
+					# Update the register descriptor entry for regdest to say that it contains the result
+					self.setregister(regdest, result)
+					# Update the address descriptor entry for result variable to say where it is stored now
+					self.setlocation(result, regdest)
+				assembly = assembly + "movl " + regdest + ", " + result + "\n"
+				self.registers[regdest] = None
+				self.addressDescriptor[result] = 'mem'			
+			# Multiplication
+			elif operator == Op.MUL:
+				if self.registers['%eax'] != None:
+						assembly = assembly + "movl %eax, " + self.registers['%eax'] + "\n"
+						self.setlocation(self.registers['%eax'], "mem")
+				if self.registers['%edx'] != None:
+						assembly = assembly + "movl %edx, " + self.registers['%edx'] + "\n"
+						self.setlocation(self.registers['%edx'], "mem")
+				if not literal[1]:
+					loc1 = self.getlocation(operand1)
+					self.setlocation(operand1, "mem")
+				if not literal[2]:
+					loc2 = self.getlocation(operand2)
+					self.setlocation(operand2, "mem")
+				if not literal[1] and not literal[2]:
+					# Get the locations of the operands
+					assembly = assembly + "movl " + operand1 + ", %eax \n"
+					assembly = assembly + "movl " + operand2 + ", %edx \n"
+					assembly = assembly + "imul %edx \n"
+					self.setlocation(result, '%eax')
+				elif literal[1] and not literal[2]:
+					assembly = assembly + "movl $" + (operand1) + ", %eax \n"
+					assembly = assembly + "movl " + operand2 + ", %edx \n"
+					assembly = assembly + "imul %edx \n"
+					self.setlocation(result, '%eax')
+				elif not literal[1] and literal[2]:
+					assembly = assembly + "movl " + operand1 + ", %eax \n"
+					assembly = assembly + "movl $" + (operand2) + ", %edx \n"
+					assembly = assembly + "imul %edx \n"
+					self.setlocation(result, '%eax')
+				else:
+					ansmul = int(operand1)*int(operand2)
+					assembly = assembly + "movl $" + str(ansmul) + ", %eax \n"
+					self.setlocation(result, '%eax')
+				assembly = assembly + "movl %eax, " + result + "\n"
+				self.registers['%eax'] = None
+				self.addressDescriptor[result] = 'mem'
+			# Division
+			elif operator == Op.DIV:
+				if self.registers['%eax'] != None:
+					assembly = assembly + "movl %eax, " + self.registers['%eax'] + "\n"
+					self.setlocation(self.registers['%eax'], "mem")
+				if self.registers['%edx'] != None:
+					assembly = assembly + "movl %edx, " + self.registers['%edx'] + "\n"
+					self.setlocation(self.registers['%edx'], "mem")
+				if self.registers['%ecx'] != None:
+					assembly = assembly + "movl %ecx, " + self.registers['%ecx'] + "\n"
+					self.setlocation(self.registers['%ecx'], "mem")
+				if not literal[1]:
+					loc1 = self.getlocation(operand1)
+					self.setlocation(operand1, "mem")
+				if not literal[2]:
+					loc2 = self.getlocation(operand2)
+					self.setlocation(operand2, "mem")
+				if not literal[1] and not literal[2]:
+					# Get the locations of the operands
+					assembly = assembly + "movl " + operand1 + ", %eax \n"
+					assembly = assembly + "movl " + operand2 + ", %ecx \n"
+					assembly = assembly + "cltd\n"
+					assembly = assembly + "idiv %ecx \n"
+					self.setlocation(result, '%eax')
+				elif literal[1] and not literal[2]:
+					assembly = assembly + "movl $" + (operand1) + ", %eax \n"
+					assembly = assembly + "movl " + operand2 + ", %ecx \n"
+					assembly = assembly + "cltd\n"
+					assembly = assembly + "idiv %ecx \n"
+					self.setlocation(result, '%eax')
+				elif not literal[1] and literal[2]:
+					loc1 = self.getlocation(operand1)
+					assembly = assembly + "movl " + operand1 + ", %eax \n"
+					assembly = assembly + "movl $" + (operand2) + ", %ecx \n"
+					assembly = assembly + "cltd\n"
+					assembly = assembly + "idiv %ecx \n"
+					self.setlocation(result, '%eax')
+				else:
+					ansdiv = int(int(operand1)/int(operand2))
+					assembly = assembly + "movl $" + str(ansdiv) + ", %eax \n"
+					self.setlocation(result, '%eax')
+				assembly = assembly + "movl %eax, " + result + "\n"
+				self.registers['%eax'] = None
+				self.addressDescriptor[result] = 'mem'
+			# Modulus
+			elif operator == Op.MOD:
+				if self.registers['%eax'] != None:
+					assembly = assembly + "movl %eax, " + self.registers['%eax'] + "\n"
+					self.setlocation(self.registers['%eax'], "mem")
+				if self.registers['%edx'] != None:
+					assembly = assembly + "movl %edx, " + self.registers['%edx'] + "\n"
+					self.setlocation(self.registers['%edx'], "mem")
+				if self.registers['%ecx'] != None:
+					assembly = assembly + "movl %ecx, " + self.registers['%ecx'] + "\n"
+					self.setlocation(self.registers['%ecx'], "mem")
+				if not literal[1]:
+					loc1 = self.getlocation(operand1)
+					self.setlocation(operand1, "mem")
+				if not literal[2]:
+					loc2 = self.getlocation(operand2)
+					self.setlocation(operand2, "mem")
+				if not literal[1] and not literal[2]:
+					# Get the locations of the operands
+					assembly = assembly + "movl " + operand1 + ", %eax \n"
+					assembly = assembly + "movl " + operand2 + ", %ecx \n"
+					assembly = assembly + "cltd\n"
+					assembly = assembly + "idiv %ecx \n"
+					self.setlocation(result, '%edx')
+				elif literal[1] and not literal[2]:
+					assembly = assembly + "movl $" + operand1 + ", %eax \n"
+					assembly = assembly + "movl " + operand2 + ", %ecx \n"
+					assembly = assembly + "cltd\n"
+					assembly = assembly + "idiv %ecx \n"
+					self.setlocation(result, '%edx')
+				elif not literal[1] and literal[2]:
+					loc1 = self.getlocation(operand1)
+					assembly = assembly + "movl " + operand1 + ", %eax \n"
+					assembly = assembly + "movl $" + (operand2) + ", %ecx \n"
+					assembly = assembly + "cltd\n"
+					assembly = assembly + "idiv %ecx \n"
+					self.setlocation(result, '%edx')
+				else:
+					ansmod = int(operand1) - int(operand2)*int(int(operand1)/int(operand2))
+					assembly = assembly + "movl $" + str(ansmod) + ", %edx \n"
+					self.setlocation(result, '%edx')
+				assembly = assembly + "movl %edx, " + result + "\n"
+				self.registers['%edx'] = None
+				self.addressDescriptor[result] = 'mem'
+		elif operator == Op.PARAM:
+			#LineNo, param, val
+			val = args[0]
+			if literal[0]:
+				val = "$" + val
+			else:
+				loc2 = self.getlocation(val)
+				if loc2 != "mem":
+					val = self.addressDescriptor[val]
+			assembly = assembly + "pushl " + val + "\n"
+
+
+		# Generating assembly code if the tac is a function call
+		elif operator == Op.CALL:
+			#Lno., call, func_name, arg_num, ret
+			# Add code to write all the variables to the memory
+			for var in self.varlist:
+				loc = self.getlocation(var)
+				if loc != "mem":
+					assembly = assembly + "movl " + loc + ", " + var + "\n"
+					self.setlocation(var, "mem")
+			label = args[0]
+			assembly = assembly + "call " + label + "\n"
+			self.clear()
+
+		# Generating assembly code if the tac is a label for a new leader
+		elif operator == Op.LABEL:
+			label = args[0]
+			assembly = assembly + label + ": \n"
+			self.clear()
+
+		# Generating assembly code if the tac is an ifgoto statement
+		elif operator == Op.IFGOTO:
+			# Add code to write all the variables to the memory
+			for var in self.varlist:
+				loc = self.getlocation(var)
+				if loc != "mem":
+					assembly = assembly + "movl " + loc + ", " + var + "\n"
+					self.setlocation(var, "mem")
+			relop = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			label = args[3]
+			#check whether the operands are variables or constants
+			if not literal[1] and not literal[2]: #both the operands are variables
+				#Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				#Get the register for comparing the operands
+				reg1 = self.getReg(operand1, line)
+				#generating assembly instructions
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + reg1 + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + reg1 + "\n"
+				if loc2 != "mem":
+					assembly = assembly + "cmpl " + loc2 + ", " + reg1 + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", " + "%edi\n"
+					assembly = assembly + "cmpl %edi, " + reg1 + "\n"
+				#updating the registor & address descriptors
+				self.setregister(reg1, operand1)
+				self.setlocation(operand1, reg1)
+
+			elif not literal[1] and literal[2]: #only operand1 is variables
+				#Get the location of the 1st operand
+				loc1 = self.getlocation(operand1)
+				reg1 = self.getReg(operand1, line)
+				#generating assembly instructions
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + reg1 + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + reg1 + "\n"
+				assembly = assembly + "movl $" + operand2 + ", %edi\n"
+				assembly = assembly + "cmpl %edi, " + reg1 + "\n"
+				#updating the registor & address descriptors
+				self.setregister(reg1, operand1)
+				self.setlocation(operand1, reg1)
+
+			elif literal[1] and not literal[2]: #only operand2 is variables
+				#Get the location of the 1st operand
+				loc2 = self.getlocation(operand2)
+				reg2 = self.getReg(operand2, line)
+				#generating assembly instructions
+				if loc2 != "mem":
+					assembly = assembly + "movl " + loc2 + ", " + reg2 + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", " + reg2 + "\n"
+				assembly = assembly + "movl $" + operand1 + ", %edi\n"
+				assembly = assembly + "cmpl " + reg2 + ", %edi\n"
+				#updating the registor & address descriptors
+				self.setregister(reg2, operand2)
+				self.setlocation(operand2, reg2)
+
+			elif literal[1] and literal[2]: #none of the operandsare variables
+				#generate assembly instructions
+				assembly = assembly + "cmpl $" + operand2 + ", $" + operand1 + "\n"
+
+			# Add code to write all the variables to the memory
+			for var in self.varlist:
+				loc = self.getlocation(var)
+				if loc != "mem":
+					assembly = assembly + "movl " + loc + ", " + var + "\n"
+					self.setlocation(var, "mem")
+			if isnumber(label):
+				label = "L" + label
+			if relop == "<=":
+				assembly = assembly + "jle " + label + "\n"
+			elif relop == ">=":
+				assembly = assembly + "jge " + label + "\n" 
+			elif relop == "==":
+				assembly = assembly + "je " + label + "\n" 
+			elif relop == "<":
+				assembly = assembly + "jl " + label + "\n" 
+			elif relop == ">":
+				assembly = assembly + "jg " + label + "\n" 
+			elif relop == "!=":
+				assembly = assembly + "jne " + label + "\n"
+			self.clear()
+
+		# Generating assembly code if the tac is a goto statement
+		elif operator == Op.GOTO:
+			# Add code to write all the variables to the memory
+			for var in self.varlist:
+				loc = self.getlocation(var)
+				if loc != "mem":
+					assembly = assembly + "movl " + loc + ", " + var + "\n"
+					self.setlocation(var, "mem")
+		
+			label = args[0]
+			if isnumber(label):
+				assembly = assembly + "jmp L" + label + "\n"
+			else:
+				assembly = assembly + "jmp " + label + "\n"
+			self.clear()
+
+		# Generating assembly code if the tac is a return statement
+		elif operator == Op.EXIT:
+			assembly = assembly + "call exit\n"
+
+		# Generating assembly code if the tac is a print
+		elif operator == Op.PRINT:
+			operand = args[0]
+			if not literal[0]:
+				loc = self.getlocation(operand)
+				if not loc == "mem":
+					assembly = assembly + "pushl " + loc + "\n"
+					assembly = assembly + "pushl $str\n"
+					assembly = assembly + "call printf\n"
+				else:
+					assembly = assembly + "pushl " + operand + "\n"
+					assembly = assembly + "pushl $str\n"
+					assembly = assembly + "call printf\n"
+			else:
+				assembly = assembly + "pushl $" + operand + "\n"
+				assembly = assembly + "pushl $str\n"
+				assembly = assembly + "call printf\n"			
+			self.clear()
+
+		# Generating code for assignment operations
+		elif operator == Op.ASSIGN:
+			destination = args[0]
+			source = args[1]
+			# If the source is a literal then we can just move it to the destination
+			if literal[1]:
+				assembly = assembly + "movl $" + source + ", " + destination + "\n"
+			else:
+				loc2 = self.getlocation(source)
+				# If the source resides in the memory, load it to a register
+				# which then holds the destination too
+				if loc2 == "mem":
+					regdest = self.getReg(destination, line)
+					assembly = assembly + "movl " + source + ", " + regdest + "\n"
+					# Update the address descriptor entry for result variable to say where it is stored no
+					self.setregister(regdest, destination)
+					self.setlocation(destination, regdest)
+					loc2 = regdest
+				assembly = assembly + "movl " + loc2 + ", " + destination + "\n"
+
+
+		# Generating the prelude for a function definition
+		elif operator == Op.FUNCTION:
+			function_name = args[0]
+			assembly = assembly + ".globl " + function_name + "\n"
+			assembly = assembly + ".type "  + function_name + ", @function\n"
+			assembly = assembly + function_name + ":\n"
+			assembly = assembly + "pushl %ebp\n"
+			assembly = assembly + "movl %esp, %ebp\n"
+			self.clear()
 
-# The function to translate a single line tac to x86 assembly
-def translate(instruction):
-	global relcount
-	assembly = ""
-	line = int(instruction[0])
-	# assembly = assembly + str(line) + "\n"
-	operator = instruction[1]
-	# Generating assembly code if the tac is a mathematical operation
-	if operator in mathops:
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		# Addition
-		if operator == '+':
-			if isnumber(operand1) and isnumber(operand2):
+		
+		elif operator == Op.ARG:
+			#Lno, arg, i, a_i -----> Move parameter i to var a_i
+			i = args[0]
+			a = args[1]
+			displacement = 4*int(i) + 4
+			# Through %edi: after a call, %eax holds the value retval takes
+			assembly = assembly + "movl " + str(displacement) + "(%ebp), %edi\n"
+			assembly = assembly + "movl %edi, " + a + "\n"
+
+		elif operator == Op.POP:
+			#LNo, pop, n
+			n = args[0]
+			assembly = assembly + "movl $4, %edi\n"
+			for i in range(int(n)):
+				assembly = assembly + "addl %edi, %esp\n"
+
+		elif operator == Op.RETVAL:
+			val = args[0]
+			assembly = assembly + "movl %eax, " + val + "\n"
+
+		# Generating the conclude of the function
+		elif operator == Op.RETURN:
+			#LNo, return, val
+			val = args[0]
+			for var in self.varlist:
+				loc = self.getlocation(var)
+				if loc == "%eax":
+					assembly = assembly + "movl " + loc + ", " + var + "\n"
+					self.setlocation(var, "mem")
+					break
+			if literal[0]:
+				val = "$" + val
+			assembly = assembly + "movl " + val + ", %eax\n"
+			assembly = assembly + "movl %ebp, %esp\n"
+			assembly = assembly + "popl %ebp\n"
+			assembly = assembly + "ret\n"
+
+		#Logical Left Shift : TAC Syntax ---> Line No, <<, result, num, count
+		#corres to result = num << count
+		elif operator == Op.SHL:
+			result = args[0]
+			operand1 = args[1]		#num
+			operand2 = args[2]		#count
+			if literal[1] and literal[2]:
 				# Get the register to store the result
-				regdest = getReg(result, line)
-				assembly = assembly + "movl $" + str(int(operand1)+int(operand2)) + ", " + regdest + "\n"
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(operand1)<<int(operand2)) + ", " + regdest + "\n"
 				# Update the address descriptor entry for result variable to say where it is stored no
-				setregister(regdest, result)
-				setlocation(result, regdest)
-			elif isnumber(operand1) and not isnumber(operand2):
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case result = 5 << x
 				# Get the register to store the result
-				regdest = getReg(result, line)
-				loc2 = getlocation(operand2)
-				# Move the first operand to the destination register
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move 5 to result, result = 5
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				#perform left shift, result = result << x
+				if loc2 != "mem":
+					assembly = assembly + "shl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "shl " + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				#case result = a << 2
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move a to regdest, result = a
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+				# Perform Left shift result = result << 2
+				assembly = assembly + "shl $" + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				#case result = a << b
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					#result = a and result = result << b
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "shl " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "shl " + operand2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "shl " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "shl " + operand2 + ", " + regdest + "\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+		#Logical Right Shift : TAC Syntax ---> Line No, >>, result, num, count
+		#corres to result = num >> count
+		elif operator == Op.SHR:
+			result = args[0]
+			operand1 = args[1]		#num
+			operand2 = args[2]		#count
+			if literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(operand1)>>int(operand2)) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case result = 5 >> x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move 5 to result, result = 5
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				#perform right shift, result = result >> x
+				if loc2 != "mem":
+					assembly = assembly + "shr " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "shr " + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				#case result = a << 2
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move a to regdest, result = a
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+				# Perform Right shift result = result >> 2
+				assembly = assembly + "shr $" + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				#case result = a >> b
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					#result = a and result = result >> b
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "shr " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "shr " + operand2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "shr " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "shr " + operand2 + ", " + regdest + "\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.AND:
+			#Line, &&, result, op1, op2
+			result = args[0]
+			operand1 = args[1]		#num
+			operand2 = args[2]		#count
+			if literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(operand1) and int(operand2)) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case result = 0 && x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move 5 to result, result = 5
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				#perform logical and, result = result >> x
+				if loc2 != "mem":
+					assembly = assembly + "and " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "and " + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				#case result = a && 2
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move a to regdest, result = a
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+				# Perform Logical and result = result && 2
+				assembly = assembly + "and $" + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				#case result = a && b
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					#result = a and result = result && b
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "and " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "and " + operand2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "and " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "and " + operand2 + ", " + regdest + "\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.OR:
+			#Line, ||, result, op1, op2
+			result = args[0]
+			operand1 = args[1]		#op1
+			operand2 = args[2]		#op2
+			if literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(operand1) or int(operand2)) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case result = 0 || x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move 5 to result, result = 5
 				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				#perform logical and, result = result || x
 				if loc2 != "mem":
-					assembly = assembly + "addl " + loc2 + ", " + regdest + "\n"
+					assembly = assembly + "or " + loc2 + ", " + regdest + "\n"
 				else:
-					assembly = assembly + "addl " + operand2 + ", " + regdest + "\n"
-				setregister(regdest, result)
-				setlocation(result, regdest)				
-			elif not isnumber(operand1) and isnumber(operand2):
+					assembly = assembly + "or " + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				#case result = a || 2
 				# Get the register to store the result
-				regdest = getReg(result, line)
-				loc1 = getlocation(operand1)
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move a to regdest, result = a
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+				# Perform Logical and result = result || 2
+				assembly = assembly + "or $" + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				#case result = a || b
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					#result = a and result = result || b
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "or " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "or " + operand2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "or " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "or " + operand2 + ", " + regdest + "\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.BNOT:
+			#Line, not, result, op1
+			result = args[0]
+			operand1 = args[1]		#num
+			if literal[1]:
+				#Case : result = !(1)
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(not(int(operand1))) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif not literal[1]:
+				#case result = !(a)
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move a to regdest, result = a
+				if loc1 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+				# Perform Logical and result = !(result)
+				assembly = assembly + "not $" + operand2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+		# Return the assembly code
+
+		elif operator == Op.LE:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			LT = "LT"+str(self.relcount)
+			NLT = "NLT"+str(self.relcount)
+			if literal[1] and literal[2]:
+				#case: result = 4 < 5
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(int(operand1)<=int(operand2))) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case: result = 5 < x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
 				# Move the first operand to the destination register
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				if loc2 != "mem":
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", %edi\n"
+					assembly = assembly + "cmpl %edi, " + regdest + "\n"
+				assembly = assembly + "jle " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move the operand to the destination register
 				assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
 				# Add the other operand to the register content
 				if loc1 != "mem":
-					assembly = assembly + "addl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
 				else:
-					assembly = assembly + "addl " + operand1 + ", " + regdest + "\n"
-				setregister(regdest, result)
-				setlocation(result, regdest)				
-			elif not isnumber(operand1) and not isnumber(operand2):
+					assembly = assembly + "movl " + operand1 + ", %edi\n" 
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"
+				assembly = assembly + "jle " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
 				# Get the register to store the result
-				regdest = getReg(result, line)
+				regdest = self.getReg(result, line)
 				# Get the locations of the operands
-				loc1 = getlocation(operand1)
-				loc2 = getlocation(operand2)
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
 				if loc1 != "mem" and loc2 != "mem":
 					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-					assembly = assembly + "addl " + loc2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
 				elif loc1 == "mem" and loc2 != "mem":
 					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-					assembly = assembly + "addl " + loc2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
 				elif loc1 != "mem" and loc2 == "mem":
 					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-					assembly = assembly + "addl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
 				elif loc1 == "mem" and loc2 == "mem":
 					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-					assembly = assembly + "addl " + operand1 + ", " + regdest + "\n"					
+					assembly = assembly + "movl " + operand1 + ", %edi\n"
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"					
 				# Update the register descriptor entry for regdest to say that it contains the result
-				setregister(regdest, result)
+				assembly = assembly + "jle " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
 				# Update the address descriptor entry for result variable to say where it is stored now
-				setlocation(result, regdest)	
-			assembly = assembly + "movl " + regdest + ", " + result + "\n"			
-		# Subtraction
-		elif operator == '-':
-			if isnumber(operand1) and isnumber(operand2):
+				self.setlocation(result, regdest)
+			self.relcount = self.relcount + 1
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.GE:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			LT = "LT"+str(self.relcount)
+			NLT = "NLT"+str(self.relcount)
+			if literal[1] and literal[2]:
+				#case: result = 4 < 5
 				# Get the register to store the result
-				regdest = getReg(result, line)
-				assembly = assembly + "movl $" + str(int(operand2)-int(operand1)) + ", " + regdest + "\n"
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(int(operand1)>=int(operand2))) + ", " + regdest + "\n"
 				# Update the address descriptor entry for result variable to say where it is stored no
-				setregister(regdest, result)
-				setlocation(result, regdest)
-			elif isnumber(operand1) and not isnumber(operand2):
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case: result = 5 < x
 				# Get the register to store the result
-				regdest = getReg(result, line)
-				loc2 = getlocation(operand2)
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
 				# Move the first operand to the destination register
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
 				if loc2 != "mem":
-					assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", %edi\n"
+					assembly = assembly + "cmpl %edi, " + regdest + "\n"
+				assembly = assembly + "jge " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move the operand to the destination register
+				assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
+				# Add the other operand to the register content
+				if loc1 != "mem":
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
 				else:
+					assembly = assembly + "movl " + operand1 + ", %edi\n" 
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"
+				assembly = assembly + "jge " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
 					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "subl $" + operand1 + ", " + regdest + "\n"
-				setregister(regdest, result)
-				setlocation(result, regdest)				
-			elif not isnumber(operand1) and isnumber(operand2):
+					assembly = assembly + "movl " + operand1 + ", %edi\n"
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				assembly = assembly + "jge " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			self.relcount = self.relcount + 1
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.EQ:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			LT = "LT"+str(self.relcount)
+			NLT = "NLT"+str(self.relcount)
+			if literal[1] and literal[2]:
+				#case: result = 4 < 5
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(int(operand1)==int(operand2))) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case: result = 5 < x
 				# Get the register to store the result
-				regdest = getReg(result, line)
-				loc1 = getlocation(operand1)
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
 				# Move the first operand to the destination register
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				if loc2 != "mem":
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", %edi\n"
+					assembly = assembly + "cmpl %edi, " + regdest + "\n"
+				assembly = assembly + "je " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move the operand to the destination register
 				assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
 				# Add the other operand to the register content
 				if loc1 != "mem":
-					assembly = assembly + "subl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
 				else:
-					assembly = assembly + "subl " + operand1 + ", " + regdest + "\n"
-				setregister(regdest, result)
-				setlocation(result, regdest)				
-			elif not isnumber(operand1) and not isnumber(operand2):
+					assembly = assembly + "movl " + operand1 + ", %edi\n" 
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"
+				assembly = assembly + "je " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
 				# Get the register to store the result
-				regdest = getReg(result, line)
+				regdest = self.getReg(result, line)
 				# Get the locations of the operands
-				loc1 = getlocation(operand1)
-				loc2 = getlocation(operand2)
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
 				if loc1 != "mem" and loc2 != "mem":
-					assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
-					assembly = assembly + "subl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
 				elif loc1 == "mem" and loc2 != "mem":
-					assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
-					assembly = assembly + "subl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
 				elif loc1 != "mem" and loc2 == "mem":
 					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-					assembly = assembly + "subl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
 				elif loc1 == "mem" and loc2 == "mem":
 					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-					assembly = assembly + "subl " + operand1 + ", " + regdest + "\n"					
+					assembly = assembly + "movl " + operand1 + ", %edi\n"
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"					
 				# Update the register descriptor entry for regdest to say that it contains the result
-				setregister(regdest, result)
+				assembly = assembly + "je " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
 				# Update the address descriptor entry for result variable to say where it is stored now
-				setlocation(result, regdest)
+				self.setlocation(result, regdest)
+			self.relcount = self.relcount + 1
 			assembly = assembly + "movl " + regdest + ", " + result + "\n"
-			registers[regdest] = None
-			addressDescriptor[result] = 'mem'			
-		# Multiplication
-		elif operator == '*':
-			if registers['%eax'] != None:
-					assembly = assembly + "movl %eax, " + registers['%eax'] + "\n"
-					setlocation(registers['%eax'], "mem")
-			if registers['%edx'] != None:
-					assembly = assembly + "movl %edx, " + registers['%edx'] + "\n"
-					setlocation(registers['%edx'], "mem")
-			if not isnumber(operand1):
-				loc1 = getlocation(operand1)
-				setlocation(operand1, "mem")
-			if not isnumber(operand2):
-				loc2 = getlocation(operand2)
-				setlocation(operand2, "mem")
-			if not isnumber(operand1) and not isnumber(operand2):
-				# Get the locations of the operands
-				assembly = assembly + "movl " + operand1 + ", %eax \n"
-				assembly = assembly + "movl " + operand2 + ", %edx \n"
-				assembly = assembly + "imul %edx \n"
-				setlocation(result, '%eax')
-			elif isnumber(operand1) and not isnumber(operand2):
-				assembly = assembly + "movl $" + (operand1) + ", %eax \n"
-				assembly = assembly + "movl " + operand2 + ", %edx \n"
-				assembly = assembly + "imul %edx \n"
-				setlocation(result, '%eax')
-			elif not isnumber(operand1) and isnumber(operand2):
-				assembly = assembly + "movl " + operand1 + ", %eax \n"
-				assembly = assembly + "movl $" + (operand2) + ", %edx \n"
-				assembly = assembly + "imul %edx \n"
-				setlocation(result, '%eax')
-			else:
-				ansmul = int(operand1)*int(operand2)
-				assembly = assembly + "movl $" + str(ansmul) + ", %eax \n"
-				setlocation(result, '%eax')
-			assembly = assembly + "movl %eax, " + result + "\n"
-			registers['%eax'] = None
-			addressDescriptor[result] = 'mem'
-		# Division
-		elif operator == '/':
-			if registers['%eax'] != None:
-				assembly = assembly + "movl %eax, " + registers['%eax'] + "\n"
-				setlocation(registers['%eax'], "mem")
-			if registers['%edx'] != None:
-				assembly = assembly + "movl %edx, " + registers['%edx'] + "\n"
-				setlocation(registers['%edx'], "mem")
-			if registers['%ecx'] != None:
-				assembly = assembly + "movl %ecx, " + registers['%ecx'] + "\n"
-				setlocation(registers['%ecx'], "mem")
-			if not isnumber(operand1):
-				loc1 = getlocation(operand1)
-				setlocation(operand1, "mem")
-			if not isnumber(operand2):
-				loc2 = getlocation(operand2)
-				setlocation(operand2, "mem")
-			assembly = assembly + "movl $0, %edx \n"
-			if not isnumber(operand1) and not isnumber(operand2):
-				# Get the locations of the operands
-				assembly = assembly + "movl " + operand1 + ", %eax \n"
-				assembly = assembly + "movl " + operand2 + ", %ecx \n"
-				assembly = assembly + "idiv %ecx \n"
-				setlocation(result, '%eax')
-			elif isnumber(operand1) and not isnumber(operand2):
-				assembly = assembly + "movl $" + (operand1) + ", %eax \n"
-				assembly = assembly + "movl " + operand2 + ", %ecx \n"
-				assembly = assembly + "idiv %ecx \n"
-				setlocation(result, '%eax')
-			elif not isnumber(operand1) and isnumber(operand2):
-				loc1 = getlocation(operand1)
-				assembly = assembly + "movl " + operand1 + ", %eax \n"
-				assembly = assembly + "movl $" + (operand2) + ", %ecx \n"
-				assembly = assembly + "idiv %ecx \n"
-				setlocation(result, '%eax')
-			else:
-				ansdiv = int(int(operand1)/int(operand2))
-				assembly = assembly + "movl $" + str(ansdiv) + ", %eax \n"
-				setlocation(result, '%eax')
-			assembly = assembly + "movl %eax, " + result + "\n"
-			registers['%eax'] = None
-			addressDescriptor[result] = 'mem'
-		# Modulus
-		elif operator == '%':
-			if registers['%eax'] != None:
-				assembly = assembly + "movl %eax, " + registers['%eax'] + "\n"
-				setlocation(registers['%eax'], "mem")
-			if registers['%edx'] != None:
-				assembly = assembly + "movl %edx, " + registers['%edx'] + "\n"
-				setlocation(registers['%edx'], "mem")
-			if registers['%ecx'] != None:
-				assembly = assembly + "movl %ecx, " + registers['%ecx'] + "\n"
-				setlocation(registers['%ecx'], "mem")
-			if not isnumber(operand1):
-				loc1 = getlocation(operand1)
-				setlocation(operand1, "mem")
-			if not isnumber(operand2):
-				loc2 = getlocation(operand2)
-				setlocation(operand2, "mem")
-			assembly = assembly + "movl $0, %edx \n"
-			if not isnumber(operand1) and not isnumber(operand2):
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.NE:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			LT = "LT"+str(self.relcount)
+			NLT = "NLT"+str(self.relcount)
+			if literal[1] and literal[2]:
+				#case: result = 4 < 5
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(int(operand1)!=int(operand2))) + ", " + regdest + "\n"
+				# Update the address descriptor entry for result variable to say where it is stored no
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case: result = 5 < x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move the first operand to the destination register
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				if loc2 != "mem":
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", %edi\n"
+					assembly = assembly + "cmpl %edi, " + regdest + "\n"
+				assembly = assembly + "jne " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move the operand to the destination register
+				assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
+				# Add the other operand to the register content
+				if loc1 != "mem":
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", %edi\n" 
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"
+				assembly = assembly + "jne " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
 				# Get the locations of the operands
-				assembly = assembly + "movl " + operand1 + ", %eax \n"
-				assembly = assembly + "movl " + operand2 + ", %ecx \n"
-				assembly = assembly + "idiv %ecx \n"
-				setlocation(result, '%edx')
-			elif isnumber(operand1) and not isnumber(operand2):
-				assembly = assembly + "movl $" + operand1 + ", %eax \n"
-				assembly = assembly + "movl " + operand2 + ", %ecx \n"
-				assembly = assembly + "idiv %ex \n"
-				setlocation(result, '%edx')
-			elif not isnumber(operand1) and isnumber(operand2):
-				loc1 = getlocation(operand1)
-				assembly = assembly + "movl " + operand1 + ", %eax \n"
-				assembly = assembly + "movl $" + (operand2) + ", %ecx \n"
-				assembly = assembly + "idiv %ecx \n"
-				setlocation(result, '%edx')
-			else:
-				ansmod = int(int(operand1)/int(operand2))
-				assembly = assembly + "movl $" + str(ansmod) + ", %edx \n"
-				setlocation(result, '%edx')
-			assembly = assembly + "movl %edx, " + result + "\n"
-			registers['%edx'] = None
-			addressDescriptor[result] = 'mem'
-	elif operator == "param":
-		#LineNo, param, val
-		val = instruction[2]
-		if isnumber(val):
-			val = "$" + val
-		else:
-			loc2 = getlocation(val)
-			if loc2 != "mem":
-				val = addressDescriptor[val]
-		assembly = assembly + "pushl " + val + "\n"
-
-
-	# Generating assembly code if the tac is a function call
-	elif operator == "call":
-		#Lno., call, func_name, arg_num, ret
-		# Add code to write all the variables to the memory
-		for var in varlist:
-			loc = getlocation(var)
-			if loc != "mem":
-				assembly = assembly + "movl " + loc + ", " + var + "\n"
-				setlocation(var, "mem")
-		label = instruction[2]
-		assembly = assembly + "call " + label + "\n"
-
-	# Generating assembly code if the tac is a label for a new leader
-	elif operator == "label":
-		label = instruction[2]
-		assembly = assembly + label + ": \n"
-
-	# Generating assembly code if the tac is an ifgoto statement
-	elif operator == "ifgoto":
-		# Add code to write all the variables to the memory
-		for var in varlist:
-			loc = getlocation(var)
-			if loc != "mem":
-				assembly = assembly + "movl " + loc + ", " + var + "\n"
-				setlocation(var, "mem")
-		operator = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		label = instruction[5]
-		#check whether the operands are variables or constants
-		if not isnumber(operand1) and not isnumber(operand2): #both the operands are variables
-			#Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			#Get the register for comparing the operands
-			reg1 = getReg(operand1, line)
-			#generating assembly instructions
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + reg1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + reg1 + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + reg1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", " + "%edi\n"
-				assembly = assembly + "cmpl %edi, " + reg1 + "\n"
-			#updating the registor & address descriptors
-			setregister(reg1, operand1)
-			setlocation(operand1, reg1)
-
-		elif not isnumber(operand1) and isnumber(operand2): #only operand1 is variables
-			#Get the location of the 1st operand
-			loc1 = getlocation(operand1)
-			reg1 = getReg(operand1, line)
-			#generating assembly instructions
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + reg1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + reg1 + "\n"
-			assembly = assembly + "movl $" + operand2 + ", %edi\n"
-			assembly = assembly + "cmpl %edi, " + reg1 + "\n"
-			#updating the registor & address descriptors
-			setregister(reg1, operand1)
-			setlocation(operand1, reg1)
-
-		elif isnumber(operand1) and not isnumber(operand2): #only operand2 is variables
-			#Get the location of the 1st operand
-			loc2 = getlocation(operand2)
-			reg2 = getReg(operand2, line)
-			#generating assembly instructions
-			if loc2 != "mem":
-				assembly = assembly + "movl " + loc2 + ", " + reg2 + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", " + reg2 + "\n"
-			assembly = assembly + "movl $" + operand1 + ", %edi\n"
-			assembly = assembly + "cmpl %edi, " + reg2 + "\n"
-			#updating the registor & address descriptors
-			setregister(reg2, operand2)
-			setlocation(operand2, reg2)
-
-		elif isnumber(operand1) and isnumber(operand2): #none of the operandsare variables
-			#generate assembly instructions
-			assembly = assembly + "cmpl $" + operand2 + ", $" + operand1 + "\n"
-
-		# Add code to write all the variables to the memory
-		for var in varlist:
-			loc = getlocation(var)
-			if loc != "mem":
-				assembly = assembly + "movl " + loc + ", " + var + "\n"
-				setlocation(var, "mem")
-		if isnumber(label):
-			label = "L" + label
-		if operator == "<=":
-			assembly = assembly + "jle " + label + "\n"
-		elif operator == ">=":
-			assembly = assembly + "jge " + label + "\n" 
-		elif operator == "==":
-			assembly = assembly + "je " + label + "\n" 
-		elif operator == "<":
-			assembly = assembly + "jl " + label + "\n" 
-		elif operator == ">":
-			assembly = assembly + "jg " + label + "\n" 
-		elif operator == "!=":
-			assembly = assembly + "jne " + label + "\n"
-
-	# Generating assembly code if the tac is a goto statement
-	elif operator == "goto":
-		# Add code to write all the variables to the memory
-		for var in varlist:
-			loc = getlocation(var)
-			if loc != "mem":
-				assembly = assembly + "movl " + loc + ", " + var + "\n"
-				setlocation(var, "mem")
-		
-		label = instruction[2]
-		if isnumber(label):
-			assembly = assembly + "jmp L" + label + "\n"
-		else:
-			assembly = assembly + "jmp " + label + "\n"
-
-	# Generating assembly code if the tac is a return statement
-	elif operator == "exit":
-		assembly = assembly + "call exit\n"
-
-	# Generating assembly code if the tac is a print
-	elif operator == "print":
-		operand = instruction[2]
-		if not isnumber(operand):
-			loc = getlocation(operand)
-			if not loc == "mem":
-				assembly = assembly + "pushl " + loc + "\n"
-				assembly = assembly + "pushl $str\n"
-				assembly = assembly + "call printf\n"
-			else:
-				assembly = assembly + "pushl " + operand + "\n"
-				assembly = assembly + "pushl $str\n"
-				assembly = assembly + "call printf\n"
-		else:
-			assembly = assembly + "pushl $" + operand + "\n"
-			assembly = assembly + "pushl $str\n"
-			assembly = assembly + "call printf\n"			
-
-	# Generating code for assignment operations
-	elif operator == '=':
-		destination = instruction[2]
-		source = instruction[3]
-		loc1 = getlocation(destination)
-		# If the source is a literal then we can just move it to the destination
-		if isnumber(source):
-			if loc1 == "mem":
-				assembly = assembly + "movl $" + source + ", " + destination + "\n"
-			else:
-				assembly = assembly + "movl $" + source + ", " + loc1 + "\n"
-		else:
-			# If both the source and the destination reside in the memory
-			loc2 = getlocation(source)
-			if loc1 == "mem" and loc2 == "mem":				
-				regdest = getReg(destination, line)
-				assembly = assembly + "movl " + source + ", " + regdest + "\n"
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "movl " + operand1 + ", %edi\n"
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				assembly = assembly + "jne " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			self.relcount = self.relcount + 1
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.LT:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			LT = "LT"+str(self.relcount)
+			NLT = "NLT"+str(self.relcount)
+			if literal[1] and literal[2]:
+				#case: result = 4 < 5
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(int(operand1)<int(operand2))) + ", " + regdest + "\n"
 				# Update the address descriptor entry for result variable to say where it is stored no
-				setregister(regdest, destination)
-				setlocation(destination, regdest)			
-			# If the source is in a register
-			elif loc1 == "mem" and loc2 != "mem":
-				regdest = getReg(destination, line)
-				assembly = assembly + "movl " + loc2 + ", " + regdest + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case: result = 5 < x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move the first operand to the destination register
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				if loc2 != "mem":
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", %edi\n"
+					assembly = assembly + "cmpl %edi, " + regdest + "\n"
+				assembly = assembly + "jl " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move the operand to the destination register
+				assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
+				# Add the other operand to the register content
+				if loc1 != "mem":
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", %edi\n" 
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"
+				assembly = assembly + "jl " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "movl " + operand1 + ", %edi\n"
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				assembly = assembly + "jl " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			self.relcount = self.relcount + 1
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		elif operator == Op.GT:
+			result = args[0]
+			operand1 = args[1]
+			operand2 = args[2]
+			LT = "LT"+str(self.relcount)
+			NLT = "NLT"+str(self.relcount)
+			if literal[1] and literal[2]:
+				#case: result = 4 < 5
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				assembly = assembly + "movl $" + str(int(int(operand1)>int(operand2))) + ", " + regdest + "\n"
 				# Update the address descriptor entry for result variable to say where it is stored no
-				setregister(regdest, destination)
-				setlocation(destination, regdest)
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + source + ", " + loc1 + "\n"
-			elif loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc2 + ", " + loc1 + "\n"
-
-
-	# Generating the prelude for a function definition
-	elif operator == "function":
-		function_name = instruction[2]
-		assembly = assembly + ".globl " + function_name + "\n"
-		assembly = assembly + ".type "  + function_name + ", @function\n"
-		assembly = assembly + function_name + ":\n"
-		assembly = assembly + "pushl %ebp\n"
-		assembly = assembly + "movl %esp, %ebp\n"
-
-		
-	elif operator == "arg":
-		#Lno, arg, i, a_i -----> Move parameter i to var a_i
-		i = instruction[2]
-		a = instruction[3]
-		displacement = 4*int(i) + 4
-		# get the location of the variable a and move it to register if it is in memory
-		loc = getlocation(a)
-		if loc == 'mem':
-			regdest = getReg(a, line)
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, a)
-			setlocation(a, regdest)
-			loc = regdest
-
-		assembly = assembly + "movl " + str(displacement) + "(%ebp), " + loc + "\n"
-		assembly = assembly + "movl " + loc + ", " + a + "\n"
-		registers[loc] = None
-		addressDescriptor[a] = 'mem'
-
-	elif operator == "pop":
-		#LNo, pop, n
-		n = instruction[2]
-		assembly = assembly + "movl $4, %edi\n"
-		for i in range(int(n)):
-			assembly = assembly + "addl %edi, %esp\n"
-
-	elif operator == 'retval':
-		val = instruction[2]
-		assembly = assembly + "movl %eax, " + val + "\n"
-
-	# Generating the conclude of the function
-	elif operator == "return":
-		#LNo, return, val
-		val = instruction[2]
-		for var in varlist:
-			loc = getlocation(var)
-			if loc == "%eax":
-				assembly = assembly + "movl " + loc + ", " + var + "\n"
-				setlocation(var, "mem")
-				break
-		if isnumber(val):
-			val = "$" + val
-		assembly = assembly + "movl " + val + ", %eax\n"
-		assembly = assembly + "movl %ebp, %esp\n"
-		assembly = assembly + "popl %ebp\n"
-		assembly = assembly + "ret\n"
-
-	#Logical Left Shift : TAC Syntax ---> Line No, <<, result, num, count
-	#corres to result = num << count
-	elif operator == "<<":
-		result = instruction[2]
-		operand1 = instruction[3]		#num
-		operand2 = instruction[4]		#count
-		if isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(operand1)<<int(operand2)) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case result = 5 << x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move 5 to result, result = 5
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			#perform left shift, result = result << x
-			if loc2 != "mem":
-				assembly = assembly + "shl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "shl " + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			#case result = a << 2
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move a to regdest, result = a
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-			# Perform Left shift result = result << 2
-			assembly = assembly + "shl $" + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			#case result = a << b
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				#result = a and result = result << b
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "shl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "shl " + operand2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "shl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "shl " + operand2 + ", " + regdest + "\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-	#Logical Right Shift : TAC Syntax ---> Line No, >>, result, num, count
-	#corres to result = num >> count
-	elif operator == ">>":
-		result = instruction[2]
-		operand1 = instruction[3]		#num
-		operand2 = instruction[4]		#count
-		if isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(operand1)>>int(operand2)) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case result = 5 >> x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move 5 to result, result = 5
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			#perform right shift, result = result >> x
-			if loc2 != "mem":
-				assembly = assembly + "shr " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "shr " + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			#case result = a << 2
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move a to regdest, result = a
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-			# Perform Right shift result = result >> 2
-			assembly = assembly + "shr $" + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			#case result = a >> b
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				#result = a and result = result >> b
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "shr " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "shr " + operand2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "shr " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "shr " + operand2 + ", " + regdest + "\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == "&&":
-		#Line, &&, result, op1, op2
-		result = instruction[2]
-		operand1 = instruction[3]		#num
-		operand2 = instruction[4]		#count
-		if isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(operand1) and int(operand2)) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case result = 0 && x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move 5 to result, result = 5
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			#perform logical and, result = result >> x
-			if loc2 != "mem":
-				assembly = assembly + "and " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "and " + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			#case result = a && 2
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move a to regdest, result = a
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-			# Perform Logical and result = result && 2
-			assembly = assembly + "and $" + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			#case result = a && b
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				#result = a and result = result && b
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "and " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "and " + operand2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "and " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "and " + operand2 + ", " + regdest + "\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == "||":
-		#Line, ||, result, op1, op2
-		result = instruction[2]
-		operand1 = instruction[3]		#op1
-		operand2 = instruction[4]		#op2
-		if isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(operand1) or int(operand2)) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case result = 0 || x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move 5 to result, result = 5
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			#perform logical and, result = result || x
-			if loc2 != "mem":
-				assembly = assembly + "or " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "or " + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			#case result = a || 2
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move a to regdest, result = a
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-			# Perform Logical and result = result || 2
-			assembly = assembly + "or $" + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			#case result = a || b
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				#result = a and result = result || b
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "or " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "or " + operand2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "or " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "or " + operand2 + ", " + regdest + "\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == "~":
-		#Line, not, result, op1
-		result = instruction[2]
-		operand1 = instruction[3]		#num
-		if isnumber(operand1):
-			#Case : result = !(1)
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(not(int(operand1))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif not isnumber(operand1):
-			#case result = !(a)
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move a to regdest, result = a
-			if loc1 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-			# Perform Logical and result = !(result)
-			assembly = assembly + "not $" + operand2 + ", " + regdest + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-	# Return the assembly code
-
-	elif operator == '<=':
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		LT = "LT"+str(relcount)
-		NLT = "NLT"+str(relcount)
-		if isnumber(operand1) and isnumber(operand2):
-			#case: result = 4 < 5
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(int(operand1)<=int(operand2))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case: result = 5 < x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move the first operand to the destination register
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", %edi"
-				assembly = assembly + "cmpl %edi, " + regdest + "\n"
-			assembly = assembly + "jle " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move the operand to the destination register
-			assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
-			# Add the other operand to the register content
-			if loc1 != "mem":
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", %edi\n" 
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"
-			assembly = assembly + "jle " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "movl " + operand1 + ", %edi\n"
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			assembly = assembly + "jle " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		relcount = relcount + 1
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == '>=':
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		LT = "LT"+str(relcount)
-		NLT = "NLT"+str(relcount)
-		if isnumber(operand1) and isnumber(operand2):
-			#case: result = 4 < 5
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(int(operand1)>=int(operand2))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case: result = 5 < x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move the first operand to the destination register
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", %edi"
-				assembly = assembly + "cmpl %edi, " + regdest + "\n"
-			assembly = assembly + "jge " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move the operand to the destination register
-			assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
-			# Add the other operand to the register content
-			if loc1 != "mem":
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", %edi\n" 
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"
-			assembly = assembly + "jge " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "movl " + operand1 + ", %edi\n"
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			assembly = assembly + "jge " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		relcount = relcount + 1
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == '==':
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		LT = "LT"+str(relcount)
-		NLT = "NLT"+str(relcount)
-		if isnumber(operand1) and isnumber(operand2):
-			#case: result = 4 < 5
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(int(operand1)==int(operand2))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case: result = 5 < x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move the first operand to the destination register
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", %edi"
-				assembly = assembly + "cmpl %edi, " + regdest + "\n"
-			assembly = assembly + "je " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move the operand to the destination register
-			assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
-			# Add the other operand to the register content
-			if loc1 != "mem":
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", %edi\n" 
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"
-			assembly = assembly + "je " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "movl " + operand1 + ", %edi\n"
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			assembly = assembly + "je " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		relcount = relcount + 1
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == '!=':
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		LT = "LT"+str(relcount)
-		NLT = "NLT"+str(relcount)
-		if isnumber(operand1) and isnumber(operand2):
-			#case: result = 4 < 5
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(int(operand1)!=int(operand2))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case: result = 5 < x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move the first operand to the destination register
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", %edi"
-				assembly = assembly + "cmpl %edi, " + regdest + "\n"
-			assembly = assembly + "jne " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move the operand to the destination register
-			assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
-			# Add the other operand to the register content
-			if loc1 != "mem":
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", %edi\n" 
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"
-			assembly = assembly + "jne " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "movl " + operand1 + ", %edi\n"
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			assembly = assembly + "jne " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		relcount = relcount + 1
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == '<':
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		LT = "LT"+str(relcount)
-		NLT = "NLT"+str(relcount)
-		if isnumber(operand1) and isnumber(operand2):
-			#case: result = 4 < 5
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(int(operand1)<int(operand2))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case: result = 5 < x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move the first operand to the destination register
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", %edi"
-				assembly = assembly + "cmpl %edi, " + regdest + "\n"
-			assembly = assembly + "jl " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move the operand to the destination register
-			assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
-			# Add the other operand to the register content
-			if loc1 != "mem":
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", %edi\n" 
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"
-			assembly = assembly + "jl " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "movl " + operand1 + ", %edi\n"
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			assembly = assembly + "jl " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		relcount = relcount + 1
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	elif operator == '>':
-		result = instruction[2]
-		operand1 = instruction[3]
-		operand2 = instruction[4]
-		LT = "LT"+str(relcount)
-		NLT = "NLT"+str(relcount)
-		if isnumber(operand1) and isnumber(operand2):
-			#case: result = 4 < 5
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			assembly = assembly + "movl $" + str(int(int(operand1)>int(operand2))) + ", " + regdest + "\n"
-			# Update the address descriptor entry for result variable to say where it is stored no
-			setregister(regdest, result)
-			setlocation(result, regdest)
-		elif isnumber(operand1) and not isnumber(operand2):
-			#case: result = 5 < x
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc2 = getlocation(operand2)
-			# Move the first operand to the destination register
-			assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
-			if loc2 != "mem":
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			else:
-				assembly = assembly + "movl " + operand2 + ", %edi"
-				assembly = assembly + "cmpl %edi, " + regdest + "\n"
-			assembly = assembly + "jg " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			loc1 = getlocation(operand1)
-			# Move the operand to the destination register
-			assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
-			# Add the other operand to the register content
-			if loc1 != "mem":
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			else:
-				assembly = assembly + "movl " + operand1 + ", %edi\n" 
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"
-			assembly = assembly + "jg " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			setlocation(result, regdest)				
-		elif not isnumber(operand1) and not isnumber(operand2):
-			# Get the register to store the result
-			regdest = getReg(result, line)
-			# Get the locations of the operands
-			loc1 = getlocation(operand1)
-			loc2 = getlocation(operand2)
-			if loc1 != "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 == "mem" and loc2 != "mem":
-				assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
-			elif loc1 != "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
-			elif loc1 == "mem" and loc2 == "mem":
-				assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
-				assembly = assembly + "movl " + operand1 + ", %edi\n"
-				assembly = assembly + "cmpl " + regdest + ", %edi\n"					
-			# Update the register descriptor entry for regdest to say that it contains the result
-			assembly = assembly + "jg " + LT + "\n"
-			assembly = assembly + "movl $0, " + regdest + "\n"
-			assembly = assembly + "jmp " + NLT + "\n"
-			assembly = assembly + LT + ":" + "\n"
-			assembly = assembly + "movl $1, " + regdest + "\n"
-			assembly = assembly + NLT + ":" + "\n"
-			setregister(regdest, result)
-			# Update the address descriptor entry for result variable to say where it is stored now
-			setlocation(result, regdest)
-		relcount = relcount + 1
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	# For reading terminal input value into variable
-	elif operator == "read":
-		for var in varlist:
-			loc = getlocation(var)
-			if loc != "mem":
-				assembly = assembly + "movl " + loc + ", " + var + "\n"
-				setlocation(var, "mem")
-		result = instruction[2]
-		assembly = assembly + "movl $3, %eax\n"
-		assembly = assembly + "movl $0, %ebx\n"
-		assembly = assembly + "movl $" + result +", %ecx\n"
-		assembly = assembly + "movl $1, %edx\n"
-		assembly = assembly + "int $0x80\n"
-		assembly = assembly + "subl $48, " + result + "\n"
-
-	#Array declaration
-	elif operator == "array":
-		type_of_array = instruction[2]
-		length = instruction[3]
-		name = instruction[4]
-		if type_of_array == "int":
-			array_list.append((name,int(length)))
-
-	#Accessing array element
-	elif operator == "member":
-		result = instruction[2]
-		name = instruction[3]
-		offset = instruction[4]
-		regdest = getReg(result, line)
-		off = getReg(offset, line)		
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)
+			elif literal[1] and not literal[2]:
+				#case: result = 5 < x
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc2 = self.getlocation(operand2)
+				# Move the first operand to the destination register
+				assembly = assembly + "movl $" + operand1 + ", " + regdest + "\n"
+				if loc2 != "mem":
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				else:
+					assembly = assembly + "movl " + operand2 + ", %edi\n"
+					assembly = assembly + "cmpl %edi, " + regdest + "\n"
+				assembly = assembly + "jg " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				loc1 = self.getlocation(operand1)
+				# Move the operand to the destination register
+				assembly = assembly + "movl $" + operand2 + ", " + regdest + "\n"
+				# Add the other operand to the register content
+				if loc1 != "mem":
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				else:
+					assembly = assembly + "movl " + operand1 + ", %edi\n" 
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"
+				assembly = assembly + "jg " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				self.setlocation(result, regdest)				
+			elif not literal[1] and not literal[2]:
+				# Get the register to store the result
+				regdest = self.getReg(result, line)
+				# Get the locations of the operands
+				loc1 = self.getlocation(operand1)
+				loc2 = self.getlocation(operand2)
+				if loc1 != "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + loc1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 == "mem" and loc2 != "mem":
+					assembly = assembly + "movl " + operand1 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + loc2 + ", " + regdest + "\n"
+				elif loc1 != "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "cmpl " + regdest + ", " + loc1 + "\n"
+				elif loc1 == "mem" and loc2 == "mem":
+					assembly = assembly + "movl " + operand2 + ", " + regdest + "\n"
+					assembly = assembly + "movl " + operand1 + ", %edi\n"
+					assembly = assembly + "cmpl " + regdest + ", %edi\n"					
+				# Update the register descriptor entry for regdest to say that it contains the result
+				assembly = assembly + "jg " + LT + "\n"
+				assembly = assembly + "movl $0, " + regdest + "\n"
+				assembly = assembly + "jmp " + NLT + "\n"
+				assembly = assembly + LT + ":" + "\n"
+				assembly = assembly + "movl $1, " + regdest + "\n"
+				assembly = assembly + NLT + ":" + "\n"
+				self.setregister(regdest, result)
+				# Update the address descriptor entry for result variable to say where it is stored now
+				self.setlocation(result, regdest)
+			self.relcount = self.relcount + 1
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		# For reading terminal input value into variable
+		elif operator == Op.READ:
+			for var in self.varlist:
+				loc = self.getlocation(var)
+				if loc != "mem":
+					assembly = assembly + "movl " + loc + ", " + var + "\n"
+					self.setlocation(var, "mem")
+			result = args[0]
+			assembly = assembly + "movl $3, %eax\n"
+			assembly = assembly + "movl $0, %ebx\n"
+			assembly = assembly + "movl $" + result +", %ecx\n"
+			assembly = assembly + "movl $1, %edx\n"
+			assembly = assembly + "int $0x80\n"
+			self.clear()
+			assembly = assembly + "subl $48, " + result + "\n"
+
+		#Array declaration
+		elif operator == Op.ARRAY:
+			type_of_array = args[0]
+			length = args[1]
+			name = args[2]
+			if type_of_array == "int":
+				self.array_list.append((name,int(length)))
+
+		#Accessing array element
+		elif operator == Op.MEMBER:
+			result = args[0]
+			name = args[1]
+			offset = args[2]
+			off = self.getReg(offset, line)
+			if self.getlocation(offset) != off:
+				assembly = assembly + "movl " + offset + ", " + off + "\n"
+				self.setregister(off, offset)
+				self.setlocation(offset, off)
+			regdest = self.getReg(result, line)
 		
-		assembly = assembly + "movl " + name + "(%eax), " +regdest +"\n"
+			assembly = assembly + "movl " + name + "(" + off + "), " + regdest + "\n"
 
-		setregister(off, offset)
-		setlocation(offset, off)
-
-		setregister(regdest, result)
-		setlocation(result, regdest)
-		assembly = assembly + "movl " + regdest + ", " + result + "\n"
-		registers[regdest] = None
-		addressDescriptor[result] = 'mem'
-
-	#Storing a particular array element in a variable
-	elif operator == "update":
-		input_ = instruction[2]
-		name = instruction[3]
-		offset = instruction[4]
-		off = getReg(offset, line)
+			self.setregister(regdest, result)
+			self.setlocation(result, regdest)
+			assembly = assembly + "movl " + regdest + ", " + result + "\n"
+			self.registers[regdest] = None
+			self.addressDescriptor[result] = 'mem'
+
+		#Storing a particular array element in a variable
+		elif operator == Op.UPDATE:
+			input_ = args[0]
+			name = args[1]
+			offset = args[2]
+			off = self.getReg(offset, line)
+			if self.getlocation(offset) != off:
+				assembly = assembly + "movl " + offset + ", " + off + "\n"
+				self.setregister(off, offset)
+				self.setlocation(offset, off)
 		
-		if(isnumber(input_)):
-			assembly = assembly + "movl $" + input_ + ", " + name + "(%eax)\n"
-		else:
-			loc2 = getlocation(input_)
-			if(loc2 != "mem"):
-				assembly = assembly + "movl " + loc2 + ", " + name + "(%eax)\n"
+			if(literal[0]):
+				assembly = assembly + "movl $" + input_ + ", " + name + "(" + off + ")\n"
 			else:
-				regdest = getReg(input_, line)
-				assembly = assembly + "movl " + input_ + ", " + regdest + "\n"
-				setregister(regdest, input_)
-
-				setlocation(input_, regdest)
-				assembly = assembly + "movl " + regdest + ", " + name + "(%eax)\n"
-
-		setregister(off, offset)
-		setlocation(offset, off)
-
-	return assembly
+				loc2 = self.getlocation(input_)
+				if(loc2 == "mem"):
+					loc2 = self.getReg(input_, line)
+					assembly = assembly + "movl " + input_ + ", " + loc2 + "\n"
+					self.setregister(loc2, input_)
+					self.setlocation(input_, loc2)
+				assembly = assembly + "movl " + loc2 + ", " + name + "(" + off + ")\n"
+
+		return assembly
+
+
+	# Generating the x86 Assembly code
+	def generate(self):
+		data_section = ".section .data\n"
+		for var in self.varlist:
+			data_section = data_section + var + ":\n" + ".int 0\n"
+		data_section = data_section + "str:\n.ascii \"%d\\n\\0\"\n"
+
+		bss_section = ".section .bss\n"
+		text_section = ".section .text\n" + ".globl main\n" + "main:\n"
+		# text_section += "movl $0, %eax\nmovl $0, %ebx\nmovl $0, %ecx\nmovl $0, %edx\nmovl $0, %edi\nmovl $0, %esi\n"
+
+		for node in self.nodes:
+			# text_section = text_section + "L" + str(node[0]) + ":\n"
+			for n in node:
+				# A register holding the name the instruction assigns does
+				# not hold its value any more; memory still does
+				name = dataflow.defined(self.instrlist[n-1])
+				if name != None and self.addressDescriptor.get(name, "mem") != "mem":
+					self.setlocation(name, "mem")
+				text_section = text_section + self.translate(self.instrlist[n-1], n)
+
+		for (var, length) in self.array_list:
+			data_section = data_section + var + ":\n.int " 
+			for i in range(1,(length+1)):
+				if(i != length):
+					data_section = data_section + "0, "
+				else:
+					data_section = data_section + "0\n"
+		return Assembly(data_section, bss_section, text_section)
 
 ###################################################################################################
 
-# Load the intermediate representation of the program from a file
-irfile = open(filename, 'r')
-ircode = irfile.read()
-ircode = ircode.strip('\n')
-
-
-
-# Consruct the instruction list
-instrlist = []
-instrlist = ircode.split('\n')
-
-# if len(instrlist) < 3:
-# 	print(ircode)
-# 	exit()
-
-
-nextuseTable = [None for i in range(len(instrlist))]
-
-# Construct the variable list and the address discriptor table
-for instr in instrlist:
-	templist = instr.split(', ')
-	if templist[1] not in ['label', 'call', 'ifgoto', 'goto', 'array', 'member', 'update', 'function']:
-		varlist = varlist + templist 
-varlist = list(set(varlist))
-varlist = [x for x in varlist if not isnumber(x)]
-for word in tackeywords:
-	if word in varlist:
-		varlist.remove(word)
-addressDescriptor = addressDescriptor.fromkeys(varlist, "mem")
-symbolTable = addressDescriptor.fromkeys(varlist, ["live", None])
-
-# Get the leaders
-leaders = [1,]
-for i in range(len(instrlist)):
-	instrlist[i] = instrlist[i].split(', ')
-	if 'ifgoto' in instrlist[i]:
-		# leaders.append(int(instrlist[i][-1]))
-		leaders.append(int(instrlist[i][0])+1)
-	elif 'goto' in instrlist[i]:
-		# leaders.append(int(instrlist[i][-1]))
-		leaders.append(int(instrlist[i][0])+1)
-	elif 'function' in instrlist[i]:
-		leaders.append(int(instrlist[i][0]))
-	elif 'label' in instrlist[i]:
-		leaders.append(int(instrlist[i][0]))
-leaders = list(set(leaders))
-leaders.sort()
-
-# Constructing the Basic Blocks as nodes
-nodes = []
-i = 0
-while i < len(leaders)-1:
-	nodes.append(list(range(leaders[i],leaders[i+1])))
-	i = i + 1
-nodes.append(list(range(leaders[i],len(instrlist)+1)))
-
-# Constructing the next use table
-for node in nodes:
-	revlist=node.copy()
-	revlist.reverse()
-	for instrnumber in revlist:
-		# Get the current instruction and the operator and the operands
-		instr = instrlist[instrnumber - 1]
-		operator = instr[1]
-		# Get the variable names in the current istruction
-		variables = [x for x in instr if x in varlist]
-		# Set the next use values here
-		nextuseTable[instrnumber-1] = {var:symbolTable[var] for var in varlist}
-		# Rule for mathematical operations
-		if operator in mathops:
-			z = instr[2]
-			x = instr[3]
-			y = instr[4]
-			if z in variables:
-				symbolTable[z] = ["dead", None]
-			if x in variables:
-				symbolTable[x] = ["live", instrnumber]
-			if y in variables:
-				symbolTable[y] = ["live", instrnumber]
-		elif operator == "ifgoto":
-			x = instr[3]
-			y = instr[4]
-			if x in variables:
-				symbolTable[x] = ["live", instrnumber]
-			if y in variables:
-				symbolTable[y] = ["live", instrnumber]
-		elif operator == "print":
-			x = instr[2]
-			if x in variables:
-				symbolTable[x] = ["live", instrnumber]			
-		elif operator == "=":
-			x = instr[2]
-			y = instr[3]
-			if x in variables:
-				symbolTable[x] = ["dead", None]
-			if y in variables:
-				symbolTable[y] = ["live", instrnumber]					
-
-		i = i - 1
-
-# Generating the x86 Assembly code
-#--------------------------------------------------------------------------------------------------
-data_section = ".section .data\n"
-for var in varlist:
-	data_section = data_section + var + ":\n" + ".int 0\n"
-data_section = data_section + "str:\n.ascii \"%d\\n\\0\"\n"
-
-bss_section = ".section .bss\n"
-text_section = ".section .text\n" + ".globl main\n" + "main:\n"
-# text_section += "movl $0, %eax\nmovl $0, %ebx\nmovl $0, %ecx\nmovl $0, %edx\nmovl $0, %edi\nmovl $0, %esi\n"
-
-for node in nodes:
-	# text_section = text_section + "L" + str(node[0]) + ":\n"
-	for n in node:
-		text_section = text_section + translate(instrlist[n-1])
-
-for (var, length) in array_list:
-	data_section = data_section + var + ":\n.int " 
-	for i in range(1,(length+1)):
-		if(i != length):
-			data_section = data_section + "0, "
-		else:
-			data_section = data_section + "0\n"
-#--------------------------------------------------------------------------------------------------
-
-# Priniting the final output
-# print("Assembly Code (x86) for: [" + filename + "]")
-# print("--------------------------------------------------------------------")
-x86c = data_section + bss_section + text_section
-print(x86c) 
-# print("--------------------------------------------------------------------")
-
-# Save the x86 code in a file here as output.s
+# Generates the x86 assembly of a program: a parser.Program, a list of
+# ir.Instr or a numbered listing
+def compile_to_asm(program):
+	if isinstance(program, str):
+		code = ir.parse_listing(program)
+	elif hasattr(program, 'code'):
+		code = program.code
+	else:
+		code = list(program)
+	return Generator(code).generate()
+
+if __name__ == '__main__':
+	# Get the intermediate code file name
+	if len(sys.argv) == 2:
+		filename = str(sys.argv[1])
+	else:
+		print("usage: python codegen.py irfile")
+		exit()
+
+	# Load the intermediate representation of the program from a file
+	irfile = open(filename, 'r')
+	ircode = irfile.read()
+	print(compile_to_asm(ircode))
 
 ###################################################################################################
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+# C# compiler library: source text to three address code to x86 assembly
+#
+#     import compiler
+#     program = compiler.compile_to_ir(text)     # parser.Program
+#     asm = compiler.compile_to_asm(program)     # codegen.Assembly
+#
+# Nothing here reads sys.argv or keeps state between compilations: every call
+# gets its own symbol table and code generator, and the lexer and parser are
+# built once per process and reused.
+#
+# Usage: ./compiler.py [--ir=file.ir] [parser.py flags] file.cs
+#     writes the assembly to stdout (and the TAC listing to file.ir); the
+#     flags of parser.py (parser.flags) mean the same here, e.g. --ast
+#     compiles through the syntax tree (see parser.compile_tree), --sccp
+#     propagates constants (see sccp.py), --no-dce keeps the copies and
+#     the dead code (see copyprop.py and dce.py). Any other flag is an error.
+#     With --emit-early the passes run method by method and keep the stores
+#     to variables, so the assembly may differ from the default's.
+###################################################################################################
+
+import sys
+import parser
+from parser import compile_to_ir, CompileError
+from codegen import compile_to_asm
+
+# Compiles the text of a program to x86 assembly
+def compile_source(source_text):
+	return compile_to_asm(compile_to_ir(source_text))
+
+if __name__ == '__main__':
+	args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+	irfile = None
+	unknown = []
+	for arg in sys.argv[1:]:
+		if arg.startswith('--ir='):
+			irfile = arg[len('--ir='):]
+		elif arg.startswith('--') and arg not in parser.flags:
+			unknown.append(arg)
+	if len(args) != 1 or unknown != []:
+		print("Usage: ./compiler.py [--ir=file.ir] [--debug] [--scanner] [--tokbuf] [--stream] [--tree-symtab] [--no-fold] [--ast] [--descent] [--emit-early] [--sccp] [--no-dce] file.cs")
+		exit(1)
+
+	# With --emit-early the code comes method by method
+	code = []
+	try:
+		program = parser.compile_file(args[0], sys.argv, code.append)
+	except CompileError as e:
+		for message in e.messages:
+			print(message)
+		exit(1)
+	if '--emit-early' in sys.argv:
+		program.code = code
+	for message in program.messages:
+		print(message, file=sys.stderr)
+	if irfile != None:
+		with open(irfile, 'w') as f:
+			f.write(str(program))
+	print(compile_to_asm(program))
@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+# Global copy propagation
+#
+# A copy "=, a, b" (b a name or a literal) is available where it was made on
+# every path and neither a nor b has been assigned since; a call ends all of
+# them, since every name is a global of the assembly. The available copies
+# are a forward dataflow problem (see dataflow.py), solved over the blocks;
+# then every block is walked, from the copies available at its start, and
+# the reads of a are replaced by b. A literal only goes where codegen takes
+# an immediate (sccp.replaceable); an operation left with two literals is
+# computed instead (ir.evaluate). Copies of a name to itself are removed.
+# The copies themselves stay: dce.py removes those no longer read.
+#
+#     propagate(code)    the code after the pass
+#
+# Usage: ./copyprop.py file.ir
+###################################################################################################
+
+import sys
+import ir
+import cfg
+import tac
+import dataflow
+from ir import Instr, Op, LITERAL
+from dataflow import defined, used_positions, isname, pure, from_elements
+from sccp import replaceable
+
+# The copies of a graph, numbered: "=, a, b" with b a name or an integer
+# literal
+class Copies:
+	def __init__(self, graph):
+		self.copies = []
+		self.index = {}
+		# The copies to or from each name
+		self.involving = {}
+		# The copies to each name
+		self.to = {}
+		for block in graph.blocks:
+			for instr in block.code:
+				key = copied(instr)
+				if key != None and key not in self.index:
+					self.index[key] = len(self.copies)
+					self.copies.append(key)
+					self.to.setdefault(key[0], []).append(self.index[key])
+					for name in key:
+						self.involving.setdefault(name, []).append(self.index[key])
+		self.masks = {}
+		self.masks_to = {}
+
+	# The set of the copies to or from a name
+	def mask(self, name):
+		if name not in self.masks:
+			self.masks[name] = from_elements(self.involving.get(name, ()))
+		return self.masks[name]
+
+	# The set of the copies to a name
+	def mask_to(self, name):
+		if name not in self.masks_to:
+			self.masks_to[name] = from_elements(self.to[name])
+		return self.masks_to[name]
+
+# The (a, b) of a copy "=, a, b" that can be propagated, or None
+def copied(instr):
+	if instr.op != Op.ASSIGN or len(instr.args) != 2 or not isname(instr, 0):
+		return None
+	a, b = instr.args
+	if a == b or not (isname(instr, 1) or ir.isnumber(b)):
+		return None
+	return a, b
+
+# The copies available at the start and end of every block
+def available_copies(graph, copies):
+	everything = (1 << len(copies.copies)) - 1
+	gen = []
+	kill = []
+	for block in graph.blocks:
+		available = 0
+		killed = 0
+		for instr in block.code:
+			if instr.op == Op.CALL:
+				available = 0
+				killed = everything
+				continue
+			name = defined(instr)
+			if name != None and name in copies.involving:
+				mask = copies.mask(name)
+				available &= ~mask
+				killed |= mask
+			key = copied(instr)
+			if key != None:
+				available |= 1 << copies.index[key]
+		gen.append(available)
+		kill.append(killed & ~available)
+	problem = dataflow.Problem(graph, True, False, 0, everything, gen, kill)
+	return dataflow.solve(problem)
+
+def propagate(code):
+	result = []
+	for graph in cfg.build(code):
+		copies = Copies(graph)
+		ins, outs = available_copies(graph, copies)
+		for block in graph.blocks:
+			result += rewrite(block, copies, ins[block.index])
+	return result
+
+# The code of a block with the copies available in it propagated
+def rewrite(block, copies, available):
+	# The copies made in the block and still available, and the names
+	# assigned in it so far: a copy available at the start is no longer
+	# once either side is assigned
+	local = {}
+	sources = {}
+	assigned = set()
+
+	def source(name):
+		if name in local:
+			return local[name]
+		if name in assigned:
+			return None
+		if name not in copies.to:
+			return None
+		for c in dataflow.elements(available & copies.mask_to(name)):
+			if copies.copies[c][1] not in assigned:
+				return copies.copies[c][1]
+		return None
+
+	code = []
+	for instr in block.code:
+		if instr.op == Op.CALL:
+			local.clear()
+			sources.clear()
+			available = 0
+			code.append(instr)
+			continue
+		instr = substitute(instr, source)
+		if instr.op == Op.ASSIGN and instr.args[0] == instr.args[1]:
+			continue
+		name = defined(instr)
+		if name != None:
+			assigned.add(name)
+			if name in local:
+				sources[local.pop(name)].discard(name)
+			for target in sources.pop(name, ()):
+				del local[target]
+			key = copied(instr)
+			if key != None:
+				local[name] = key[1]
+				sources.setdefault(key[1], set()).add(name)
+		code.append(instr)
+	return code
+
+# An instruction with the names it reads replaced by their sources
+def substitute(instr, source):
+	op = instr.op
+	if op == Op.NOT or op == Op.BNOT:
+		# Updated in place
+		return instr
+	args = list(instr.args)
+	literals = [k == LITERAL for k in instr.kinds]
+	changed = False
+	for j in used_positions(op, len(args)):
+		if not isname(instr, j):
+			continue
+		value = source(args[j])
+		if value == None:
+			continue
+		if ir.isnumber(value):
+			if j not in replaceable.get(op, ()):
+				continue
+			if (op in pure or op == Op.IFGOTO) and any(literals[k] for k in (1, 2) if k != j):
+				if op == Op.IFGOTO:
+					continue
+				other = args[3 - j]
+				if not ir.isnumber(other):
+					continue
+				x, y = (int(value), int(other)) if j == 1 else (int(other), int(value))
+				result = ir.evaluate(op, x, y)
+				if result == None:
+					continue
+				# Both operands are literals: the copy of the result
+				return Instr(Op.ASSIGN, args[0], str(result))
+			literals[j] = True
+		args[j] = value
+		changed = True
+	if not changed:
+		return instr
+	return Instr(op, *args)
+
+if __name__ == '__main__':
+	if len(sys.argv) != 2:
+		print("Usage: ./copyprop.py file.ir")
+		exit(0)
+	sys.stdout.write(tac.listing(propagate(ir.parse_listing(open(sys.argv[1], 'r').read()))))
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+# Compile daemon
+#
+# Keeps the lexer and parser tables loaded and compiles programs sent to it
+# over a Unix socket, so a compile costs neither an interpreter startup nor a
+# table load. Compiling is done on the event loop, one program at a time (the
+# parser is shared); the assemble/link steps run as gcc subprocesses, at most
+# --jobs=N of them at once, while further requests are compiled.
+#
+# Protocol: one request per connection. The client sends a JSON object and
+# closes its side; the daemon answers with a JSON object and closes.
+#     {"source": text, "output": "ir" | "asm" | "link", "dir": path,
+#      "version": client.version()}
+#         output "ir" and "asm" return the listing or the assembly,
+#         "link" writes dir/temp.ir, dir/temp.s and links dir/a.out (like
+#         ./compile). The answer has "status" ("ok" or "error"), "messages",
+#         and "ir", "asm" or the gcc "returncode" and "log". A request of
+#         another version than the daemon's is not compiled: the status is
+#         "stale", and the client restarts the daemon.
+#     {"command": "stop"}
+# A connection closed without a request only checks that the daemon is up.
+#
+# The socket of a daemon still answering is never taken over: a second
+# daemon started on it exits.
+#
+# Usage: ./daemon.py [--socket=path] [--jobs=N]
+###################################################################################################
+
+import os
+import sys
+import json
+import signal
+import asyncio
+import compiler
+import parser
+import lexer
+from client import socket_path, connect, version
+
+class Daemon:
+	def __init__(self, path, jobs):
+		self.path = path
+		# Limits the gcc subprocesses running at once
+		self.jobs = asyncio.Semaphore(jobs)
+		self.stopped = asyncio.Event()
+		self.version = version()
+
+	# Compiles a program to its listing and assembly
+	def compile(self, request):
+		try:
+			program = compiler.compile_to_ir(request['source'])
+		except compiler.CompileError as e:
+			return {'status': 'error', 'messages': e.messages}, None
+		reply = {'status': 'ok', 'messages': program.messages}
+		if request.get('output') == 'ir':
+			reply['ir'] = str(program)
+			return reply, None
+		return reply, program
+
+	async def link(self, directory, program, asm):
+		with open(os.path.join(directory, 'temp.ir'), 'w') as f:
+			f.write(str(program))
+		with open(os.path.join(directory, 'temp.s'), 'w') as f:
+			f.write(asm + "\n")
+		async with self.jobs:
+			process = await asyncio.create_subprocess_exec('gcc', '-m32', '-g', 'temp.s', '-o', 'a.out',
+				cwd=directory, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+			log, _ = await process.communicate()
+		return process.returncode, log.decode(errors='replace')
+
+	async def handle(self, reader, writer):
+		data = await reader.read()
+		if not data:
+			writer.close()
+			return
+		try:
+			request = json.loads(data)
+			if request.get('command') == 'stop':
+				reply = {'status': 'ok', 'messages': []}
+				self.stopped.set()
+			elif request.get('version') != self.version:
+				reply = {'status': 'stale', 'messages': ["daemon: running other code than the client"]}
+			else:
+				reply, program = self.compile(request)
+				if program != None:
+					asm = str(compiler.compile_to_asm(program))
+					if request.get('output') == 'asm':
+						reply['asm'] = asm
+					else:
+						reply['returncode'], reply['log'] = await self.link(request['dir'], program, asm)
+		except Exception as e:
+			reply = {'status': 'error', 'messages': [type(e).__name__ + ": " + str(e)]}
+		writer.write(json.dumps(reply).encode())
+		await writer.drain()
+		writer.close()
+
+	# Serves until stopped; False if another daemon answers on the socket
+	async def serve(self):
+		# Load the tables before accepting requests
+		lexer.get_lexer()
+		parser.get_parser()
+		if os.path.exists(self.path):
+			s = connect(self.path)
+			if s != None:
+				s.close()
+				print("daemon: already running on", self.path, file=sys.stderr)
+				return False
+			# Left by a daemon that died
+			os.remove(self.path)
+		server = await asyncio.start_unix_server(self.handle, path=self.path)
+		inode = os.stat(self.path).st_ino
+		loop = asyncio.get_running_loop()
+		for sig in (signal.SIGINT, signal.SIGTERM):
+			loop.add_signal_handler(sig, self.stopped.set)
+		try:
+			await self.stopped.wait()
+		finally:
+			server.close()
+			await server.wait_closed()
+			# Unless a new daemon has its socket there already
+			if os.path.exists(self.path) and os.stat(self.path).st_ino == inode:
+				os.remove(self.path)
+		return True
+
+if __name__ == '__main__':
+	path = socket_path()
+	jobs = os.cpu_count() or 1
+	for arg in sys.argv[1:]:
+		if arg.startswith('--socket='):
+			path = arg[len('--socket='):]
+		elif arg.startswith('--jobs='):
+			jobs = int(arg[len('--jobs='):])
+		else:
+			print("Usage: ./daemon.py [--socket=path] [--jobs=N]")
+			exit(0)
+	if not asyncio.run(Daemon(path, jobs).serve()):
+		exit(1)
@@ -0,0 +1,393 @@
+#!/usr/bin/python3
+# Dataflow analysis over the control flow graphs of cfg.py
+#
+# A problem gives every block a transfer function out = gen | (in & ~kill)
+# (in = gen | (out & ~kill) for a backward problem), a meet for the values
+# flowing into a block (union or intersection) and the value at the boundary
+# (the entry of the function, or its exits). solve runs a worklist of blocks
+# to the fixed point. Sets are Python ints used as bit vectors over a
+# numbering of the names, definitions or expressions of one function: a set
+# costs one bit per element, and union, intersection and difference are one
+# operation each however large the function is. Only the sets at the block
+# boundaries are kept; those between the instructions of a block are
+# recomputed when needed (see live_after).
+#
+#     liveness(graph)                variables and temporaries live at the
+#                                    start and end of each block
+#     reaching_definitions(graph)    definitions reaching each block
+#     available_expressions(graph)   expressions computed on every path to
+#                                    each block and not overwritten since
+#
+# Every variable is a global of the assembly, so a call may read and write any
+# of them; a temporary belongs to its function.
+#
+# Usage: ./dataflow.py file.ir
+#     prints the live names, reaching definitions and available expressions
+#     at the start of every block
+###################################################################################################
+
+import sys
+import ir
+import cfg
+from ir import Op, TEMP, VAR
+
+# Operations computing a value from their operands only: "op, result, a, b"
+pure = {Op.ADD, Op.SUB, Op.MUL, Op.DIV, Op.MOD, Op.SHL, Op.SHR, Op.AND, Op.OR,
+	Op.LT, Op.GT, Op.LE, Op.GE, Op.EQ, Op.NE}
+
+def isname(instr, i):
+	kind = instr.kinds[i]
+	return kind == TEMP or kind == VAR
+
+# The position of the variable or temporary an instruction assigns, or None.
+# A call assigns variables too, but none in particular (see
+# Numbering.globals).
+def defined_position(instr):
+	op = instr.op
+	if op in pure or op == Op.ASSIGN or op == Op.MEMBER or op == Op.READ or op == Op.RETVAL or op == Op.NOT or op == Op.BNOT or op == Op.PHI:
+		i = 0
+	elif op == Op.ARG:
+		i = 1
+	else:
+		return None
+	if i < len(instr.args) and isname(instr, i):
+		return i
+	return None
+
+# The variable or temporary an instruction assigns, or None
+def defined(instr):
+	i = defined_position(instr)
+	if i == None:
+		return None
+	return instr.args[i]
+
+# Positions of the operands whose value an instruction reads. The array of
+# member and update is memory, not a value.
+def used_positions(op, n):
+	if op in pure or op == Op.ASSIGN or op == Op.BNOT or op == Op.PHI:
+		return range(1, n)
+	if op == Op.NOT or op == Op.PRINT or op == Op.PARAM or op == Op.RETURN:
+		return range(0, min(n, 1))
+	if op == Op.IFGOTO:
+		return (1, 2)
+	if op == Op.MEMBER:
+		return (2,)
+	if op == Op.UPDATE:
+		return (0, 2)
+	return ()
+
+# The variables and temporaries an instruction reads, in operand order
+def used(instr):
+	return [instr.args[i] for i in used_positions(instr.op, len(instr.args)) if isname(instr, i)]
+
+# Names of an instruction that set a value ("!, x" and "~, x" update x in
+# place, so their operand is read and written)
+def names(instr):
+	result = used(instr)
+	name = defined(instr)
+	if name != None and name not in result:
+		result.append(name)
+	return result
+
+# A numbering of the variables and temporaries of a function, in order of
+# appearance: bit(name) is the set of just that name
+class Numbering:
+	def __init__(self, graph):
+		self.index = {}
+		self.names = []
+		# The set of all variables (not temporaries), read and written by calls
+		self.globals = 0
+		for block in graph.blocks:
+			for instr in block.code:
+				for name in names(instr):
+					self.number(name)
+				if instr.op == Op.DECL and instr.kinds[1] == VAR:
+					self.number(instr.args[1])
+
+	def number(self, name):
+		if name not in self.index:
+			self.index[name] = len(self.names)
+			self.names.append(name)
+			if ir.classify(name) == VAR:
+				self.globals |= 1 << self.index[name]
+
+	def bit(self, name):
+		return 1 << self.index[name]
+
+	# The names of a set, in numbering order
+	def members(self, bits):
+		return [self.names[i] for i in elements(bits)]
+
+	def __len__(self):
+		return len(self.names)
+
+# The positions of the set bits of an int
+def elements(bits):
+	while bits:
+		low = bits & -bits
+		i = low.bit_length() - 1
+		yield i
+		bits ^= low
+
+# The set of the given positions, built in one pass
+def from_elements(positions):
+	positions = list(positions)
+	if not positions:
+		return 0
+	bits = bytearray((max(positions) >> 3) + 1)
+	for i in positions:
+		bits[i >> 3] |= 1 << (i & 7)
+	return int.from_bytes(bits, 'little')
+
+# A dataflow problem: per block gen and kill sets, indexed by block.index
+class Problem:
+	def __init__(self, graph, forward, union, boundary, initial, gen, kill):
+		self.graph = graph
+		self.forward = forward
+		# Meet by union (may) or by intersection (must)
+		self.union = union
+		# Value at the entry (forward) or at the exits (backward)
+		self.boundary = boundary
+		# Starting value of every other block: empty for a union, full for an
+		# intersection
+		self.initial = initial
+		self.gen = gen
+		self.kill = kill
+
+# The blocks in reverse postorder from the entry, then those not reachable
+def order(graph):
+	ordered = reverse_postorder(graph)
+	seen = [False] * len(graph.blocks)
+	for block in ordered:
+		seen[block.index] = True
+	return ordered + [b for b in graph.blocks if not seen[b.index]]
+
+# The blocks reachable from the entry, in reverse postorder
+def reverse_postorder(graph):
+	blocks = graph.blocks
+	if not blocks:
+		return []
+	seen = [False] * len(blocks)
+	postorder = []
+	seen[0] = True
+	stack = [(blocks[0], iter(blocks[0].succs))]
+	while stack:
+		block, succs = stack[-1]
+		for succ in succs:
+			if not seen[succ.index]:
+				seen[succ.index] = True
+				stack.append((succ, iter(succ.succs)))
+				break
+		else:
+			stack.pop()
+			postorder.append(block)
+	postorder.reverse()
+	return postorder
+
+# Solves a problem: the lists of the sets at the start (ins) and end (outs)
+# of every block
+def solve(problem):
+	graph = problem.graph
+	blocks = graph.blocks
+	n = len(blocks)
+	gen, kill = problem.gen, problem.kill
+	ins = [problem.initial] * n
+	outs = [problem.initial] * n
+	if problem.forward:
+		before, after, sources, sinks = ins, outs, 'preds', 'succs'
+		ordered = order(graph)
+	else:
+		before, after, sources, sinks = outs, ins, 'succs', 'preds'
+		ordered = order(graph)
+		ordered.reverse()
+	# The boundary flows into the entry of a forward problem and into the
+	# exits of a backward one, and is all that flows into a block without
+	# edges in
+	boundaries = [not getattr(block, sources) for block in blocks]
+	if problem.forward and n > 0:
+		boundaries[0] = True
+	worklist = list(reversed(ordered))
+	queued = [True] * n
+	union = problem.union
+	while worklist:
+		block = worklist.pop()
+		i = block.index
+		queued[i] = False
+		if boundaries[i]:
+			value = problem.boundary
+			incoming = getattr(block, sources)
+		else:
+			incoming = getattr(block, sources)
+			value = after[incoming[0].index]
+			incoming = incoming[1:]
+		for source in incoming:
+			if union:
+				value |= after[source.index]
+			else:
+				value &= after[source.index]
+		before[i] = value
+		value = gen[i] | (before[i] & ~kill[i])
+		if value != after[i]:
+			after[i] = value
+			for sink in getattr(block, sinks):
+				if not queued[sink.index]:
+					queued[sink.index] = True
+					worklist.append(sink)
+	return ins, outs
+
+# Liveness: a name is live where its value may still be read. The variables
+# are live at the end of a function, for its caller, except at the end of Main
+# (and of the call to Main), where the program ends. Returns the numbering and
+# the sets live at the start and end of every block.
+def liveness(graph, numbering=None):
+	if numbering == None:
+		numbering = Numbering(graph)
+	gen = []
+	kill = []
+	for block in graph.blocks:
+		use = 0
+		define = 0
+		for instr in reversed(block.code):
+			use, define = transfer_live(numbering, instr, use, define)
+		gen.append(use)
+		kill.append(define)
+	boundary = numbering.globals
+	if graph.name == None or graph.name == 'Main':
+		boundary = 0
+	problem = Problem(graph, False, True, boundary, 0, gen, kill)
+	ins, outs = solve(problem)
+	return numbering, ins, outs
+
+# One instruction, backwards: the names read before being written (use) and
+# those written (define) from it to the end of its block
+def transfer_live(numbering, instr, use, define):
+	if instr.op == Op.CALL:
+		# A call may read any variable, and writes none for certain
+		return use | numbering.globals, define
+	name = defined(instr)
+	if name != None:
+		bit = numbering.bit(name)
+		use &= ~bit
+		define |= bit
+	for name in used(instr):
+		use |= numbering.bit(name)
+	return use, define
+
+# The sets live after each instruction of a block, last instruction first,
+# from the set live at its end
+def live_after(numbering, block, live):
+	for instr in reversed(block.code):
+		yield live
+		live, unused = transfer_live(numbering, instr, live, 0)
+
+# Reaching definitions. A definition is an instruction assigning a name, or a
+# call for each variable it may assign; only those still in effect at the end
+# of their block can reach another one, so only those are numbered. Returns
+# their list, as (block, position in block, name), and the sets (of indexes
+# in that list) reaching the start and end of every block.
+def reaching_definitions(graph, numbering=None):
+	if numbering == None:
+		numbering = Numbering(graph)
+	calls = numbering.members(numbering.globals)
+	definitions = []
+	# The definitions of each name
+	of_name = {}
+	gen = []
+	for block in graph.blocks:
+		# The last definition of each name in the block
+		last = {}
+		for position in range(len(block.code)):
+			instr = block.code[position]
+			if instr.op == Op.CALL:
+				for name in calls:
+					last[name] = position
+			else:
+				name = defined(instr)
+				if name != None:
+					last[name] = position
+		reach = []
+		for name, position in last.items():
+			of_name.setdefault(name, []).append(len(definitions))
+			reach.append(len(definitions))
+			definitions.append((block, position, name))
+		gen.append(reach)
+	# A block kills the other definitions of the names it defines; most
+	# temporaries have only the one
+	masks = {}
+	kill = []
+	for block in graph.blocks:
+		killed = 0
+		for d in gen[block.index]:
+			name = definitions[d][2]
+			if len(of_name[name]) > 1:
+				if name not in masks:
+					masks[name] = from_elements(of_name[name])
+				killed |= masks[name]
+		kill.append(killed)
+	gen = [from_elements(reach) for reach in gen]
+	# A call does not kill: the variables may keep their values
+	problem = Problem(graph, True, True, 0, 0, gen, [kill[i] & ~gen[i] for i in range(len(kill))])
+	ins, outs = solve(problem)
+	return definitions, ins, outs
+
+# Available expressions: the pure operations ("op, t, a, b") computed on every
+# path to a point, whose operands have not been assigned since. Returns the
+# list of expressions as (op, a, b) and the sets available at the start and
+# end of every block.
+def available_expressions(graph, numbering=None):
+	if numbering == None:
+		numbering = Numbering(graph)
+	expressions = []
+	index = {}
+	# The expressions reading each name
+	reading = {}
+	for block in graph.blocks:
+		for instr in block.code:
+			if instr.op in pure and len(instr.args) == 3:
+				key = (instr.op, instr.args[1], instr.args[2])
+				if key not in index:
+					index[key] = len(expressions)
+					expressions.append(key)
+					for name in used(instr):
+						reading.setdefault(name, []).append(index[key])
+	# Those reading a variable, which a call may change
+	reading_globals = []
+	for name in numbering.members(numbering.globals):
+		reading_globals.extend(reading.get(name, ()))
+	gen = []
+	kill = []
+	for block in graph.blocks:
+		available = set()
+		killed = []
+		for instr in block.code:
+			if instr.op == Op.CALL:
+				available.difference_update(reading_globals)
+				killed.extend(reading_globals)
+				continue
+			if instr.op in pure and len(instr.args) == 3:
+				available.add(index[(instr.op, instr.args[1], instr.args[2])])
+			name = defined(instr)
+			if name != None and name in reading:
+				available.difference_update(reading[name])
+				killed.extend(reading[name])
+		gen.append(from_elements(available))
+		kill.append(from_elements(killed) & ~gen[-1])
+	problem = Problem(graph, True, False, 0, (1 << len(expressions)) - 1, gen, kill)
+	ins, outs = solve(problem)
+	return expressions, ins, outs
+
+if __name__ == '__main__':
+	if len(sys.argv) != 2:
+		print("Usage: ./dataflow.py file.ir")
+		exit(0)
+	for graph in cfg.build(ir.parse_listing(open(sys.argv[1], 'r').read())):
+		numbering, live_in, live_out = liveness(graph)
+		definitions, reach_in, reach_out = reaching_definitions(graph, numbering)
+		expressions, avail_in, avail_out = available_expressions(graph, numbering)
+		print("function", graph.name if graph.name != None else "(prologue)")
+		for block in graph.blocks:
+			i = block.index
+			print("   ", block, "line", block.line)
+			print("        live:     ", " ".join(numbering.members(live_in[i])))
+			print("        reaching: ", " ".join(d[2] + "@" + str(d[0].line + d[1]) for d in (definitions[j] for j in elements(reach_in[i]))))
+			print("        available:", " ".join(a + " " + op.value + " " + b for op, a, b in (expressions[j] for j in elements(avail_in[i]))))
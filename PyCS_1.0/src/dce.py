@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+# Dead code elimination
+#
+# An instruction whose only effect is to assign a name is removed when the
+# name is not live after it, or, over a whole program, when it is a variable
+# no instruction ever reads. Liveness is that of dataflow.liveness, but for
+# the reads of the instructions being removed, which do not count: a chain
+# of dead assignments goes at once. Over a whole program, the declarations
+# of the variables no longer named anywhere go too: codegen gives every name
+# a word of .data.
+#
+# The temporary computed for "x = <expression>" and copied right away is
+# assigned x directly instead, when it is not read again: "+, t, a, b" and
+# "=, x, t" become "+, x, a, b".
+#
+#     eliminate(code, whole=True)
+#                        the code after the pass; whole if the code is the
+#                        whole program (not one method while streaming)
+#
+# Usage: ./dce.py file.ir
+###################################################################################################
+
+import sys
+import ir
+import cfg
+import tac
+import dataflow
+from ir import Instr, Op, TEMP, VAR
+from dataflow import defined, defined_position, used, pure
+
+# Instructions doing nothing but assign their result
+removable = pure | {Op.ASSIGN, Op.MEMBER, Op.RETVAL, Op.ARG, Op.NOT, Op.BNOT}
+
+# Instructions whose result can be given another name
+renamable = pure | {Op.ASSIGN, Op.MEMBER, Op.RETVAL}
+
+def eliminate(code, whole=True):
+	read = None
+	if whole:
+		read = reads(code)
+	while True:
+		result = []
+		still = set()
+		for graph in cfg.build(code):
+			result += strip(graph, read, still)
+		code = result
+		# A variable whose reads were all removed: its assignments go too
+		if not whole or still == read:
+			break
+		read = still
+	if whole:
+		code = undeclare(code)
+	return code
+
+# The variables read by some instruction
+def reads(code):
+	names = set()
+	for instr in code:
+		for name in used(instr):
+			if ir.classify(name) == VAR:
+				names.add(name)
+	return names
+
+# The code of a graph without its dead assignments. A name is live where its
+# value may still be read by an instruction that is not itself removed
+# (strong liveness), so a chain of dead assignments goes in one pass; read
+# is the set of the variables read in the program, or None. The variables
+# the code left still reads are added to still.
+def strip(graph, read, still):
+	numbering = dataflow.Numbering(graph)
+	bit = numbering.bit
+	# Per instruction: what it assigns, what it reads, and whether it can be
+	# removed (2 if it must: a variable the program never reads)
+	facts = []
+	for block in graph.blocks:
+		entries = []
+		for instr in block.code:
+			if instr.op == Op.CALL:
+				entries.append((0, numbering.globals, 0))
+				continue
+			name = defined(instr)
+			define = bit(name) if name != None else 0
+			use = 0
+			for used_name in used(instr):
+				use |= bit(used_name)
+			dead = 0
+			if instr.op in removable and name != None:
+				dead = 1
+				if read != None and name not in read and ir.classify(name) == VAR:
+					dead = 2
+			entries.append((define, use, dead))
+		facts.append(entries)
+
+	def transfer(i, live):
+		for define, use, dead in reversed(facts[i]):
+			if dead and (dead == 2 or not live & define):
+				continue
+			live = (live & ~define) | use
+		return live
+
+	blocks = graph.blocks
+	boundary = numbering.globals
+	if graph.name == None or graph.name == 'Main':
+		boundary = 0
+	outs = [0] * len(blocks)
+	ins = [0] * len(blocks)
+	worklist = dataflow.order(graph)
+	queued = [True] * len(blocks)
+	while worklist:
+		block = worklist.pop()
+		i = block.index
+		queued[i] = False
+		live = boundary if not block.succs else 0
+		for succ in block.succs:
+			live |= ins[succ.index]
+		outs[i] = live
+		live = transfer(i, live)
+		if live != ins[i]:
+			ins[i] = live
+			for pred in block.preds:
+				if not queued[pred.index]:
+					queued[pred.index] = True
+					worklist.append(pred)
+	result = []
+	uses = 0
+	for block in blocks:
+		code, use = sweep(block, facts[block.index], outs[block.index], bit)
+		result += code
+		uses |= use
+	still.update(numbering.members(uses & numbering.globals))
+	return result
+
+# The code of a block without its dead assignments, from the set live at its
+# end, and the set of the names the code left reads
+def sweep(block, facts, live, bit):
+	code = list(block.code)
+	kept = []
+	uses = 0
+	i = len(code) - 1
+	while i >= 0:
+		instr = code[i]
+		define, use, dead = facts[i]
+		if dead and (dead == 2 or not live & define):
+			i -= 1
+			continue
+		if instr.op == Op.ASSIGN and i > 0 and instr.kinds[1] == TEMP:
+			# "op, t, ..." then "=, x, t", t dead after the copy
+			temp = instr.args[1]
+			before = code[i-1]
+			if before.op in renamable and defined(before) == temp and not live & bit(temp):
+				args = list(before.args)
+				args[defined_position(before)] = instr.args[0]
+				code[i-1] = Instr(before.op, *args)
+				# It reads what it read, and assigns what the copy did
+				facts[i-1] = (define, facts[i-1][1], dead)
+				i -= 1
+				continue
+		live = (live & ~define) | use
+		if instr.op != Op.CALL:
+			uses |= use
+		kept.append(instr)
+		i -= 1
+	kept.reverse()
+	return kept, uses
+
+# The code without the declarations of the variables it never names
+def undeclare(code):
+	named = set()
+	for instr in code:
+		if instr.op != Op.DECL:
+			named.update(instr.names())
+	return [instr for instr in code if instr.op != Op.DECL or instr.kinds[1] != VAR or instr.args[1] in named]
+
+if __name__ == '__main__':
+	if len(sys.argv) != 2:
+		print("Usage: ./dce.py file.ir")
+		exit(0)
+	sys.stdout.write(tac.listing(eliminate(ir.parse_listing(open(sys.argv[1], 'r').read()))))
@@ -0,0 +1,380 @@
+#!/usr/bin/python3
+# Hand-written parser for the C# subset, an alternative to the PLY grammar
+#
+# Recursive descent for declarations and statements, and precedence climbing
+# for the binary operators, with the levels and associativity of
+# syntax.precedence. It accepts the language of the grammar of syntax.py and
+# builds the same syntax tree, which parser.lower turns into code. One token
+# of lookahead is enough everywhere. The first syntax error is reported to
+# the compilation (as PLY would report it) and ends the parse.
+#
+# Usage: ./descent.py file.cs ...
+#     checks for every file that the tree equals that of the PLY grammar, and
+#     that its code equals that of parser.py
+###################################################################################################
+
+import sys
+import symtab
+import syntax
+from syntax import Literal, Name, Call, Index, Unary, Binary, Assign, Block, Declaration
+from syntax import Print, Read, If, While, For, Return, Method, Class, Namespace
+
+# Binding power of each binary operator of the grammar: its position in the
+# precedence table (later binds tighter), and whether it is right associative
+binary_operators = {'COR', 'CAND', 'EQ', 'NE', 'GT', 'GE', 'LT', 'LE', 'RSHIFT', 'LSHIFT', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'MOD'}
+levels = {}
+right_associative = set()
+for level, (associativity, *names) in enumerate(syntax.precedence):
+	for name in names:
+		if name in binary_operators:
+			levels[name] = level
+			if associativity == 'right':
+				right_associative.add(name)
+lowest = min(levels.values())
+
+prefix_operators = {'PLUS', 'MINUS', 'LNOT', 'NOT', 'INCREMENT', 'DECREMENT'}
+literals = {'INTCONST', 'STRCONST', 'CHCONST'}
+type_keywords = {'INT', 'CHAR', 'FLOAT'}
+
+# Raised to abandon the parse after the first syntax error
+class ParseError(Exception):
+	pass
+
+class Parser:
+	def __init__(self, lexer, context=None):
+		self.lexer = lexer
+		self.context = context
+
+	# The syntax tree of a program (a syntax.Namespace), or None after a
+	# syntax error. Like the PLY parser, it reads text if given, otherwise
+	# whatever the lexer already holds.
+	def parse(self, text=None):
+		if text != None:
+			self.lexer.input(text)
+		self.next = self.lexer.token
+		self.advance()
+		try:
+			tree = self.compilation_unit()
+			if self.tok != None:
+				self.error()
+		except ParseError:
+			return None
+		return tree
+
+	def advance(self):
+		tok = self.tok = self.next()
+		self.type = tok.type if tok != None else None
+
+	def error(self):
+		if self.context != None:
+			self.context.syntax_error(self.tok)
+		raise ParseError()
+
+	# Consumes a token of the given type and returns its value
+	def expect(self, toktype):
+		if self.type != toktype:
+			self.error()
+		value = self.tok.value
+		self.advance()
+		return value
+
+	# C.2.2 Types
+	def type_(self):
+		if self.type == 'INT':
+			t = symtab.basic_type('int', 4)
+		elif self.type == 'CHAR':
+			t = symtab.basic_type('char', 1)
+		elif self.type == 'FLOAT':
+			t = symtab.basic_type('float', 8)
+		else:
+			self.error()
+		self.advance()
+		if self.type == 'LBRACKET':
+			self.advance()
+			self.expect('RBRACKET')
+			t = symtab.array_type(t)
+		return t
+
+	# C.2.4 Expressions
+	def expression(self):
+		left = self.unary()
+		if self.type == 'EQUALS':
+			self.advance()
+			return Assign(left, self.expression())
+		return self.climb(left, lowest)
+
+	# The operators binding at least as tightly as min_level, after left
+	def climb(self, left, min_level):
+		while self.type in levels and levels[self.type] >= min_level:
+			level = levels[self.type]
+			op = self.tok.value
+			self.advance()
+			right = self.unary()
+			# Operators binding tighter go to the right operand first
+			while self.type in levels and (levels[self.type] > level or (levels[self.type] == level and self.type in right_associative)):
+				right = self.climb(right, levels[self.type])
+			left = Binary(op, left, right)
+		return left
+
+	def unary(self):
+		if self.type in prefix_operators:
+			op = self.tok.value
+			self.advance()
+			return Unary(op, self.unary())
+		return self.primary()
+
+	def primary(self):
+		toktype = self.type
+		if toktype == 'LPAREN':
+			self.advance()
+			expr = self.expression()
+			self.expect('RPAREN')
+			return expr
+		if toktype in literals:
+			value = self.tok.value
+			self.advance()
+			return Literal(value)
+		if toktype != 'IDENTIFIER':
+			self.error()
+		identifier = self.tok.value
+		lexpos = self.tok.lexpos
+		self.advance()
+		if self.type == 'LPAREN':
+			self.advance()
+			args = None
+			if self.type != 'RPAREN':
+				args = [self.expression()]
+				while self.type == 'COMMA':
+					self.advance()
+					args.append(self.expression())
+			self.expect('RPAREN')
+			return Call(identifier, args, lexpos)
+		if self.type == 'LBRACKET':
+			self.advance()
+			index = self.expression()
+			self.expect('RBRACKET')
+			return Index(identifier, index, lexpos)
+		return Name(identifier, lexpos)
+
+	# An invocation, assignment, pre-increment or pre-decrement
+	def statement_expression(self):
+		parenthesized = self.type == 'LPAREN'
+		expr = self.unary()
+		if self.type == 'EQUALS':
+			self.advance()
+			return Assign(expr, self.expression())
+		if parenthesized or not (isinstance(expr, Call) or (isinstance(expr, Unary) and expr.op in ('++', '--'))):
+			self.error()
+		return expr
+
+	def statement_expression_list(self):
+		exprs = [self.statement_expression()]
+		while self.type == 'COMMA':
+			self.advance()
+			exprs.append(self.statement_expression())
+		return exprs
+
+	# C.2.5 Statements
+	def statement(self):
+		toktype = self.type
+		if toktype in type_keywords:
+			decl = self.local_variable_declaration()
+			self.expect('STMT_TERMINATOR')
+			return decl
+		if toktype == 'WRITELINE' or toktype == 'READLINE':
+			self.advance()
+			self.expect('LPAREN')
+			argument = self.expression()
+			self.expect('RPAREN')
+			self.expect('STMT_TERMINATOR')
+			if toktype == 'WRITELINE':
+				return Print(argument)
+			return Read(argument)
+		return self.embedded_statement()
+
+	def embedded_statement(self):
+		toktype = self.type
+		if toktype == 'LBRACE':
+			return self.block()
+		if toktype == 'IF':
+			self.advance()
+			condition = self.parenthesized()
+			then = self.embedded_statement()
+			otherwise = None
+			# An else belongs to the nearest if
+			if self.type == 'ELSE':
+				self.advance()
+				otherwise = self.embedded_statement()
+			return If(condition, then, otherwise)
+		if toktype == 'WHILE':
+			self.advance()
+			condition = self.parenthesized()
+			return While(condition, self.embedded_statement())
+		if toktype == 'FOR':
+			self.advance()
+			self.expect('LPAREN')
+			if self.type in type_keywords:
+				initializer = self.local_variable_declaration()
+			else:
+				initializer = self.statement_expression_list()
+			self.expect('STMT_TERMINATOR')
+			condition = self.expression()
+			self.expect('STMT_TERMINATOR')
+			iterator = self.statement_expression_list()
+			self.expect('RPAREN')
+			return For(initializer, condition, iterator, self.embedded_statement())
+		if toktype == 'RETURN':
+			self.advance()
+			value = None
+			if self.type != 'STMT_TERMINATOR':
+				value = self.expression()
+			self.expect('STMT_TERMINATOR')
+			return Return(value)
+		expr = self.statement_expression()
+		self.expect('STMT_TERMINATOR')
+		return expr
+
+	def parenthesized(self):
+		self.expect('LPAREN')
+		expr = self.expression()
+		self.expect('RPAREN')
+		return expr
+
+	def block(self):
+		self.expect('LBRACE')
+		statements = []
+		while self.type != 'RBRACE':
+			statements.append(self.statement())
+		self.advance()
+		return Block(statements)
+
+	def local_variable_declaration(self):
+		var_type = self.type_()
+		lexpos = self.tok.lexpos if self.tok != None else None
+		return Declaration(var_type, self.variable_declarators(self.expect('IDENTIFIER'), lexpos))
+
+	# The declarators from the one whose identifier has just been read
+	def variable_declarators(self, identifier, lexpos):
+		declarators = [self.variable_declarator(identifier, lexpos)]
+		while self.type == 'COMMA':
+			self.advance()
+			lexpos = self.tok.lexpos if self.tok != None else None
+			declarators.append(self.variable_declarator(self.expect('IDENTIFIER'), lexpos))
+		return declarators
+
+	def variable_declarator(self, identifier, lexpos):
+		initializer = None
+		if self.type == 'EQUALS':
+			self.advance()
+			initializer = self.variable_initializer()
+		return (identifier, initializer, lexpos)
+
+	def variable_initializer(self):
+		if self.type != 'LBRACE':
+			return self.expression()
+		self.advance()
+		initializers = [self.variable_initializer()]
+		while self.type == 'COMMA':
+			self.advance()
+			initializers.append(self.variable_initializer())
+		self.expect('RBRACE')
+		return initializers
+
+	# Compilation unit
+	def compilation_unit(self):
+		self.expect('NAMESPACE')
+		identifier = self.expect('IDENTIFIER')
+		self.expect('LBRACE')
+		declaration = None
+		if self.type == 'CLASS':
+			declaration = self.class_declaration()
+		self.expect('RBRACE')
+		return Namespace(identifier, declaration)
+
+	# C.2.6 Classes
+	def class_declaration(self):
+		self.expect('CLASS')
+		identifier = self.expect('IDENTIFIER')
+		self.expect('LBRACE')
+		members = []
+		while self.type != 'RBRACE':
+			members.append(self.class_member_declaration())
+		self.advance()
+		return Class(identifier, members)
+
+	def class_member_declaration(self):
+		member_type = self.type_()
+		lexpos = self.tok.lexpos if self.tok != None else None
+		identifier = self.expect('IDENTIFIER')
+		if self.type != 'LPAREN':
+			declarators = self.variable_declarators(identifier, lexpos)
+			self.expect('STMT_TERMINATOR')
+			return Declaration(member_type, declarators)
+		self.advance()
+		params = None
+		if self.type != 'RPAREN':
+			params = [self.formal_parameter()]
+			while self.type == 'COMMA':
+				self.advance()
+				params.append(self.formal_parameter())
+		self.expect('RPAREN')
+		return Method(member_type, identifier, params, self.block(), lexpos)
+
+	def formal_parameter(self):
+		param_type = self.type_()
+		return (param_type, self.expect('IDENTIFIER'))
+
+# The tree of a program and the diagnostics, from the PLY grammar of
+# syntax.py or from Parser
+def parse_with(data, hand_written):
+	import lexer
+	import parser
+	import source
+	context = parser.Compilation(source.LineIndex(data))
+	lx = lexer.get_lexer().clone()
+	lx.lineno = 1
+	if hand_written:
+		return Parser(lx, context).parse(data), context.messages
+	ply = syntax.get_parser()
+	ply.errorfunc = context.syntax_error
+	return ply.parse(data, lexer=lx), context.messages
+
+if __name__ == '__main__':
+	import parser
+	if len(sys.argv) < 2:
+		print("Usage: ./descent.py file.cs ...")
+		exit(0)
+	failed = False
+	for filename in sys.argv[1:]:
+		data = open(filename, 'r').read()
+		expected, expected_messages = parse_with(data, False)
+		got, messages = parse_with(data, True)
+		if expected == None or got == None:
+			# Both must reject the program, at the same token
+			if expected != None or got != None or expected_messages[:1] != messages[:1]:
+				failed = True
+				print(filename, ": MISMATCH")
+				print("    ply:    ", expected_messages[:1] if expected == None else "accepted")
+				print("    descent:", messages[:1] if got == None else "accepted")
+			else:
+				print(filename, ": OK, rejected")
+			continue
+		if expected != got:
+			failed = True
+			print(filename, ": MISMATCH in the syntax tree")
+			continue
+		try:
+			ir = str(parser.compile_to_ir(data))
+		except Exception:
+			# Not compiled by the grammar actions of parser.py (an error, or
+			# a call above its declaration): only the trees are compared
+			print(filename, ": OK, same tree")
+			continue
+		got_ir = str(parser.compile_to_ir(data, use_descent=True))
+		if ir != got_ir:
+			failed = True
+			print(filename, ": MISMATCH in the code")
+			continue
+		print(filename, ": OK, same tree and code")
+	if failed:
+		exit(1)
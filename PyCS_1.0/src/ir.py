@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+# Intermediate representation: three address code instructions
+#
+# An instruction is an opcode and a tuple of operand names. Every operand is
+# classified once, when the instruction is made, as a temporary, a variable,
+# a literal, a label or a plain name (function, type, relational operator),
+# so later passes never have to re-parse or re-classify the text.
+# The comma separated text ("+, t3, a, b") is only a serialization of it.
+###################################################################################################
+
+import re
+import enum
+from sys import intern
+
+# Opcodes, valued by their name in the text format
+class Op(enum.Enum):
+	ADD = '+'
+	SUB = '-'
+	MUL = '*'
+	DIV = '/'
+	MOD = '%'
+	SHL = '<<'
+	SHR = '>>'
+	AND = '&&'
+	OR = '||'
+	NOT = '!'
+	BNOT = '~'
+	LT = '<'
+	GT = '>'
+	LE = '<='
+	GE = '>='
+	EQ = '=='
+	NE = '!='
+	ASSIGN = '='
+	IFGOTO = 'ifgoto'
+	GOTO = 'goto'
+	LABEL = 'label'
+	CALL = 'call'
+	PARAM = 'param'
+	POP = 'pop'
+	RETVAL = 'retval'
+	ARG = 'arg'
+	RETURN = 'return'
+	FUNCTION = 'function'
+	EXIT = 'exit'
+	PRINT = 'print'
+	READ = 'read'
+	ARRAY = 'array'
+	MEMBER = 'member'
+	UPDATE = 'update'
+	# Variable declaration, written as "<type>, <name>"
+	DECL = 'decl'
+	# SSA form only (see ssa.py): "phi, x, a, b" picks the operand of the
+	# predecessor control came from
+	PHI = 'phi'
+
+opcodes = {op.value: op for op in Op}
+
+# Operand kinds
+TEMP, VAR, LITERAL, LABEL, NAME = range(5)
+
+# The place of an operand in an instruction decides whether it is a label or
+# a name; any other operand is a value, classified by its text
+VALUE = None
+roles = {
+	Op.IFGOTO: (NAME, VALUE, VALUE, LABEL),
+	Op.GOTO: (LABEL,),
+	Op.LABEL: (LABEL,),
+	Op.CALL: (NAME,),
+	Op.FUNCTION: (NAME,),
+	Op.READ: (VALUE, NAME),
+	Op.ARRAY: (NAME, VALUE, VALUE),
+	Op.DECL: (NAME, VALUE),
+}
+
+# The relational operator of the opposite test
+inverse = {'<': '>=', '>=': '<', '>': '<=', '<=': '>', '==': '!=', '!=': '=='}
+
+# The name of a temporary. Only symtab.environ.maketemp makes them (and
+# ssa.Fresh, for the passes): a variable of the program may well be spelled
+# t1. In the text the two cannot be told apart, and a t<n> is a temporary.
+class Temp(str):
+	__slots__ = ()
+
+temp_re = re.compile(r't\d+$')
+# The words of a program spelled like temporaries
+temp_word_re = re.compile(r'\bt\d+\b')
+
+def isnumber(num):
+	return num.isdigit() or (num[1:].isdigit() and num[0] == "-")
+
+# A number as a C# int: 32 bit two's complement, wrapping on overflow
+def wrap(n):
+	return (n + 0x80000000) % 0x100000000 - 0x80000000
+
+# The value of an arithmetic, shift or relational instruction on two integer
+# operands, in the order the instruction holds them (SUB computes the second
+# minus the first). Division truncates towards zero and the remainder takes
+# the sign of the dividend, as in C#. None for what would fail at run time:
+# division by zero and the overflowing int.MinValue / -1.
+def evaluate(op, x, y):
+	x, y = wrap(x), wrap(y)
+	if op == Op.ADD:
+		return wrap(x + y)
+	if op == Op.SUB:
+		return wrap(y - x)
+	if op == Op.MUL:
+		return wrap(x * y)
+	if op == Op.DIV or op == Op.MOD:
+		if y == 0 or (x == -0x80000000 and y == -1):
+			return None
+		q = abs(x) // abs(y)
+		if (x < 0) != (y < 0):
+			q = -q
+		return q if op == Op.DIV else x - y * q
+	if op == Op.SHL:
+		return wrap(x << (y & 31))
+	if op == Op.SHR:
+		return x >> (y & 31)
+	if op == Op.LT:
+		return int(x < y)
+	if op == Op.GT:
+		return int(x > y)
+	if op == Op.LE:
+		return int(x <= y)
+	if op == Op.GE:
+		return int(x >= y)
+	if op == Op.EQ:
+		return int(x == y)
+	if op == Op.NE:
+		return int(x != y)
+	return None
+
+# Kind of a value operand. Temporaries are the Temp names, literals are
+# integer, char and string constants.
+def classify(name):
+	if isinstance(name, Temp):
+		return TEMP
+	if isnumber(name) or name[0] in '0123456789\'"':
+		return LITERAL
+	return VAR
+
+class Instr:
+	__slots__ = ('op', 'args', 'kinds')
+
+	def __init__(self, op, *args):
+		self.op = op
+		self.args = tuple(a if isinstance(a, Temp) else intern(a) for a in args)
+		layout = roles.get(op, ())
+		kinds = []
+		for i in range(len(args)):
+			role = layout[i] if i < len(layout) else VALUE
+			kinds.append(classify(args[i]) if role == VALUE else role)
+		self.kinds = tuple(kinds)
+
+	# Names of the variables and temporaries used as operands
+	def names(self):
+		return [a for a, k in zip(self.args, self.kinds) if k == TEMP or k == VAR]
+
+	def __str__(self):
+		if self.op == Op.DECL:
+			return ", ".join(self.args)
+		return ", ".join((self.op.value,) + self.args)
+
+	def __repr__(self):
+		return "Instr(" + str(self) + ")"
+
+# Reads one instruction from its text, without the line number
+def parse(text):
+	fields = [Temp(f) if temp_re.match(f) else f for f in text.split(', ')]
+	op = opcodes.get(fields[0])
+	if op == None:
+		return Instr(Op.DECL, *fields)
+	return Instr(op, *fields[1:])
+
+# Reads a numbered listing, as written by tac.listing
+def parse_listing(text):
+	code = []
+	for line in text.strip('\n').split('\n'):
+		number, sep, rest = line.partition(', ')
+		code.append(parse(rest))
+	return code
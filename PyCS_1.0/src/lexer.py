@@ -4,6 +4,8 @@
 # ------------------------------------------------------------------
 import ply.lex as lex
 import sys
+import os
+import tabcache
 
 # THE LIST OF RESERVED KEYWORDS IN C# 
 reserved = {
@@ -182,10 +184,17 @@ t_COMMA            = r','
 t_STMT_TERMINATOR  = r';'
 t_COLON            = r':'
 
+# Identifier interning: every occurrence of a name is the same str object.
+# The symbol table and the IR (temporaries, labels) intern their names the
+# same way, so dict lookups on names succeed on the identity check.
+intern = sys.intern
+
 # Identifiers and Keywords
 def t_IDENTIFIER(t):
 	r'[a-zA-Z_@][a-zA-Z_0-9]*'
 	t.type = reserved.get(t.value,'IDENTIFIER')    #  Check for reserved words
+	if t.type == 'IDENTIFIER':
+		t.value = intern(t.value)
 	return t
 
 # Integer literal
@@ -209,10 +218,38 @@ def t_PREPROCESSOR(t):
 	t.lineno += 1
 
 # Error handling rule
+# Errors are printed unless the lexer collects them in its errors list
 def t_error(t):
-	print("Illegal character '%s'" % t.value[0])
+	message = "Illegal character '%s'" % t.value[0]
+	errors = getattr(t.lexer, 'errors', None)
+	if errors != None:
+		errors.append(message)
+	else:
+		print(message)
 	t.lexer.skip(1)
 
 
 #  Build the lexer
-lexer = lex.lex()
\ No newline at end of file
+# The lexer is built on first use. Its master regex is read back from the
+# table cache (see tabcache.py) so the rules are only validated once.
+lexer = None
+
+def build_lexer():
+	module = sys.modules[__name__]
+	outputdir = tabcache.cache_dir()
+	if outputdir == None:
+		built = lex.lex(module=module)
+	else:
+		tabname = 'lextab_' + tabcache.signature(globals(), 't_')
+		lextab = tabcache.load_module(tabname, os.path.join(outputdir, tabname + '.py'))
+		if lextab == None:
+			lextab = tabname
+		built = lex.lex(module=module, optimize=1, lextab=lextab, outputdir=outputdir)
+	built.errors = None
+	return built
+
+def get_lexer():
+	global lexer
+	if lexer == None:
+		lexer = build_lexer()
+	return lexer
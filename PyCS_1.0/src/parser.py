@@ -9,37 +9,671 @@
 ###################################################################################################
 
 import sys
+import os
 import ply.yacc as yacc
 from lexer import *
-from copy import deepcopy
 import symtab
 import tac
+import ir
+from ir import Instr, Op
+import tabcache
+import syntax
+import semantic
+import descent
+import scanner
+import tokbuf
+import source
+import sccp
+import copyprop
+import dce
 
-symbol_table = symtab.environ()
 ###################################################################################################
 
-if len(sys.argv) == 2:
-	filename = sys.argv[1]
-else:
-	print("Usage: ./parser file.cs")
-	exit(0)
+# Start symbol of the grammar
+start = 'compilation_unit'
+
+# Raised when a compilation is terminated by an error
+class CompileError(Exception):
+	def __init__(self, messages):
+		Exception.__init__(self, "\n".join(messages))
+		self.messages = messages
+
+# State of one compilation: its symbol table, the line index of the program
+# (see source.LineIndex), whether literal subexpressions are folded and the
+# diagnostics, in order. The parser itself is shared by all compilations; the
+# rules reach the current one through p.parser.context. If emit is given, the
+# code of each class member is passed to it (one ir.Instr at a time) as soon
+# as the member is reduced, instead of being kept until the end. The code
+# goes through the optimizations asked for (see optimize) on the way.
+class Compilation:
+	def __init__(self, line_index=None, symbol_table=None, fold_constants=True, emit=None, propagate_constants=False, eliminate_dead_code=True):
+		if symbol_table == None:
+			symbol_table = symtab.scoped_environ()
+		self.symbol_table = symbol_table
+		self.line_index = line_index
+		self.fold_constants = fold_constants
+		self.emit = emit
+		self.propagate_constants = propagate_constants
+		self.eliminate_dead_code = eliminate_dead_code
+		self.messages = []
+
+	# "line:column" of a source offset, for diagnostics
+	def position(self, lexpos):
+		return position(self.line_index, lexpos)
+
+	# Records a diagnostic, formatted as print would
+	def report(self, *args):
+		self.messages.append(" ".join(str(arg) for arg in args))
+
+	# Records an error and terminates the compilation
+	def fatal(self, *args):
+		self.report(*args)
+		self.report("Compilation Terminated")
+		raise CompileError(self.messages)
+
+	# The code of a method, or of a whole program, after the optimizations.
+	# The variables a method does not read may be read by another one, so
+	# their assignments are only removed with the whole program at hand.
+	def optimize(self, code):
+		if self.propagate_constants:
+			code, report = sccp.propagate(code)
+		if self.eliminate_dead_code:
+			code = dce.eliminate(copyprop.propagate(code), self.emit == None)
+		return code
+
+	# A class member whose code is complete. When streaming, its code goes to
+	# emit and the scopes of its method are dropped, so that only the global
+	# names (fields and method signatures) are kept, and what is returned in
+	# its place holds no code.
+	def member(self, member):
+		if self.emit == None:
+			return member
+		for instr in self.optimize(list(tac.member_instructions(member))):
+			self.emit(instr)
+		self.symbol_table.release_scopes()
+		return {'code':tac.fragment(), 'value':None}
+
+	def syntax_error(self, p):
+		if p == None:
+			self.report("Syntax error in input! Unexpected end of input")
+		else:
+			self.report("Syntax error in input! L", self.position(p.lexpos), p)
+
+# "line:column" of a source offset in the program of a source.LineIndex
+def position(line_index, lexpos):
+	if line_index == None:
+		return "?"
+	line, column = line_index.location(lexpos)
+	return str(line) + ":" + str(column)
+
+# "line:column" of the n-th symbol of a rule (a token)
+def location(p, n):
+	return p.parser.context.position(p.lexpos(n))
+
+# Frees the temporaries holding the values of expressions, and those an
+# array element keeps for its address, once the instruction using the values
+# has been emitted
+def release(symbol_table, *exprs):
+	for expr in exprs:
+		symbol_table.free_temp(expr['value'])
+		for t in expr.get('temps', ()):
+			symbol_table.free_temp(t)
+
+# A && or || expression, as jumping code: its jumps to the true and false
+# exits (truelist, falselist) are filled in by whoever uses it, and it falls
+# through when it is false and no jump is taken. In a condition the jumps go
+# straight to the branches; anywhere else, reading its 'code' or 'value'
+# turns it into code setting its temporary to 1 or 0.
+class Condition(dict):
+	def __init__(self, symbol_table, code, truelist, falselist, result):
+		dict.__init__(self, jump=code, truelist=truelist, falselist=falselist, result=result)
+		self.symbol_table = symbol_table
+
+	def __missing__(self, key):
+		if key != 'code' and key != 'value':
+			raise KeyError(key)
+		symbol_table = self.symbol_table
+		t = self.pop('result')
+		code = self.pop('jump')
+		true = symbol_table.newlabel()
+		end = symbol_table.newlabel()
+		tac.backpatch(self.pop('truelist'), true)
+		falselist = self.pop('falselist')
+		if falselist:
+			false = symbol_table.newlabel()
+			tac.backpatch(falselist, false)
+			code += [Instr(Op.LABEL, false)]
+		code += [Instr(Op.ASSIGN, t, '0'), Instr(Op.GOTO, end)]
+		code += [Instr(Op.LABEL, true), Instr(Op.ASSIGN, t, '1'), Instr(Op.LABEL, end)]
+		self['code'] = code
+		self['value'] = t
+		return self[key]
+
+# The literal an operation on two integer literals folds to, or None if it
+# is not folded. op and the operands are those of the instruction it replaces
+# (see ir.evaluate). The literals' code is kept: it is only placeholders.
+def fold(context, op, x, y):
+	if not context.fold_constants:
+		return None
+	if x.get('category') != 'literal' or y.get('category') != 'literal':
+		return None
+	if not ir.isnumber(x['value']) or not ir.isnumber(y['value']):
+		return None
+	value = ir.evaluate(op, int(x['value']), int(y['value']))
+	if value == None:
+		return None
+	return {'code': x['code'] + y['code'], 'value': str(value), 'category': 'literal'}
+
+# Records how the value of a comparison was computed, for a condition to
+# branch on the comparison itself (see jumping)
+def compared(expr, left, right, relop):
+	expr['compare'] = (expr['code'], left['code'] + right['code'], relop, left['value'], right['value'])
+
+# The jumping code of an expression used as a condition: (code, truelist,
+# falselist), as for a Condition. Its last instruction is the last jump of
+# truelist. A comparison whose code is unchanged becomes an ifgoto on its
+# operands; any other value is tested for 1, a literal through a temporary.
+def jumping(symbol_table, expr):
+	if 'truelist' in expr:
+		symbol_table.free_temp(expr['result'])
+		return expr['jump'], expr['truelist'], expr['falselist']
+	compare = expr.get('compare')
+	if compare != None and compare[0] is expr['code']:
+		code, operands, relop, left, right = compare
+		# codegen cannot compare two immediates
+		if ir.classify(left) != ir.LITERAL or ir.classify(right) != ir.LITERAL:
+			test = Instr(Op.IFGOTO, relop, left, right, tac.HOLE)
+			symbol_table.free_temp(expr['value'])
+			return operands + [test], [test], []
+	value = expr['value']
+	code = expr['code']
+	if ir.classify(value) == ir.LITERAL:
+		value = symbol_table.maketemp('int', symbol_table.curr_table)
+		code += [Instr(Op.ASSIGN, value, expr['value'])]
+		symbol_table.free_temp(value)
+	test = Instr(Op.IFGOTO, '==', '1', value, tac.HOLE)
+	code += [test]
+	release(symbol_table, expr)
+	return code, [test], []
+
+# The jumping code of a condition that falls through when it is true, with
+# its lists of jumps taken when it is true and when it is false: the last
+# jump, taken on true, is made the opposite test, taken on false
+def branch(symbol_table, expr):
+	code, truelist, falselist = jumping(symbol_table, expr)
+	last = truelist.pop()
+	relop, left, right, label = last.args
+	last.args = (ir.inverse[relop], left, right, label)
+	return code, truelist, falselist + [last]
+
+###################################################################################################
+# Semantic actions
+#
+# The checks and the code of each construct, from the semantic values of its
+# parts. The grammar rules call them as they reduce; in AST mode lower calls
+# them on the nodes of the syntax tree, in the same order, so both modes
+# produce the same code. where is the "line:column" of the construct.
+
+def literal(value):
+	return {'code': tac.fragment(), 'value': value, 'category': 'literal'}
+
+def variable(identifier):
+	return {'code': tac.fragment(), 'value': identifier}
+
+def invocation(context, identifier, args, where):
+	symbol_table = context.symbol_table
+	expr = {'code': tac.fragment(), 'value': None}
+	name = symbol_table.lookup(identifier, symbol_table.curr_table)
+	if name != None:
+		if name.category == 'function':
+			arg_cnt = 0
+			if args != None:
+				arg_cnt = len(args)
+			if name.arg_num == arg_cnt:
+				if arg_cnt > 0:
+					for arg in args:
+						targ = symbol_table.lookup(arg['value'], symbol_table.curr_table)
+						if targ == None and arg['category'] != 'literal':
+							context.fatal('ERROR L', where, ': argument', arg['value'], 'used without declaration')
+
+						expr['code'] += arg['code']
+					for i in range(len(args)-1, -1, -1):
+						expr['code'] += [Instr(Op.PARAM, args[i]['value'])]
+					release(symbol_table, *args)
+				if name.type != 'void':
+					t = symbol_table.maketemp(name.type, symbol_table.curr_table)
+					expr['value'] = t
+					expr['code'] += [Instr(Op.CALL, identifier)]
+					expr['code'] += [Instr(Op.POP, str(arg_cnt))]
+					# Add a line here to get the value from eax register
+					expr['code'] += [Instr(Op.RETVAL, t)]
+				else:
+					expr['code'] += [Instr(Op.CALL, identifier)]
+					expr['code'] += [Instr(Op.POP, str(arg_cnt))]
+			else:
+				context.fatal("ERROR L", where, "Function", identifier, "needs exactly", name.arg_num, "parameters, given", len(args))
+		else:
+			context.fatal("ERROR L", where, "Function", identifier, "not defined as a function")
+	else:
+		context.fatal("ERROR L", where, "Function", identifier, "not defined")
+	return expr
+
+# Element access for a 1D array
+def element_access(context, identifier, index, where):
+	symbol_table = context.symbol_table
+	expr = {'code': tac.fragment(), 'value': None, 'array_element': True}
+	arr = symbol_table.lookup(identifier, symbol_table.curr_table)
+	if arr != None:
+		if arr.category == 'array':
+			expr['code'] += index['code']
+			t1 = symbol_table.maketemp('int', symbol_table.curr_table)
+			t2 = symbol_table.maketemp('int', symbol_table.curr_table)
+			t = symbol_table.maketemp(arr.type.elem_type, symbol_table.curr_table)
+			expr['code'] += [Instr(Op.ASSIGN, t1, index['value'])]
+			expr['code'] += [Instr(Op.MUL, t2, t1, str(arr.type.elem_type.width))]
+			release(symbol_table, index)
+			expr['temps'] = [t1, t2]
+			# Code up to the address computation, reused when the element is assigned to
+			expr['address_code'] = expr['code']
+			expr['address'] = [identifier, t2]
+			expr['code'] += [Instr(Op.MEMBER, t, identifier, t2)]
+			expr['value'] = t
+		else:
+			context.fatal("ERROR L", where, "Function", identifier, "not defined as an array")
+	else:
+		context.fatal("ERROR L", where, ": symbol", identifier, "used without declaration")
+	return expr
+
+# ! and ~, applied to the operand in place
+def complement(op, expr):
+	if op == '!':
+		expr['code'] += [Instr(Op.NOT, expr['value'])]
+	elif op == '~':
+		# bitwise not ~ is available in x86
+		expr['code'] += [Instr(Op.BNOT, expr['value'])]
+	return expr
+
+# Pre-increment (ADD) and pre-decrement (SUB)
+def step(context, opcode, expr):
+	symbol_table = context.symbol_table
+	t = symbol_table.maketemp('int', symbol_table.curr_table)
+	expr['code'] += [Instr(opcode, t, '1', expr['value'])]
+	expr['code'] += [Instr(Op.ASSIGN, expr['value'], t)]
+	symbol_table.free_temp(t)
+	return expr
+
+def negation(context, operand):
+	symbol_table = context.symbol_table
+	zero = {'code': tac.fragment(), 'value': '0', 'category': 'literal'}
+	expr = fold(context, Op.SUB, operand, zero)
+	if expr != None:
+		return expr
+	expr = {}
+	t = symbol_table.maketemp('int', symbol_table.curr_table)
+	expr['value'] = t
+	expr['code'] = operand['code']
+	expr['code'] += [Instr(Op.SUB, expr['value'], operand['value'], '0')]
+	release(symbol_table, operand)
+	return expr
+
+# Arithmetic, shift, relational and equality operators
+def binary(context, op, left, right):
+	symbol_table = context.symbol_table
+	opcode = ir.opcodes[op]
+	# SUB takes its operands in the opposite order
+	if opcode == Op.SUB:
+		first, second = right, left
+	else:
+		first, second = left, right
+	expr = fold(context, opcode, first, second)
+	if expr != None:
+		return expr
+	expr = {}
+	t = symbol_table.maketemp('int', symbol_table.curr_table)
+	expr['value'] = t
+	expr['code'] = left['code'] + right['code']
+	expr['code'] += [Instr(opcode, t, first['value'], second['value'])]
+	if op in ir.inverse:
+		compared(expr, left, right, op)
+	release(symbol_table, left, right)
+	return expr
+
+def conditional_and(context, left, right):
+	symbol_table = context.symbol_table
+	t = symbol_table.maketemp('int', symbol_table.curr_table)
+	code1, true1, false1 = jumping(symbol_table, left)
+	code2, true2, false2 = jumping(symbol_table, right)
+	# The right operand is evaluated only if the left one is true
+	right = symbol_table.newlabel()
+	tac.backpatch(true1, right)
+	skip = Instr(Op.GOTO, tac.HOLE)
+	code = code1 + [skip, Instr(Op.LABEL, right)] + code2
+	return Condition(symbol_table, code, true2, false1 + [skip] + false2, t)
+
+def conditional_or(context, left, right):
+	symbol_table = context.symbol_table
+	t = symbol_table.maketemp('int', symbol_table.curr_table)
+	code1, true1, false1 = jumping(symbol_table, left)
+	code2, true2, false2 = jumping(symbol_table, right)
+	# The right operand is evaluated only if the left one is false
+	code = code1
+	if false1:
+		right = symbol_table.newlabel()
+		tac.backpatch(false1, right)
+		code = code + [Instr(Op.LABEL, right)]
+	code = code + code2
+	return Condition(symbol_table, code, true1 + true2, false2, t)
+
+def assignment(context, target, value):
+	symbol_table = context.symbol_table
+	if 'array_element' not in target:
+		var = symbol_table.lookup(target['value'], symbol_table.curr_table)
+		if 'category' in value:
+			if value['category'] != 'literal':
+				val = symbol_table.lookup(value['value'], symbol_table.curr_table)
+				if val == None:
+					context.fatal('ERROR: symbol', value['value'], 'used without declaration')
+		else:
+			val = symbol_table.lookup(value['value'], symbol_table.curr_table)
+			if val == None:
+				context.fatal('ERROR: symbol', value['value'], 'used without declaration')
+		if var != None:
+			expr = {}
+			expr['value'] = target['value']
+			expr['code'] = value['code']
+			expr['code'] += target['code']
+			expr['code'] += [Instr(Op.ASSIGN, target['value'], value['value'])]
+			release(symbol_table, value)
+		else:
+			context.fatal("ERROR: symbol", target['value'], " used without declaration")
+	else:
+		# The assignment is to an array element: store instead of the member load
+		arr, offset = target['address']
+		a = [Instr(Op.UPDATE, value['value'], arr, offset)]
+		expr = {'code':None, 'value':None}
+		# The address first, left to right: its index temporaries are free
+		# again once computed, and the value may reuse them
+		expr['code'] = target['address_code']
+		expr['code'] += value['code']
+		expr['code'] += a
+		release(symbol_table, value, target)
+	return expr
+
+# Two statements, or two expressions of a statement expression list, in order
+def sequence(first, second):
+	first['code'] += second['code']
+	first['value'] = None
+	return first
+
+# A local variable or field declaration: declarators are [identifier,
+# initializer, where], the initializer an expression, a list of them for an
+# array, or None
+def declaration(context, var_type, declarators):
+	symbol_table = context.symbol_table
+	stmt = {'code':tac.fragment(), 'value':None}
+	for decl in declarators:
+		identifier, initializer, line = decl[0], decl[1], decl[2]
+		if symbol_table.lookup_in_this(identifier) == None:
+			# Generate the IR Code
+			if initializer == None:
+				# Not an array type
+				if var_type.isbasic:
+					symbol_table.insert_variable(var_type, identifier)
+					stmt['code'] += [Instr(Op.DECL, var_type.name, identifier)]
+				elif var_type.isarray and var_type.elem_type.isbasic:
+					symbol_table.insert_array(var_type, identifier)
+					stmt['code'] += [Instr(Op.ARRAY, var_type.elem_type.type_name(), var_type.length, identifier)]
+			else:
+				if var_type.isbasic:
+					symbol_table.insert_variable(var_type, identifier)
+					stmt['code'] += initializer['code']
+					stmt['code'] += [Instr(Op.ASSIGN, identifier, initializer['value'])]
+					release(symbol_table, initializer)
+				elif var_type.isarray and var_type.elem_type.isbasic:
+					# The array type of this length (also for the declarators after it)
+					var_type = symtab.array_type(var_type.elem_type, len(initializer))
+					symbol_table.insert_array(var_type, identifier)
+					stmt['code'] += [Instr(Op.ARRAY, var_type.elem_type.type_name(), str(len(initializer)), identifier)]
+					# Initialize the values in the array
+					for i in range(len(initializer)):
+						stmt['code'] += initializer[i]['code']
+						t1 = symbol_table.maketemp('int', symbol_table.curr_table)
+						t2 = symbol_table.maketemp('int', symbol_table.curr_table)
+						stmt['code'] += [Instr(Op.ASSIGN, t1, str(i))]
+						stmt['code'] += [Instr(Op.MUL, t2, t1, str(var_type.elem_type.width))]
+						stmt['code'] += [Instr(Op.UPDATE, initializer[i]['value'], identifier, t2)]
+						release(symbol_table, initializer[i])
+						symbol_table.free_temp(t1)
+						symbol_table.free_temp(t2)
+		else:
+			context.fatal("ERROR L", line, ": ", identifier, " has been declared before in this scope")
+	return stmt
+
+def print_statement(context, argument):
+	stmt = {'code':None, 'value':None}
+	stmt['code'] = argument['code']
+	stmt['code'] += [Instr(Op.PRINT, argument['value'])]
+	release(context.symbol_table, argument)
+	return stmt
+
+def read_statement(argument):
+	stmt = {'code':tac.fragment(), 'value':None}
+	stmt['code'] += [Instr(Op.READ, argument['value'], 'int')]
+	return stmt
+
+def if_statement(context, condition, then, otherwise=None):
+	symbol_table = context.symbol_table
+	stmt = {'code':tac.fragment(), 'value':None}
+	code, truelist, falselist = branch(symbol_table, condition)
+	stmt['code'] += code
+	if truelist:
+		condition['True'] = symbol_table.newlabel()
+		tac.backpatch(truelist, condition['True'])
+		stmt['code'] += [Instr(Op.LABEL, condition['True'])]
+	condition['False'] = symbol_table.newlabel()
+	tac.backpatch(falselist, condition['False'])
+	if otherwise == None:
+		stmt['code'] += then['code']
+		stmt['code'] += [Instr(Op.LABEL, condition['False'])]
+	else:
+		stmt['next'] = symbol_table.newlabel()
+		stmt['code'] += then['code']
+		stmt['code'] += [Instr(Op.GOTO, stmt['next'])]
+		stmt['code'] += [Instr(Op.LABEL, condition['False'])]
+		stmt['code'] += otherwise['code']
+		stmt['code'] += [Instr(Op.LABEL, stmt['next'])]
+	return stmt
+
+def while_statement(context, condition, body):
+	return for_statement(context, None, condition, None, body)
+
+# A for statement; a while statement has no initializer and no iterator
+def for_statement(context, initializer, condition, iterator, body):
+	symbol_table = context.symbol_table
+	stmt = {'code':tac.fragment(), 'value':None}
+	stmt['begin'] = symbol_table.newlabel()
+	stmt['next'] = symbol_table.newlabel()
+	code, truelist, falselist = branch(symbol_table, condition)
+	tac.backpatch(falselist, stmt['next'])
+	if initializer != None:
+		stmt['code'] += initializer['code']
+	stmt['code'] += [Instr(Op.LABEL, stmt['begin'])]
+	stmt['code'] += code
+	if truelist:
+		condition['True'] = symbol_table.newlabel()
+		tac.backpatch(truelist, condition['True'])
+		stmt['code'] += [Instr(Op.LABEL, condition['True'])]
+	stmt['code'] += body['code']
+	if iterator != None:
+		stmt['code'] += iterator['code']
+	stmt['code'] += [Instr(Op.GOTO, stmt['begin'])]
+	stmt['code'] += [Instr(Op.LABEL, stmt['next'])]
+	return stmt
+
+def return_statement(context, value):
+	stmt = {'code':tac.fragment(), 'value':None}
+	stmt['code'] += value['code']
+	stmt['code'] += [Instr(Op.RETURN, value['value'])]
+	release(context.symbol_table, value)
+	return stmt
+
+def method(method_name, method_params, method_body):
+	# The body is flattened once here, to patch in the argument reloads
+	body = list(method_body['code'])
+	for i in range(len(body)):
+		if method_name in str(body[i]):
+			if method_params != None:
+				for j in range(len(method_params)):
+					# parameters would have been pushed to the stack, so we just pop them off
+					body[i+1:i+1] = [Instr(Op.ARG, str(j+1), method_params[j][1])]
+
+	member = {'code':tac.fragment(), 'value':None}
+	member['code'] += [Instr(Op.FUNCTION, method_name)]
+	if method_params != None:
+		for i in range(len(method_params)):
+			# parameters would have been pushed to the stack, so we just pop them off
+			member['code'] += [Instr(Op.ARG, str(i+1), method_params[i][1])]
+	member['code'] += body
+	return member
+
+###################################################################################################
+# AST mode
+#
+# syntax.py parses the whole program into a syntax tree, semantic.py enters
+# its methods in the symbol table and checks it, and lower generates its code
+# with the semantic actions above, visiting the nodes in the order in which
+# the grammar rules would reduce them.
+
+def lower(context, node):
+	return lowerings[type(node)](context, node)
+
+def lower_call(context, node):
+	args = None
+	if node.args != None:
+		args = [lower(context, arg) for arg in node.args]
+	return invocation(context, node.identifier, args, context.position(node.lexpos))
+
+def lower_index(context, node):
+	index = lower(context, node.index)
+	return element_access(context, node.identifier, index, context.position(node.lexpos))
+
+def lower_unary(context, node):
+	operand = lower(context, node.operand)
+	if node.op == '+':
+		return operand
+	if node.op == '-':
+		return negation(context, operand)
+	if node.op == '++':
+		return step(context, Op.ADD, operand)
+	if node.op == '--':
+		return step(context, Op.SUB, operand)
+	return complement(node.op, operand)
+
+def lower_binary(context, node):
+	left = lower(context, node.left)
+	right = lower(context, node.right)
+	if node.op == '&&':
+		return conditional_and(context, left, right)
+	if node.op == '||':
+		return conditional_or(context, left, right)
+	return binary(context, node.op, left, right)
+
+def lower_block(context, node):
+	symbol_table = context.symbol_table
+	symbol_table.begin_scope()
+	stmt = {'code': tac.fragment(), 'value': None}
+	if node.statements:
+		stmt = lower(context, node.statements[0])
+		for statement in node.statements[1:]:
+			stmt = sequence(stmt, lower(context, statement))
+	symbol_table.end_scope()
+	return stmt
+
+# A statement expression list
+def lower_sequence(context, nodes):
+	expr = lower(context, nodes[0])
+	for node in nodes[1:]:
+		expr = sequence(expr, lower(context, node))
+	return expr
+
+def lower_initializer(context, initializer):
+	if initializer == None:
+		return None
+	if isinstance(initializer, list):
+		return [lower_initializer(context, i) for i in initializer]
+	return lower(context, initializer)
+
+def lower_declaration(context, node):
+	declarators = []
+	for identifier, initializer, lexpos in node.declarators:
+		declarators.append([identifier, lower_initializer(context, initializer), context.position(lexpos)])
+	return declaration(context, node.type, declarators)
+
+def lower_if(context, node):
+	condition = lower(context, node.condition)
+	then = lower(context, node.then)
+	if node.otherwise == None:
+		return if_statement(context, condition, then)
+	return if_statement(context, condition, then, lower(context, node.otherwise))
+
+def lower_while(context, node):
+	condition = lower(context, node.condition)
+	return while_statement(context, condition, lower(context, node.body))
+
+def lower_for(context, node):
+	if isinstance(node.initializer, syntax.Declaration):
+		initializer = lower(context, node.initializer)
+	else:
+		initializer = lower_sequence(context, node.initializer)
+	condition = lower(context, node.condition)
+	iterator = lower_sequence(context, node.iterator)
+	return for_statement(context, initializer, condition, iterator, lower(context, node.body))
+
+# The method was entered in the symbol table by semantic.declare
+def lower_method(context, node):
+	context.symbol_table.begin_function(node.params)
+	return method(node.identifier, node.params, lower(context, node.body))
+
+# The code of the members of the class, as the grammar rules return it
+def lower_class(context, node):
+	return [context.member(lower(context, member)) for member in node.members]
+
+def lower_namespace(context, node):
+	if node.declaration == None:
+		return None
+	return lower(context, node.declaration)
+
+lowerings = {
+	syntax.Literal: lambda context, node: literal(node.value),
+	syntax.Name: lambda context, node: variable(node.identifier),
+	syntax.Call: lower_call,
+	syntax.Index: lower_index,
+	syntax.Unary: lower_unary,
+	syntax.Binary: lower_binary,
+	syntax.Assign: lambda context, node: assignment(context, lower(context, node.target), lower(context, node.value)),
+	syntax.Block: lower_block,
+	syntax.Declaration: lower_declaration,
+	syntax.Print: lambda context, node: print_statement(context, lower(context, node.argument)),
+	syntax.Read: lambda context, node: read_statement(lower(context, node.argument)),
+	syntax.If: lower_if,
+	syntax.While: lower_while,
+	syntax.For: lower_for,
+	syntax.Return: lambda context, node: return_statement(context, lower(context, node.value)),
+	syntax.Method: lower_method,
+	syntax.Class: lower_class,
+	syntax.Namespace: lower_namespace,
+}
+
+# The code of a program from its syntax tree: the semantic passes, then lowering
+def compile_tree(context, tree):
+	semantic.declare(context, tree)
+	semantic.check(context, tree)
+	return lower(context, tree)
 
 ###################################################################################################
 
 # Precedence and associativity of operators
-precedence = (
-	('left', 'COR'),
-	('left', 'CAND'),
-	('left', 'OR'),
-	('left', 'XOR'),
-	('left', 'AND'),
-	('left', 'EQ', 'NE'),
-	('left', 'GT', 'GE', 'LT', 'LE'),
-	('left', 'RSHIFT', 'LSHIFT'),
-	('left', 'PLUS', 'MINUS'),
-	('left', 'TIMES', 'DIVIDE', 'MOD'),
-	('right', 'NOT', 'LNOT'),
-)
+from syntax import precedence
 
 # C.2 Syntactic grammar 
 
@@ -49,44 +683,43 @@ def p_type(p):
 	"""type : non_array_type
 		| array_type
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_non_array_type(p):
 	"""non_array_type : simple_type
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_simple_type(p):
 	"""simple_type : primitive_type
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_primitive_type(p):
 	"""primitive_type : numeric_type
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_numeric_type(p):
 	"""numeric_type : integral_type
 		| floating_point_type
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_integral_type(p):
 	"""integral_type : INT 
 					| CHAR
 	"""
 	if p[1] == 'int':
-		p[0] = symtab.type('int', True, False, False, 4, None, None)
+		p[0] = symtab.basic_type('int', 4)
 	elif p[1] == 'char':
-		p[0] = symtab.type('char', True, False, False, 1, None, None)
+		p[0] = symtab.basic_type('char', 1)
 
 def p_floating_point_type(p):
 	"""floating_point_type : FLOAT 
 	"""
-	p[0] = symtab.type('float', True, False, False, 8, None, None)
+	p[0] = symtab.basic_type('float', 8)
 
-#(self, name, isbasic, isarray, ispointer, width, elem_type, length)
 def p_array_type(p):
 	"""array_type : simple_type LBRACKET RBRACKET
 	"""
-	p[0] = symtab.type(None, False, True, False, None, p[1], None)
+	p[0] = symtab.array_type(p[1])
 
 # C.2.4 Expressions 
 def p_argument_list(p):
@@ -94,131 +727,65 @@ def p_argument_list(p):
 		| argument_list COMMA argument
 	"""
 	if len(p) == 2:
-		p[0] = [deepcopy(p[1])]
+		p[0] = [p[1]]
 	else:
-		p[0] = deepcopy(p[1]) + [deepcopy(p[3])]	
+		p[0] = p[1]
+		p[0].append(p[3])	
 def p_argument(p):
 	"""argument : expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_primary_expression(p):
 	"""primary_expression : parenthesized_expression
 		| primary_expression_no_parenthesis
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_primary_expression_no_parenthesis_1(p):
 	"""primary_expression_no_parenthesis : literal
 		| invocation_expression
 		| element_access
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_primary_expression_no_parenthesis_2(p):
 	"""primary_expression_no_parenthesis : IDENTIFIER
 	"""
-	p[0] = {'code':[], 'value':p[1]}
+	p[0] = variable(p[1])
 
 def p_literal(p):
 	"""literal : INTCONST
 				| STRCONST
 				| CHCONST
 	"""
-	p[0] = {}
-	p[0]['code'] = [""]
-	p[0]['value'] = p[1]
-	p[0]['category'] = 'literal'
+	p[0] = literal(p[1])
 
 def p_parenthesized_expression(p):
 	"""parenthesized_expression : LPAREN expression RPAREN
 	"""
-	p[0] = deepcopy(p[2])
+	p[0] = p[2]
 
 
 def p_invocation_expression(p):
 	"""invocation_expression : IDENTIFIER LPAREN argument_list_opt RPAREN
 	"""
-	p[0] = {'code':[], 'value':None}
-	name = symbol_table.lookup(p[1], symbol_table.curr_table)
-	# print(name)
-	if name != None:
-		if name['category'] == 'function':
-			arg_cnt = 0
-			if p[3] != None:
-				arg_cnt = len(p[3])
-			if name['arg_num'] == arg_cnt:
-				# print(name['arg_num'], arg_cnt)
-				if arg_cnt > 0:
-					for arg in p[3]:
-						targ = symbol_table.lookup(arg['value'], symbol_table.curr_table)
-						# print(arg, targ, p[1])
-						if targ == None and arg['category'] != 'literal':
-							print('ERROR L', p.lineno(1), ': argument', arg['value'], 'used without declaration')
-							print('Compilation Terminated')
-							exit()
-
-						p[0]['code'] += arg['code']
-					for i in range(len(p[3])-1, -1, -1):
-						p[0]['code'] += ['param, ' + p[3][i]['value']]
-				if name['type'] != 'void':
-					t = symbol_table.maketemp(name['type'], symbol_table.curr_table)
-					p[0]['value'] = t
-					p[0]['code'] += ['call, ' + p[1]]
-					p[0]['code'] += ['pop, ' + str(arg_cnt)]
-					# Add a line here to get the value from eax register
-					p[0]['code'] += ['retval, ' + t]
-				else:
-					p[0]['code'] += ['call, ' + p[1]]
-					p[0]['code'] += ['pop, ' + str(arg_cnt)]
-			else:
-				print("ERROR L", p.lineno(1), "Function", p[1], "needs exactly", name['arg_num'], "parameters, given", len(p[3]))
-				print("Compilation Terminated")
-				exit()
-		else:
-			print("ERROR L", p.lineno(1), "Function", p[1], "not defined as a function")
-			print("Compilation Terminated")
-			exit()			
-	else:
-		print("ERROR L", p.lineno(1), "Function", p[1], "not defined")
-		print("Compilation Terminated")
-		exit()
-
+	p[0] = invocation(p.parser.context, p[1], p[3], location(p, 1))
 
 def p_argument_list_opt(p):
 	"""argument_list_opt : empty 
 		| argument_list
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 
 def p_element_access(p):
 	"""element_access : IDENTIFIER LBRACKET expression RBRACKET
 	"""
-	# Element Access for a 1D array
-	p[0] = {'code':[], 'value':None, 'array_element':True}
-	arr = symbol_table.lookup(p[1], symbol_table.curr_table)
-	if arr != None:
-		if arr['category'] == 'array':
-			p[0]['code'] += p[3]['code']
-			t1 = symbol_table.maketemp('int', symbol_table.curr_table)
-			t2 = symbol_table.maketemp('int', symbol_table.curr_table)
-			t = symbol_table.maketemp(arr['type'].elem_type, symbol_table.curr_table)
-			p[0]['code'] += ['=, ' + t1 + ', ' + p[3]['value']]
-			p[0]['code'] += ['*, ' + t2 + ', ' + t1 + ', ' + str(arr['type'].elem_type.width)]
-			p[0]['code'] += ['member, ' + t + ', ' + p[1] + ', ' + t2]
-			p[0]['value'] = t
-		else:
-			print("ERROR L", p.lineno(1), "Function", p[1], "not defined as an array")
-			print("Compilation Terminated")
-			exit()
-	else:
-		print("ERROR L", p.lineno(1), ": symbol", p[0], "used without declaration")
-		print("Compilation Terminated")
-		exit()
+	p[0] = element_access(p.parser.context, p[1], p[3], location(p, 1))
 
 def p_postfix_expression(p):
 	"""postfix_expression : primary_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_unary_expression_not_plusminus(p):
 	"""unary_expression_not_plusminus : postfix_expression
@@ -226,30 +793,19 @@ def p_unary_expression_not_plusminus(p):
 		| NOT unary_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = deepcopy(p[2])
-		if p[1] == '!':
-			p[0]['code'] += ["!, " + p[0]['value']]
-		elif p[1] == '~':
-			# bitwise not ~ is available in x86
-			p[0]['code'] += ["~, " + p[0]['value']]
+		p[0] = complement(p[1], p[2])
 
 def p_pre_increment_expression(p):
 	"""pre_increment_expression : INCREMENT unary_expression
 	"""
-	t = symbol_table.maketemp('int', symbol_table.curr_table)
-	p[0] = deepcopy(p[2])
-	p[0]['code'] += ["+, " + t + ", 1, " + p[0]['value']]
-	p[0]['code'] += ["=, " + p[0]['value'] + ", " + t]
+	p[0] = step(p.parser.context, Op.ADD, p[2])
 
 def p_pre_decrement_expression(p):
 	"""pre_decrement_expression : DECREMENT unary_expression
 	"""
-	t = symbol_table.maketemp('int', symbol_table.curr_table)
-	p[0] = deepcopy(p[2])
-	p[0]['code'] += ["-, " + t + ", 1, " + p[0]['value']]
-	p[0]['code'] += ["=, " + p[0]['value'] + ", " + t]
+	p[0] = step(p.parser.context, Op.SUB, p[2])
 
 def p_unary_expression(p):
 	"""unary_expression : unary_expression_not_plusminus
@@ -258,17 +814,12 @@ def p_unary_expression(p):
 		| pre_increment_expression
 		| pre_decrement_expression
 	"""
-	p[0] = {}
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
-	else:
-		if p[1] == '+':
-			p[0] = deepcopy(p[2])
-		elif p[1] == '-':
-			t = symbol_table.maketemp('int', symbol_table.curr_table)
-			p[0]['value'] = t
-			p[0]['code'] = deepcopy(p[2]['code'])
-			p[0]['code'] += ["-, " + p[0]['value'] + ", " + p[2]['value'] + ", 0"]
+		p[0] = p[1]
+	elif p[1] == '+':
+		p[0] = p[2]
+	elif p[1] == '-':
+		p[0] = negation(p.parser.context, p[2])
 
 def p_multiplicative_expression(p):
 	"""multiplicative_expression : unary_expression
@@ -277,22 +828,9 @@ def p_multiplicative_expression(p):
 		| multiplicative_expression MOD unary_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		if p[2] == '*':		
-			p[0]['value'] = t
-			p[0]['code'] = p[1]['code'] + p[3]['code']
-			p[0]['code'] += ["*, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
-		elif p[2] == '/':		
-			p[0]['value'] = t
-			p[0]['code'] = p[1]['code'] + p[3]['code']
-			p[0]['code'] += ["/, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
-		elif p[2] == '%':
-			p[0]['value'] = t
-			p[0]['code'] = p[1]['code'] + p[3]['code']
-			p[0]['code'] += ["%, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]			
+		p[0] = binary(p.parser.context, p[2], p[1], p[3])
 
 def p_additive_expression(p):
 	"""additive_expression : multiplicative_expression
@@ -300,18 +838,9 @@ def p_additive_expression(p):
 		| additive_expression MINUS multiplicative_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		p[0]['value'] = t
-		#print(p[1], p[2], p[3])
-		p[0]['code'] = p[1]['code'] + p[3]['code']
-		if p[2] == '+':
-			p[0]['code'] += ["+, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
-		elif p[2] == '-':
-			p[0]['code'] += ["-, " + t + ", " + p[3]['value'] + ", " + p[1]['value']]
-
+		p[0] = binary(p.parser.context, p[2], p[1], p[3])
 
 def p_shift_expression(p):
 	"""shift_expression : additive_expression 
@@ -319,17 +848,9 @@ def p_shift_expression(p):
 		| shift_expression RSHIFT additive_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		p[0]['value'] = t
-		p[0]['code'] = p[1]['code'] + p[3]['code']
-		if p[2] == '<<':
-			p[0]['code'] += ["<<, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
-		elif p[2] == '>>':
-			p[0]['code'] += [">>, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
-
+		p[0] = binary(p.parser.context, p[2], p[1], p[3])
 
 def p_relational_expression(p):
 	"""relational_expression : shift_expression
@@ -339,13 +860,9 @@ def p_relational_expression(p):
 		| relational_expression LE shift_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		p[0]['value'] = t
-		p[0]['code'] = p[1]['code'] + p[3]['code']
-		p[0]['code'] += [p[2] + ", " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
+		p[0] = binary(p.parser.context, p[2], p[1], p[3])
 
 def p_equality_expression(p):
 	"""equality_expression : relational_expression
@@ -353,105 +870,52 @@ def p_equality_expression(p):
 		| equality_expression NE relational_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		p[0]['value'] = t
-		p[0]['code'] = p[1]['code'] + p[3]['code']
-		if p[2] == '==':
-			p[0]['code'] += ["==, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
-		elif p[2] == '!=':
-			p[0]['code'] += ["!=, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
+		p[0] = binary(p.parser.context, p[2], p[1], p[3])
 
 def p_and_expression(p):
 	"""and_expression : equality_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_exclusive_or_expression(p):
 	"""exclusive_or_expression : and_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_inclusive_or_expression(p):
 	"""inclusive_or_expression : exclusive_or_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_conditional_and_expression(p):
 	"""conditional_and_expression : inclusive_or_expression
 		| conditional_and_expression CAND inclusive_or_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		p[0]['value'] = t
-		p[0]['code'] = p[1]['code'] + p[3]['code']
-		p[0]['code'] += ["&&, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]	
+		p[0] = conditional_and(p.parser.context, p[1], p[3])
 
 def p_conditional_or_expression(p):
 	"""conditional_or_expression : conditional_and_expression
 		| conditional_or_expression COR conditional_and_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		t = symbol_table.maketemp('int', symbol_table.curr_table)
-		p[0]['value'] = t
-		p[0]['code'] = p[1]['code'] + p[3]['code']
-		p[0]['code'] += ["||, " + t + ", " + p[1]['value'] + ", " + p[3]['value']]
+		p[0] = conditional_or(p.parser.context, p[1], p[3])
 
 def p_conditional_expression(p):
 	"""conditional_expression : conditional_or_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_assignment(p):
 	"""assignment : unary_expression assignment_operator expression
 	"""
-	# print(p[1], p[2], p[3])
-	if 'array_element' not in p[1]:
-		var = symbol_table.lookup(p[1]['value'], symbol_table.curr_table)
-		if 'category' in p[3]:
-			if p[3]['category'] != 'literal':
-				val = symbol_table.lookup(p[3]['value'], symbol_table.curr_table)
-				if val == None:
-					print('ERROR: symbol', p[3]['value'], 'used without declaration')
-					print('Compilation Terminated')
-					exit()
-		else:
-			val = symbol_table.lookup(p[3]['value'], symbol_table.curr_table)
-			if val == None:
-				print('ERROR: symbol', p[3]['value'], 'used without declaration')
-				print('Compilation Terminated')
-				exit()		
-		if var != None:
-			p[0] = {}
-			p[0]['value'] = p[1]['value']
-			p[0]['code'] = p[3]['code']
-			p[0]['code'] += p[1]['code']
-			p[0]['code'] += ['=, ' + p[1]['value'] + ", " + p[3]['value']]
-		else:
-			print("ERROR: symbol", p[1]['value'], " used without declaration")
-			print("Compilation Terminated")
-			exit()
-	else:
-		# The assignment is to an array element
-		# print("\n\n", 'member' in p[1]['code'][-1], "\n\n")
-		s = p[1]['code'][-1].split(', ')
-		s[0] = 'update'
-		s[1] = p[3]['value']
-		a = [s[0] + ", " + s[1] + ", " + s[2] + ", " + s[3]]
-		# print(a)
-		# print("\n\n", p[1]['code'][-1], "\n\n")
-		p[0] = {'code':None, 'value':None}
-		p[0]['code'] = p[3]['code']
-		p[0]['code'] += p[1]['code'][:-1]
-		p[0]['code'] += a
+	p[0] = assignment(p.parser.context, p[1], p[3])
 
 def p_assignment_operator(p):
 	"""assignment_operator : EQUALS 
@@ -461,15 +925,15 @@ def p_expression(p):
 	"""expression : conditional_expression
 		| assignment
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 # def p_constant_expression(p):
 # 	"""constant_expression : expression
 # 	"""
-# 	p[0] = deepcopy(p[1])
+# 	p[0] = p[1]
 def p_boolean_expression(p):
 	"""boolean_expression : expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 # C.2.5 Statements 
 def p_statement(p):
 	"""statement : declaration_statement
@@ -477,7 +941,7 @@ def p_statement(p):
 		| print_statement
 		| read_statement
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_embedded_statement(p):
 	"""embedded_statement : block
 		| expression_statement
@@ -485,32 +949,34 @@ def p_embedded_statement(p):
 		| iteration_statement
 		| jump_statement
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_block(p):
 	"""block : LBRACE begin_scope statement_list_opt RBRACE
 	"""
-	p[0] = deepcopy(p[3])
+	context = p.parser.context
+	symbol_table = context.symbol_table
+	p[0] = p[3]
 	symbol_table.end_scope()
 	
 def p_statement_list_opt(p):
 	"""statement_list_opt : empty 
 		| statement_list
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_statement_list(p):
 	"""statement_list : statement
 		| statement_list statement
 	"""
-	p[0] = deepcopy(p[1])
-	if len(p) == 3:
-		p[0]['code'] += p[2]['code']
-		p[0]['value'] = None
+	if len(p) == 2:
+		p[0] = p[1]
+	else:
+		p[0] = sequence(p[1], p[2])
 
 def p_declaration_statement(p):
 	"""declaration_statement : local_variable_declaration STMT_TERMINATOR
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 
 # -----------------------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -518,47 +984,7 @@ def p_declaration_statement(p):
 def p_local_variable_declaration(p):
 	"""local_variable_declaration : type variable_declarators
 	"""
-	# print(p[1], p[2])
-	p[0] = {'code':[], 'value':None}
-	# Implement variable declaration here
-	var_type = p[1]
-	for decl in p[2]:
-		identifier, initializer, line = decl[0], decl[1], decl[2]
-		if symbol_table.lookup_in_this(identifier) == None:
-			# Generate the IR Code
-			if initializer == None:
-				# Not an array type
-				if var_type.isbasic:
-					symbol_table.insert_variable(var_type, identifier)
-					p[0]['code'] += [var_type.name + ", " + identifier]
-				elif var_type.isarray and var_type.elem_type.isbasic:
-					symbol_table.insert_array(var_type, identifier)
-					p[0]['code'] += ["array, " + var_type.elem_type.type_name() + ", " + var_type.length + ", " + identifier]
-			else:
-				if var_type.isbasic:
-					symbol_table.insert_variable(var_type, identifier)
-					p[0]['code'] += initializer['code']
-					p[0]['code'] += ["=, " + identifier + ", " + initializer['value']]
-				elif var_type.isarray and var_type.elem_type.isbasic:
-					# Update the length and width attributes of this array_type instance
-					var_type.length = len(initializer)
-					var_type.width = len(initializer)*var_type.elem_type.width
-					symbol_table.insert_array(var_type, identifier)
-					p[0]['code'] += ["array, " + var_type.elem_type.type_name() + ", " + str(len(initializer)) + ", " + identifier]
-					# Initialize the values in the array
-					for i in range(len(initializer)):
-						p[0]['code'] += initializer[i]['code']
-						t1 = symbol_table.maketemp('int', symbol_table.curr_table)
-						t2 = symbol_table.maketemp('int', symbol_table.curr_table)
-						p[0]['code'] += ['=, ' + t1 + ', ' + str(i)]
-						p[0]['code'] += ['*, ' + t2 + ', ' + t1 + ', ' + str(var_type.elem_type.width)]
-						p[0]['code'] += ['update, ' + initializer[i]['value'] + ', ' + identifier + ', ' + t2]						
-						# p[0]['code'] += ['=, ' + identifier + ", " + str(i) + ", " + initializer[i]['value']]
-		else:
-			print("ERROR L", line, ": ", identifier, " has been declared before in this scope")
-			print("Compilation Terminated")
-			exit()
-
+	p[0] = declaration(p.parser.context, p[1], p[2])
 
 # -----------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -567,94 +993,74 @@ def p_variable_declarators(p):
 		| variable_declarators COMMA variable_declarator
 	"""
 	if len(p) == 2:
-		p[0] = [deepcopy(p[1])]
+		p[0] = [p[1]]
 	else:
-		p[0] = deepcopy(p[1])
-		p[0].append(deepcopy(p[3]))
+		p[0] = p[1]
+		p[0].append(p[3])
 def p_variable_declarator(p):
 	"""variable_declarator : IDENTIFIER
 		| IDENTIFIER EQUALS variable_initializer 
 	"""
 	if len(p) == 2:
-		p[0] = [p[1], None, p.lineno(1)]
+		p[0] = [p[1], None, location(p, 1)]
 	else:
-		p[0] = [p[1], deepcopy(p[3]), p.lineno(1)]
+		p[0] = [p[1], p[3], location(p, 1)]
 def p_variable_initializer(p):
 	"""variable_initializer : expression
 		| array_initializer
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_array_initializer(p):
 	"""array_initializer : LBRACE variable_initializer_list RBRACE
 	"""
-	p[0] = deepcopy(p[2])
+	p[0] = p[2]
 
 def p_variable_initializer_list(p):
 	"""variable_initializer_list : variable_initializer
 		| variable_initializer_list COMMA variable_initializer
 	"""
 	if len(p) == 2:
-		p[0] = [deepcopy(p[1])]
+		p[0] = [p[1]]
 	else:
-		p[0] = deepcopy(p[1]) + [deepcopy(p[3])]
+		p[0] = p[1]
+		p[0].append(p[3])
 
 
 def p_print_statement(p):
 	"""print_statement : WRITELINE LPAREN argument RPAREN STMT_TERMINATOR
 	"""
-	p[0] = {'code':None, 'value':None}
-	p[0]['code'] = p[3]['code']
-	p[0]['code'] += ['print, ' + p[3]['value']]
+	p[0] = print_statement(p.parser.context, p[3])
 
 def p_read_statement(p):
 	"""read_statement : READLINE LPAREN argument RPAREN STMT_TERMINATOR
 	"""
-	p[0] = {'code':[], 'value':None}
-	
-	p[0]['code'] += ['read, ' + p[3]['value'] + ', int']
+	p[0] = read_statement(p[3])
 
 def p_expression_statement(p):
 	"""expression_statement : statement_expression STMT_TERMINATOR
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_statement_expression(p):
 	"""statement_expression : invocation_expression
 		| assignment
 		| pre_increment_expression
 		| pre_decrement_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_selection_statement(p):
 	"""selection_statement : if_statement
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_if_statement(p):
 	"""if_statement : IF LPAREN boolean_expression RPAREN embedded_statement
 		| IF LPAREN boolean_expression RPAREN embedded_statement ELSE embedded_statement
 	"""
-	p[0] = {'code':[], 'value':None}
 	if len(p) == 6:
-		p[3]['True'] = symbol_table.newlabel()
-		p[3]['False'] = symbol_table.newlabel()
-		p[0]['code'] += p[3]['code']
-		p[0]['code'] += ['ifgoto, ==, 1, ' + p[3]['value'] + ", " + p[3]['True']]
-		p[0]['code'] += ['goto, ' + p[3]['False']]
-		p[0]['code'] += ['label, ' + p[3]['True']]
-		p[0]['code'] += p[5]['code']
-		p[0]['code'] += ['label, ' + p[3]['False']]
+		p[0] = if_statement(p.parser.context, p[3], p[5])
 	else:
-		p[3]['True'] = symbol_table.newlabel()
-		p[0]['next'] = symbol_table.newlabel()
-		p[0]['code'] += p[3]['code']
-		p[0]['code'] += ['ifgoto, ==, 1, ' + p[3]['value'] + ", " + p[3]['True']]
-		p[0]['code'] += p[7]['code']
-		p[0]['code'] += ['goto, ' + p[0]['next']]
-		p[0]['code'] += ['label, ' + p[3]['True']]
-		p[0]['code'] += p[5]['code']
-		p[0]['code'] += ['label, ' + p[0]['next']]			
-	
+		p[0] = if_statement(p.parser.context, p[3], p[5], p[7])
 
 def p_iteration_statement(p):
 	"""iteration_statement : while_statement
@@ -664,72 +1070,43 @@ def p_iteration_statement(p):
 def p_while_statement(p):
 	"""while_statement : WHILE LPAREN boolean_expression RPAREN embedded_statement
 	"""
-	p[0] = {'code':[], 'value':None}
-	p[0]['begin'] = symbol_table.newlabel()
-	p[0]['next'] = symbol_table.newlabel()
-	p[3]['True'] = symbol_table.newlabel()
-	p[0]['code'] += ['label, ' + p[0]['begin']]
-	p[0]['code'] += p[3]['code']
-	p[0]['code'] += ['ifgoto, ==, 1, ' + p[3]['value'] + ", " + p[3]['True']]
-	p[0]['code'] += ['goto, ' + p[0]['next']]
-	p[0]['code'] += ['label, ' + p[3]['True']]
-	p[0]['code'] += p[5]['code']
-	p[0]['code'] += ['goto, ' + p[0]['begin']]
-	p[0]['code'] += ['label, ' + p[0]['next']]
+	p[0] = while_statement(p.parser.context, p[3], p[5])
 
 def p_for_statement(p):
 	"""for_statement : FOR LPAREN for_initializer STMT_TERMINATOR for_condition STMT_TERMINATOR for_iterator RPAREN embedded_statement
 	"""
-	p[0] = {'code':[], 'value':None}
-	p[0]['begin'] = symbol_table.newlabel()
-	p[0]['next'] = symbol_table.newlabel()
-	p[5]['True'] = symbol_table.newlabel()
-	p[0]['code'] += p[3]['code']
-	p[0]['code'] += ['label, ' + p[0]['begin']]
-	p[0]['code'] += p[5]['code']
-	p[0]['code'] += ['ifgoto, ==, 1, ' + p[5]['value'] + ", " + p[5]['True']]
-	p[0]['code'] += ['goto, ' + p[0]['next']]
-	p[0]['code'] += ['label, ' + p[5]['True']]
-	p[0]['code'] += p[9]['code']
-	p[0]['code'] += p[7]['code']
-	p[0]['code'] += ['goto, ' + p[0]['begin']]
-	p[0]['code'] += ['label, ' + p[0]['next']]
+	p[0] = for_statement(p.parser.context, p[3], p[5], p[7], p[9])
 
 def p_for_initializer(p):
 	"""for_initializer : local_variable_declaration
 		| statement_expression_list
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_for_condition(p):
 	"""for_condition : boolean_expression
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_for_iterator(p):
 	"""for_iterator : statement_expression_list
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_statement_expression_list(p):
 	"""statement_expression_list : statement_expression
 		| statement_expression_list COMMA statement_expression
 	"""
 	if len(p) == 2:
-		p[0] = deepcopy(p[1])
+		p[0] = p[1]
 	else:
-		p[0] = {}
-		p[0]['code'] = p[1]['code']
-		p[0]['code'] += p[3]['code']
-		p[0]['value'] = None
+		p[0] = sequence(p[1], p[3])
 
 def p_jump_statement(p):
 	"""jump_statement : return_statement
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_return_statement(p):
 	"""return_statement : RETURN expression_opt STMT_TERMINATOR
 	"""
-	p[0] = {'code':[], 'value':None}
-	p[0]['code'] += p[2]['code']
-	p[0]['code'] += ['return, ' + p[2]['value']]
+	p[0] = return_statement(p.parser.context, p[2])
 
 def p_expression_opt(p):
 	"""expression_opt : empty 
@@ -742,24 +1119,12 @@ def p_compilation_unit(p):
 	"""compilation_unit : namespace_declaration
 	"""
 	p[0] = p[1]
-	# print("PARSING DONE !!!")
-	# # symbol_table.print_symbol_table()
-	# # tac.generate_ircode(p[0]['code'])
-	# print("----------------------------------------------------------------------")
-	# print("SYMBOL TABLE")
-	# print("----------------------------------------------------------------------")
-	# symbol_table.print_symbol_table(symtab.base_table)
-	# print("")
-	# print("----------------------------------------------------------------------")
-	# print("THREE ADDRESS CODE")
-	# print("----------------------------------------------------------------------")
-	tac.print_tac(p[0])
 
 def p_namespace_member_declarations_opt(p):
 	"""namespace_member_declarations_opt : empty 
 		| namespace_member_declarations
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 def p_namespace_declaration(p):
 	"""namespace_declaration :  NAMESPACE IDENTIFIER namespace_body
 	"""
@@ -794,7 +1159,7 @@ def p_class_declaration(p):
 def p_class_body(p):
 	"""class_body : LBRACE class_member_declarations_opt RBRACE
 	"""
-	p[0] = deepcopy(p[2])
+	p[0] = p[2]
 def p_class_member_declarations_opt(p):
 	"""class_member_declarations_opt : empty 
 		| class_member_declarations
@@ -805,97 +1170,33 @@ def p_class_member_declarations(p):
 		| class_member_declarations class_member_declaration
 	"""
 	if len(p) == 2:
-		p[0] = [deepcopy(p[1])]
+		p[0] = [p[1]]
 	else:
-		p[0] = deepcopy(p[1]) + [deepcopy(p[2])]
+		p[0] = p[1]
+		p[0].append(p[2])
 def p_class_member_declaration(p):
 	"""class_member_declaration : field_declaration
 		| method_declaration
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p.parser.context.member(p[1])
 
 def p_field_declaration(p):
 	"""field_declaration :  type variable_declarators STMT_TERMINATOR
 	"""
-	# print(p[1], p[2])
-	p[0] = {'code':[], 'value':None}
-	# Implement variable declaration here
-	var_type = p[1]
-	for decl in p[2]:
-		identifier, initializer, line = decl[0], decl[1], decl[2]
-		if symbol_table.lookup_in_this(identifier) == None:
-			# Generate the IR Code
-			if initializer == None:
-				# Not an array type
-				if var_type.isbasic:
-					symbol_table.insert_variable(var_type, identifier)
-					p[0]['code'] += [var_type.name + ", " + identifier]
-				elif var_type.isarray and var_type.elem_type.isbasic:
-					symbol_table.insert_array(var_type, identifier)
-					p[0]['code'] += ["array, " + var_type.elem_type.type_name() + ", " + var_type.length + ", " + identifier]
-			else:
-				if var_type.isbasic:
-					symbol_table.insert_variable(var_type, identifier)
-					p[0]['code'] += initializer['code']
-					p[0]['code'] += ["=, " + identifier + ", " + initializer['value']]
-				elif var_type.isarray and var_type.elem_type.isbasic:
-					# Update the length and width attributes of this array_type instance
-					var_type.length = len(initializer)
-					var_type.width = len(initializer)*var_type.elem_type.width
-					symbol_table.insert_array(var_type, identifier)
-					p[0]['code'] += ["array, " + var_type.elem_type.type_name() + ", " + str(len(initializer)) + ", " + identifier]
-					# Initialize the values in the array
-					for i in range(len(initializer)):
-						p[0]['code'] += initializer[i]['code']
-						t1 = symbol_table.maketemp('int', symbol_table.curr_table)
-						t2 = symbol_table.maketemp('int', symbol_table.curr_table)
-						p[0]['code'] += ['=, ' + t1 + ', ' + str(i)]
-						p[0]['code'] += ['*, ' + t2 + ', ' + t1 + ', ' + str(var_type.elem_type.width)]
-						p[0]['code'] += ['update, ' + initializer[i]['value'] + ', ' + identifier + ', ' + t2]						
-						# p[0]['code'] += ['=, ' + identifier + ", " + str(i) + ", " + initializer[i]['value']]
-		else:
-			print("ERROR L", line, ": ", identifier, " has been declared before in this scope")
-			print("Compilation Terminated")
-			exit()
-		
+	p[0] = declaration(p.parser.context, p[1], p[2])
+
 def p_method_declaration(p):
 	"""method_declaration : method_header method_body
 	"""
-	return_type = p[1][0]
-	method_name = p[1][1]
-	method_params = p[1][2]
-	method_body = p[2]
-
-	for i in range(len(p[2]['code'])):
-		if method_name in p[2]['code'][i]:
-			if method_params != None:
-				for j in range(len(method_params)):
-					# parameters would have been pushed to the stack, so we just pop them off
-					p[2]['code'] = p[2]['code'][:i+1] + ['arg, ' + str(j+1) + ', ' + method_params[j][1]] + p[2]['code'][i+1:]
-
-
-	p[0] = {'code':[], 'value':None}
-	p[0]['code'] += ['function, ' + method_name]
-	if method_params != None:
-		for i in range(len(method_params)):
-			# parameters would have been pushed to the stack, so we just pop them off
-			p[0]['code'] += ['arg, ' + str(i+1) + ', ' + method_params[i][1]]
-	p[0]['code'] += p[2]['code']
-	# type, category, arg_num are the parameters needed in the symbol table entry against the function name
-	
+	p[0] = method(p[1][1], p[1][2], p[2])
 
 def p_method_header(p):
 	"""method_header :  type IDENTIFIER LPAREN formal_parameter_list_opt RPAREN
 	"""
+	symbol_table = p.parser.context.symbol_table
 	p[0] = [p[1], p[2], p[4]]
-	method_params = p[4]
-	param_types = []
-	param_num = 0
-	if method_params != None:
-		param_types = [param[0] for param in method_params]
-		param_num = len(method_params)
-	symbol_table.insert_function(p[2], p[1], param_types, param_num)
-
+	semantic.declare_method(symbol_table, p[1], p[2], p[4])
+	symbol_table.begin_function(p[4])
 
 def p_formal_parameter_list_opt(p):
 	"""formal_parameter_list_opt : empty 
@@ -906,16 +1207,17 @@ def p_formal_parameter_list_opt(p):
 def p_method_body(p):
 	"""method_body : block
 	"""
-	p[0] = deepcopy(p[1])
+	p[0] = p[1]
 
 def p_formal_parameter_list(p):
 	"""formal_parameter_list : formal_parameter
 		| formal_parameter_list COMMA formal_parameter
 	"""
 	if len(p) == 2:
-		p[0] = [deepcopy(p[1])]
+		p[0] = [p[1]]
 	else:
-		p[0] = deepcopy(p[1]) + [deepcopy(p[3])]
+		p[0] = p[1]
+		p[0].append(p[3])
 
 def p_formal_parameter(p):
 	"""formal_parameter : type IDENTIFIER
@@ -926,6 +1228,8 @@ def p_formal_parameter(p):
 def p_begin_scope(p):
 	"""begin_scope : empty
 	"""
+	context = p.parser.context
+	symbol_table = context.symbol_table
 	p[0] = p[1]
 	symbol_table.begin_scope()
 	#print("returned from begin_scope")
@@ -934,15 +1238,188 @@ def p_empty(p):
 	"""empty :"""
 	p[0] = None
 
-# Error rule for syntax errors
+# Error rule for syntax errors. compile_to_ir reports them to the compilation
+# instead (see Compilation.syntax_error); without one, the line index is that
+# of a streaming lexer or is built from the text of the token's lexer.
 def p_error(p):
-    print("Syntax error in input!", p)
+	if p == None:
+		print("Syntax error in input! Unexpected end of input")
+	else:
+		lexer = getattr(p, 'lexer', None)
+		line_index = getattr(lexer, 'lines', None)
+		if line_index == None and getattr(lexer, 'lexdata', None) != None:
+			line_index = source.LineIndex(lexer.lexdata)
+		print("Syntax error in input! L", position(line_index, p.lexpos), p)
 
 ###################################################################################################
 # Build the parser now
-parser = yacc.yacc(start='compilation_unit', debug=True, optimize=False)
-
-# Read the input program
-inputfile = open(filename, 'r')
-data = inputfile.read()
-result = parser.parse(data, debug=0)
\ No newline at end of file
+# The LALR tables are loaded from the table cache (see tabcache.py) and only
+# regenerated when the grammar changes. parser.out is written only on request.
+parser = None
+
+def build_parser(debug=False):
+	picklefile = None
+	outputdir = tabcache.cache_dir()
+	if outputdir != None:
+		picklefile = os.path.join(outputdir, 'parsetab_' + tabcache.signature(globals(), 'p_') + '.pickle')
+		# A cached table would skip grammar construction and so the debug output
+		if debug and os.path.exists(picklefile):
+			os.remove(picklefile)
+	# The unused tokens PLY warns about are the C# tokens the grammar does not
+	# cover yet: only --debug shows them
+	errorlog = None
+	if not debug:
+		errorlog = yacc.NullLogger()
+	return yacc.yacc(debug=debug, picklefile=picklefile, outputdir=os.path.dirname(os.path.abspath(__file__)), errorlog=errorlog)
+
+def get_parser(debug=False):
+	global parser
+	if parser == None or debug:
+		parser = build_parser(debug)
+	return parser
+
+# The three address code of a program, as returned by compile_to_ir
+class Program:
+	def __init__(self, code, symbols, messages):
+		# ir.Instr list, starting with the call to Main
+		self.code = code
+		# The symtab.environ of the program
+		self.symbols = symbols
+		# Diagnostics that did not terminate the compilation
+		self.messages = messages
+
+	# The numbered listing
+	def __str__(self):
+		return tac.listing(self.code)
+
+# Compiles the text of a program to three address code.
+# lexer is a lexer for it (default: a fresh copy of the PLY lexer), and
+# line_index the source.LineIndex of the program if it is not built here,
+# and symbol_table the environ to fill (default: a symtab.scoped_environ).
+# With fold_constants, operations on integer literals are computed here.
+# With use_ast, the program is parsed into a syntax tree first (see lower);
+# use_descent builds the tree with the hand-written parser of descent.py.
+# If emit is given, it is called with every instruction as soon as the class
+# member holding it has been compiled, and the Program returned has no code.
+# The passes then see one member at a time: they keep the assignments to
+# variables, which another member may read, and the declarations of the
+# fields, so the code may be longer than without emit.
+# Raises CompileError if no code could be generated.
+def compile_to_ir(source_text, lexer=None, line_index=None, symbol_table=None, fold_constants=True, use_ast=False, use_descent=False, emit=None, propagate_constants=False, eliminate_dead_code=True):
+	if lexer == None:
+		lexer = get_lexer().clone()
+		lexer.lineno = 1
+	if line_index == None and source_text != None:
+		line_index = source.LineIndex(source_text)
+	context = Compilation(line_index, symbol_table, fold_constants, emit, propagate_constants, eliminate_dead_code)
+	# Temporaries are globals of the assembly, and a variable spelled like
+	# one may be declared after it was handed out: the names are kept from
+	# maketemp from the start
+	if source_text != None:
+		context.symbol_table.variables.update(ir.temp_word_re.findall(source_text))
+	elif hasattr(lexer, 'findall'):
+		context.symbol_table.variables.update(lexer.findall(ir.temp_word_re))
+	if emit != None:
+		for instr in tac.prologue():
+			emit(instr)
+	if hasattr(lexer, 'errors'):
+		lexer.errors = context.messages
+	if use_descent:
+		try:
+			result = descent.Parser(lexer, context).parse(source_text)
+		finally:
+			if hasattr(lexer, 'errors'):
+				lexer.errors = None
+	else:
+		if use_ast:
+			parser = syntax.get_parser()
+		else:
+			parser = get_parser()
+		parser.context = context
+		parser.errorfunc = context.syntax_error
+		try:
+			result = parser.parse(source_text, lexer=lexer, debug=0)
+		finally:
+			parser.context = None
+			if hasattr(lexer, 'errors'):
+				lexer.errors = None
+	if (use_ast or use_descent) and result != None:
+		result = compile_tree(context, result)
+	if result == None:
+		raise CompileError(context.messages)
+	if emit != None:
+		return Program([], context.symbol_table, context.messages)
+	return Program(context.optimize(list(tac.instructions(result))), context.symbol_table, context.messages)
+
+# The flags of the command line of parser.py, which compiler.py takes too
+flags = ['--debug', '--scanner', '--tokbuf', '--stream', '--tree-symtab', '--no-fold', '--ast', '--descent', '--emit-early', '--sccp', '--no-dce']
+
+# Compiles the program of a file to three address code as the flags of a
+# command line (argv) say. With --emit-early every instruction is passed to
+# emit as soon as its class member is compiled, and the Program returned
+# has no code. Raises CompileError.
+def compile_file(filename, argv, emit=None):
+	if '--scanner' in argv:
+		# The hand-written scanner, same tokens as the PLY lexer
+		lexer = scanner.Scanner()
+	else:
+		lexer = get_lexer()
+		lexer.lineno = 1
+	# Read the input program
+	if '--stream' in argv:
+		# Feed the lexer from the memory-mapped file chunk by chunk
+		lexer = source.StreamLexer(lexer, filename)
+		data = None
+	else:
+		inputfile = open(filename, 'r')
+		data = inputfile.read()
+	# Build the line index once, from the whole input or chunk by chunk
+	if '--stream' in argv:
+		line_index = lexer.lines
+	else:
+		line_index = source.LineIndex(data)
+	if '--tokbuf' in argv:
+		# Lex the whole program into a compact token buffer first
+		lexer = tokbuf.TokenBuffer().fill(lexer, data).reader()
+	if '--debug' in argv:
+		get_parser(True)
+	symbol_table = None
+	if '--tree-symtab' in argv:
+		# Lookups walk the tree of scope tables
+		symbol_table = symtab.environ()
+	# Keep operations on literals as instructions
+	fold_constants = '--no-fold' not in argv
+	# Build the syntax tree of the program, check it, then generate its code
+	use_ast = '--ast' in argv
+	# Build the tree with the hand-written parser instead of the PLY grammar
+	use_descent = '--descent' in argv
+	# Emit each method as soon as it is parsed. Dead code elimination then
+	# keeps the stores to variables: the code is not that of the default.
+	if '--emit-early' not in argv:
+		emit = None
+	# Sparse conditional constant propagation (see sccp.py)
+	propagate_constants = '--sccp' in argv
+	# Keep the copies and the dead code (see copyprop.py and dce.py)
+	eliminate_dead_code = '--no-dce' not in argv
+	return compile_to_ir(data, lexer, line_index, symbol_table, fold_constants, use_ast, use_descent, emit, propagate_constants, eliminate_dead_code)
+
+if __name__ == '__main__':
+	args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+	unknown = [arg for arg in sys.argv[1:] if arg.startswith('--') and arg not in flags]
+	if len(args) == 1 and unknown == []:
+		filename = args[0]
+	else:
+		print("Usage: ./parser [--debug] [--scanner] [--tokbuf] [--stream] [--tree-symtab] [--no-fold] [--ast] [--descent] [--emit-early] [--sccp] [--no-dce] file.cs")
+		exit(0)
+
+	try:
+		# With --emit-early the code of each method is written as soon as
+		# it is parsed
+		program = compile_file(filename, sys.argv, tac.listing_writer(sys.stdout))
+	except CompileError as e:
+		for message in e.messages:
+			print(message)
+		exit(0)
+	for message in program.messages:
+		print(message)
+	sys.stdout.write(str(program))
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------
+#  Hand-written scanner for C#, an alternative to the PLY lexer
+# ------------------------------------------------------------------
+# Produces exactly the token stream of lexer.py (same types, values,
+# lineno and lexpos) but dispatches on the first character of each
+# token instead of trying one large regex alternation. Operators are
+# matched by maximal munch over the operator rules of lexer.py.
+#
+# Usage: ./scanner.py file.cs ...
+#     compares the token stream against the PLY lexer for every file
+import re
+import sys
+import ply.lex as lex
+import lexer as plylexer
+
+reserved = plylexer.reserved
+
+# Operators and delimiters, taken from the plain string rules of lexer.py
+operators = {}
+for name in plylexer.tokens:
+	rule = getattr(plylexer, 't_' + name, None)
+	if isinstance(rule, str) and name not in ['INTCONST', 'STRCONST', 'CHCONST']:
+		operators[re.sub(r'\\(.)', r'\1', rule)] = name
+
+# Character classes used for the first character dispatch
+SPACE, IDENT, DIGIT, STRING, CHAR, SLASH, HASH, OPERATOR = range(8)
+dispatch = {}
+for c in plylexer.t_ignore + '\n':
+	dispatch[c] = SPACE
+for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_@':
+	dispatch[c] = IDENT
+for c in '0123456789':
+	dispatch[c] = DIGIT
+for op in operators:
+	dispatch[op[0]] = OPERATOR
+dispatch['"'] = STRING
+dispatch['\''] = CHAR
+dispatch['/'] = SLASH
+dispatch['#'] = HASH
+
+space_re = re.compile('[' + plylexer.t_ignore + '\n]+')
+ident_re = re.compile(r'[a-zA-Z_@][a-zA-Z_0-9]*')
+# Matches like the PLY rule: at most one suffix character is taken
+int_re = re.compile(r'\d+[uUlL]?')
+str_re = re.compile(plylexer.t_STRCONST)
+char_re = re.compile(plylexer.t_CHCONST)
+
+class Scanner:
+	def __init__(self):
+		self.lexdata = ""
+		self.lexpos = 0
+		self.lexlen = 0
+		self.lineno = 1
+		# Collects the errors instead of printing them when set to a list
+		self.errors = None
+
+	def input(self, data):
+		self.lexdata = data
+		self.lexpos = 0
+		self.lexlen = len(data)
+
+	def token(self):
+		data = self.lexdata
+		pos = self.lexpos
+		end = self.lexlen
+		while pos < end:
+			c = data[pos]
+			kind = dispatch.get(c)
+			if kind == SPACE:
+				# Skip a whole run of blanks and newlines at once
+				m = space_re.match(data, pos)
+				self.lineno += data.count('\n', pos, m.end())
+				pos = m.end()
+				continue
+			elif kind == IDENT:
+				m = ident_re.match(data, pos)
+				value = m.group()
+				toktype = reserved.get(value, 'IDENTIFIER')
+				if toktype == 'IDENTIFIER':
+					value = plylexer.intern(value)
+			elif kind == DIGIT:
+				m = int_re.match(data, pos)
+				value = m.group()
+				toktype = 'INTCONST'
+			elif kind == OPERATOR or kind == SLASH:
+				if kind == SLASH and data.startswith('/*', pos):
+					close = data.find('*/', pos + 2)
+					if close != -1:
+						# Comments are dropped without counting their lines (as in lexer.py)
+						pos = close + 2
+						continue
+				value = data[pos:pos+3]
+				toktype = operators.get(value)
+				if toktype == None:
+					value = value[:2]
+					toktype = operators.get(value)
+					if toktype == None:
+						value = c
+						toktype = operators[c]
+			elif kind == HASH and data.find('\n', pos) != -1:
+				# Preprocessor lines are dropped along with their newline (as in lexer.py)
+				pos = data.find('\n', pos) + 1
+				continue
+			elif kind == STRING and str_re.match(data, pos):
+				value = str_re.match(data, pos).group()
+				toktype = 'STRCONST'
+			elif kind == CHAR and char_re.match(data, pos):
+				value = char_re.match(data, pos).group()
+				toktype = 'CHCONST'
+			else:
+				message = "Illegal character '%s'" % c
+				if self.errors != None:
+					self.errors.append(message)
+				else:
+					print(message)
+				pos += 1
+				continue
+			tok = lex.LexToken()
+			tok.type = toktype
+			tok.value = value
+			tok.lineno = self.lineno
+			tok.lexpos = pos
+			self.lexpos = pos + len(value)
+			return tok
+		self.lexpos = pos
+		return None
+
+	def __iter__(self):
+		return self
+
+	def __next__(self):
+		t = self.token()
+		if t == None:
+			raise StopIteration
+		return t
+
+# Returns the list of (type, value, lineno, lexpos) tuples produced by a lexer
+def token_stream(lexer, data):
+	lexer.input(data)
+	lexer.lineno = 1
+	return [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+
+if __name__ == '__main__':
+	if len(sys.argv) < 2:
+		print("Usage: ./scanner.py file.cs ...")
+		exit(0)
+	failed = False
+	for filename in sys.argv[1:]:
+		data = open(filename, 'r').read()
+		expected = token_stream(plylexer.get_lexer(), data)
+		got = token_stream(Scanner(), data)
+		if expected == got:
+			print(filename, ": OK,", len(got), "tokens")
+			continue
+		failed = True
+		for i in range(min(len(expected), len(got))):
+			if expected[i] != got[i]:
+				break
+		else:
+			i = min(len(expected), len(got))
+		print(filename, ": MISMATCH at token", i)
+		print("    ply:    ", expected[i] if i < len(expected) else None)
+		print("    scanner:", got[i] if i < len(got) else None)
+	if failed:
+		exit(1)
@@ -0,0 +1,291 @@
+#!/usr/bin/python3
+# Sparse conditional constant propagation (Wegman and Zadeck)
+#
+# Every function is put in SSA form (ssa.py) and each version gets a value:
+# not known yet, a constant, or not a constant. Values go through =, the
+# arithmetic, shift and relational operators (ir.evaluate), && and ||, and
+# the phis, which only meet the operands of the edges found executable so
+# far; an ifgoto on constants makes only one of its edges executable. The
+# versions no instruction assigns (the value at the entry, a variable after
+# a call) and those of read, member, retval and arg are not constants.
+#
+# The results are applied to the original code, not the SSA form:
+#     - an operand holding a constant is replaced by the literal
+#     - an ifgoto whose outcome is known becomes a goto, or is removed
+#     - the blocks no executable edge reaches are removed
+#     - a temporary holding a constant is not assigned any more once none of
+#       its uses is left; a variable is a global, so it is still assigned
+#       (the literal, if it was computed)
+#
+#     propagate(code)    the code after the pass, and a Report
+#
+# Usage: ./sccp.py file.ir
+#     prints what the pass removed, then the code after it
+###################################################################################################
+
+import sys
+import ir
+import cfg
+import ssa
+import tac
+import dataflow
+from ir import Instr, Op, TEMP, LITERAL
+from dataflow import defined, used_positions, isname, pure
+
+# A value that is not a constant
+BOTTOM = 'bottom'
+
+# Operands where a literal can stand for a name: codegen takes an immediate
+# there. Both operands of an operation never become literals.
+replaceable = {Op.ASSIGN: (1,), Op.IFGOTO: (1, 2), Op.PRINT: (0,), Op.PARAM: (0,), Op.RETURN: (0,), Op.UPDATE: (0,)}
+for op in pure:
+	replaceable[op] = (1, 2)
+
+# What the pass removed from a program
+class Report:
+	def __init__(self):
+		self.instructions = 0
+		self.branches = 0
+		self.blocks = 0
+
+	def __str__(self):
+		return "%d instructions, %d branches, %d unreachable blocks removed" % (self.instructions, self.branches, self.blocks)
+
+# The lattice values of the versions of a graph in SSA form, and which blocks
+# are executable
+class Solver:
+	def __init__(self, graph):
+		self.graph = graph
+		self.values = {}
+		self.executable = [False] * len(graph.blocks)
+		self.edges = set()
+		# The instructions reading each version, as (block, position)
+		self.readers = {}
+		# The number of instructions assigning each name: a name assigned
+		# more than once (kept out of SSA form) is never a constant
+		self.assignments = {}
+		for block in graph.blocks:
+			for i in range(len(block.code)):
+				instr = block.code[i]
+				for name in dataflow.used(instr):
+					self.readers.setdefault(name, []).append((block, i))
+				name = defined(instr)
+				if name != None:
+					self.assignments[name] = self.assignments.get(name, 0) + 1
+
+	# The value of an operand: an int, BOTTOM, or None if not known yet
+	def value(self, instr, i):
+		name = instr.args[i]
+		kind = instr.kinds[i]
+		if kind == LITERAL:
+			return ir.wrap(int(name)) if ir.isnumber(name) else BOTTOM
+		if self.assignments.get(name) != 1:
+			return BOTTOM
+		return self.values.get(name)
+
+	def solve(self):
+		blocks = self.graph.blocks
+		if not blocks:
+			return
+		flow = [(None, blocks[0])]
+		work = []
+		while flow or work:
+			while flow:
+				source, block = flow.pop()
+				if source != None:
+					if (source.index, block.index) in self.edges:
+						continue
+					self.edges.add((source.index, block.index))
+				if self.executable[block.index]:
+					# Only the phis see the new edge
+					for i in range(len(block.code)):
+						if block.code[i].op == Op.PHI:
+							self.visit(block, i, flow, work)
+					continue
+				self.executable[block.index] = True
+				for i in range(len(block.code)):
+					self.visit(block, i, flow, work)
+				last = block.code[-1] if block.code else None
+				if last == None or last.op != Op.IFGOTO:
+					for succ in block.succs:
+						flow.append((block, succ))
+			while work:
+				block, i = work.pop()
+				if self.executable[block.index]:
+					self.visit(block, i, flow, work)
+
+	def visit(self, block, i, flow, work):
+		instr = block.code[i]
+		op = instr.op
+		if op == Op.IFGOTO:
+			outcome = self.branch(instr)
+			target = self.graph.labels[instr.args[-1]]
+			for succ in block.succs:
+				jumps = succ is target
+				falls = succ.index == block.index + 1
+				if outcome == BOTTOM or (outcome == 1 and jumps) or (outcome == 0 and falls):
+					flow.append((block, succ))
+			return
+		name = defined(instr)
+		if name == None:
+			return
+		if op == Op.PHI:
+			value = None
+			for j in range(len(block.preds)):
+				if (block.preds[j].index, block.index) in self.edges:
+					value = meet(value, self.value(instr, 1 + j))
+		elif op == Op.ASSIGN:
+			value = self.value(instr, 1)
+		elif op in pure:
+			value = self.compute(op, self.value(instr, 1), self.value(instr, 2))
+		else:
+			value = BOTTOM
+		old = self.values.get(name)
+		if value != old and value != None and old != BOTTOM:
+			self.values[name] = value
+			work.extend(self.readers.get(name, ()))
+
+	# The outcome of an ifgoto: 1 (jumps), 0 (falls through), BOTTOM or None
+	def branch(self, instr):
+		x = self.value(instr, 1)
+		y = self.value(instr, 2)
+		if x == BOTTOM or y == BOTTOM:
+			return BOTTOM
+		if x == None or y == None:
+			return None
+		return ir.evaluate(ir.opcodes[instr.args[0]], x, y)
+
+	def compute(self, op, x, y):
+		if op == Op.AND and (x == 0 or y == 0):
+			return 0
+		if op == Op.OR and (x == 1 or y == 1):
+			return 1
+		if x == BOTTOM or y == BOTTOM:
+			return BOTTOM
+		if x == None or y == None:
+			return None
+		if op == Op.AND or op == Op.OR:
+			# Truth values only: codegen computes them bitwise
+			if x not in (0, 1) or y not in (0, 1):
+				return BOTTOM
+			return x & y if op == Op.AND else x | y
+		value = ir.evaluate(op, x, y)
+		if value == None:
+			return BOTTOM
+		return value
+
+def meet(a, b):
+	if a == None:
+		return b
+	if b == None or a == b:
+		return a
+	return BOTTOM
+
+# The code after the pass, and a Report
+def propagate(code):
+	report = Report()
+	fresh = ssa.Fresh(code)
+	result = []
+	for graph in cfg.build(code):
+		original = [list(block.code) for block in graph.blocks]
+		ssa.construct(graph, fresh)
+		solver = Solver(graph)
+		solver.solve()
+		result += rewrite(graph, original, solver, report)
+	return tidy(result, report), report
+
+# The original code of a graph with the values found in its SSA form
+def rewrite(graph, original, solver, report):
+	def constant(name):
+		value = solver.values.get(name)
+		if value == None or value == BOTTOM or solver.assignments.get(name) != 1:
+			return None
+		return value
+
+	# The versions still read once the constants are in, which must keep
+	# their assignment: the operands left in place, and the operands of
+	# phis whose result is needed
+	needed = set()
+	phis = []
+	blocks = []
+	for block in graph.blocks:
+		if not solver.executable[block.index]:
+			report.blocks += 1
+			report.instructions += len(block.code) - sum(1 for instr in block.code if instr.op == Op.PHI)
+			continue
+		pairs = zip(original[block.index], [instr for instr in block.code if instr.op != Op.PHI])
+		code = []
+		for before, instr in pairs:
+			if instr.op == Op.IFGOTO:
+				outcome = solver.branch(instr)
+				if outcome == 1 or outcome == 0:
+					report.branches += 1
+					if outcome == 1:
+						code.append((Instr(Op.GOTO, before.args[-1]), instr))
+					else:
+						report.instructions += 1
+					continue
+			args = list(before.args)
+			literals = [k == LITERAL for k in instr.kinds]
+			for j in replaceable.get(instr.op, ()):
+				if j >= len(args) or not isname(instr, j):
+					continue
+				value = constant(instr.args[j])
+				if value == None:
+					continue
+				if (instr.op in pure or instr.op == Op.IFGOTO) and any(literals[k] for k in (1, 2) if k != j):
+					continue
+				args[j] = str(value)
+				literals[j] = True
+			if tuple(args) != before.args:
+				before = Instr(before.op, *args)
+			code.append((before, instr))
+			for j in used_positions(before.op, len(args)):
+				if isname(before, j):
+					needed.add(instr.args[j])
+		for instr in block.code:
+			if instr.op == Op.PHI:
+				phis.append((block, instr))
+		blocks.append(code)
+	# A phi whose result is read, or is not a constant, reads its operands
+	work = [instr for block, instr in phis if instr.args[0] in needed or constant(instr.args[0]) == None]
+	by_result = {instr.args[0]: instr for block, instr in phis}
+	while work:
+		phi = work.pop()
+		for name in phi.args[1:]:
+			if name not in needed:
+				needed.add(name)
+				if name in by_result:
+					work.append(by_result[name])
+	result = []
+	for code in blocks:
+		for before, instr in code:
+			name = defined(instr)
+			value = constant(name) if name != None else None
+			if value != None and (instr.op in pure or instr.op == Op.ASSIGN):
+				if ir.classify(before.args[0]) == TEMP and name not in needed:
+					report.instructions += 1
+					continue
+				if before.op != Op.ASSIGN or before.args[1] != str(value):
+					before = Instr(Op.ASSIGN, before.args[0], str(value))
+			result.append(before)
+	return result
+
+# Removes the jumps to the label right after them, left by folded branches
+def tidy(code, report):
+	result = []
+	for i in range(len(code)):
+		instr = code[i]
+		if instr.op == Op.GOTO and i + 1 < len(code) and code[i+1].op == Op.LABEL and code[i+1].args[0] == instr.args[0]:
+			report.instructions += 1
+			continue
+		result.append(instr)
+	return result
+
+if __name__ == '__main__':
+	if len(sys.argv) != 2:
+		print("Usage: ./sccp.py file.ir")
+		exit(0)
+	code, report = propagate(ir.parse_listing(open(sys.argv[1], 'r').read()))
+	print(report)
+	sys.stdout.write(tac.listing(code))
@@ -0,0 +1,183 @@
+#!/usr/bin/python3
+# Semantic passes over the syntax tree of a program (AST mode, see syntax.py)
+#
+#     declare(context, tree)    enters every method of the class in the symbol
+#                               table, so a method can be called above its
+#                               declaration
+#     check(context, tree)      resolves the names used in every method and
+#                               sets the type of each expression, reporting
+#                               undeclared names, calls that do not match a
+#                               method and indexing of what is not an array
+#
+# Both run on the whole tree before any code is generated (parser.lower), and
+# neither changes it except for the types. Errors terminate the compilation,
+# as those of the grammar actions do.
+###################################################################################################
+
+import symtab
+import syntax
+
+int_type = symtab.basic_type('int', 4)
+char_type = symtab.basic_type('char', 1)
+
+# Enters a method in the symbol table; params are (type, identifier), or None
+def declare_method(symbol_table, return_type, identifier, params):
+	param_types = []
+	param_num = 0
+	if params != None:
+		param_types = [param[0] for param in params]
+		param_num = len(params)
+	symbol_table.insert_function(identifier, return_type, param_types, param_num)
+
+# The members of the class of a program
+def members(tree):
+	if tree.declaration == None:
+		return []
+	return tree.declaration.members
+
+def declare(context, tree):
+	for member in members(tree):
+		if isinstance(member, syntax.Method):
+			declare_method(context.symbol_table, member.return_type, member.identifier, member.params)
+
+def check(context, tree):
+	Checker(context).check(tree)
+
+# Walks the tree with its own stack of scopes (dictionaries from a name to its
+# symtab.symbol), the methods coming from the symbol table. As in the grammar
+# actions, a for statement has no scope of its own and a field is visible
+# from its declaration on.
+class Checker:
+	def __init__(self, context):
+		self.context = context
+		self.scopes = [{}]
+
+	def error(self, lexpos, *args):
+		self.context.fatal("ERROR L", self.context.position(lexpos), *args)
+
+	def lookup(self, identifier):
+		for scope in reversed(self.scopes):
+			entry = scope.get(identifier)
+			if entry != None:
+				return entry
+		symbol_table = self.context.symbol_table
+		return symbol_table.lookup(identifier, symbol_table.curr_table)
+
+	def check(self, tree):
+		for member in members(tree):
+			if isinstance(member, syntax.Method):
+				self.method(member)
+			else:
+				self.declaration(member)
+
+	def method(self, node):
+		scope = {}
+		if node.params != None:
+			for param_type, identifier in node.params:
+				scope[identifier] = symtab.symbol(param_type, 'variable')
+		self.scopes.append(scope)
+		self.statement(node.body)
+		self.scopes.pop()
+
+	def declaration(self, node):
+		for identifier, initializer, lexpos in node.declarators:
+			var_type = node.type
+			if isinstance(initializer, list):
+				self.initializers(initializer)
+				if var_type.isarray:
+					var_type = symtab.array_type(var_type.elem_type, len(initializer))
+			elif initializer != None:
+				self.expression(initializer)
+			if var_type.isarray:
+				entry = symtab.symbol(var_type, 'array')
+			else:
+				entry = symtab.symbol(var_type, 'variable')
+			self.scopes[-1][identifier] = entry
+
+	def initializers(self, initializers):
+		for initializer in initializers:
+			if isinstance(initializer, list):
+				self.initializers(initializer)
+			else:
+				self.expression(initializer)
+
+	def statement(self, node):
+		if isinstance(node, syntax.Block):
+			self.scopes.append({})
+			for statement in node.statements:
+				self.statement(statement)
+			self.scopes.pop()
+		elif isinstance(node, syntax.Declaration):
+			self.declaration(node)
+		elif isinstance(node, (syntax.Print, syntax.Read)):
+			self.expression(node.argument)
+		elif isinstance(node, syntax.If):
+			self.expression(node.condition)
+			self.statement(node.then)
+			if node.otherwise != None:
+				self.statement(node.otherwise)
+		elif isinstance(node, syntax.While):
+			self.expression(node.condition)
+			self.statement(node.body)
+		elif isinstance(node, syntax.For):
+			if isinstance(node.initializer, syntax.Declaration):
+				self.declaration(node.initializer)
+			else:
+				self.expressions(node.initializer)
+			self.expression(node.condition)
+			self.expressions(node.iterator)
+			self.statement(node.body)
+		elif isinstance(node, syntax.Return):
+			if node.value != None:
+				self.expression(node.value)
+		else:
+			self.expression(node)
+
+	def expressions(self, nodes):
+		for node in nodes:
+			self.expression(node)
+
+	def expression(self, node):
+		if isinstance(node, syntax.Literal):
+			if node.value[0] == "'":
+				node.type = char_type
+			elif node.value[0] != '"':
+				node.type = int_type
+		elif isinstance(node, syntax.Name):
+			entry = self.lookup(node.identifier)
+			if entry == None:
+				self.error(node.lexpos, ": symbol", node.identifier, "used without declaration")
+			node.type = entry.type
+		elif isinstance(node, syntax.Call):
+			args = node.args or []
+			self.expressions(args)
+			entry = self.lookup(node.identifier)
+			if entry == None:
+				self.error(node.lexpos, "Function", node.identifier, "not defined")
+			if entry.category != 'function':
+				self.error(node.lexpos, "Function", node.identifier, "not defined as a function")
+			if entry.arg_num != len(args):
+				self.error(node.lexpos, "Function", node.identifier, "needs exactly", entry.arg_num, "parameters, given", len(args))
+			node.type = entry.type
+		elif isinstance(node, syntax.Index):
+			self.expression(node.index)
+			entry = self.lookup(node.identifier)
+			if entry == None:
+				self.error(node.lexpos, ": symbol", node.identifier, "used without declaration")
+			if entry.category != 'array':
+				self.error(node.lexpos, "Function", node.identifier, "not defined as an array")
+			node.type = entry.type.elem_type
+		elif isinstance(node, syntax.Unary):
+			self.expression(node.operand)
+			if node.op == '+' or node.op == '++' or node.op == '--':
+				node.type = node.operand.type
+			else:
+				node.type = int_type
+		elif isinstance(node, syntax.Binary):
+			self.expression(node.left)
+			self.expression(node.right)
+			node.type = int_type
+		elif isinstance(node, syntax.Assign):
+			self.expression(node.value)
+			self.expression(node.target)
+			node.type = node.target.type
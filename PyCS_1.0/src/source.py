@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+# Streaming program source
+#
+# The input file is memory-mapped and handed to the lexer one chunk at a time
+# instead of being read into a single string, so only the current chunk is
+# resident while the program is lexed. Chunks always end on a token boundary:
+# after a newline that is not inside a delimited comment.
+###################################################################################################
+
+import re
+import mmap
+from array import array
+from bisect import bisect_right
+
+CHUNK_SIZE = 1 << 20
+
+# Constructs that may contain a newline or a comment opener without either
+# being significant: comments, string and char constants, preprocessor lines.
+# A bare /* is a comment that is not closed inside the scanned region.
+newline = re.compile('\n')
+markers = re.compile(rb'/\*[\s\S]*?\*/|"(?:[^\\\n]|\\.)*?"|\'(?:[^\\\n]|\\.)*?\'|\#.*?\n|/\*')
+
+# Returns the end of the chunk starting at start: one past the last newline in
+# [start, stop) that is outside every comment, or -1 if there is none
+def boundary(m, start, stop):
+	limit = stop
+	comments = []
+	for match in markers.finditer(m, start, stop):
+		if match.group() == b'/*':
+			limit = match.start()
+			break
+		if match.group().startswith(b'/*'):
+			comments.append(match.span())
+	cut = m.rfind(b'\n', start, limit)
+	for (begin, end) in reversed(comments):
+		if begin < cut < end:
+			cut = m.rfind(b'\n', start, begin)
+	if cut == -1:
+		return -1
+	return cut + 1
+
+# Yields the decoded text of the file chunk by chunk
+def chunks(filename, size=CHUNK_SIZE):
+	with open(filename, 'rb') as f:
+		f.seek(0, 2)
+		if f.tell() == 0:
+			return
+		m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			start = 0
+			released = 0
+			length = len(m)
+			while start < length:
+				window = size
+				stop = min(start + window, length)
+				while stop < length:
+					cut = boundary(m, start, stop)
+					if cut != -1:
+						stop = cut
+						break
+					# A single line or comment longer than the window
+					window = window*2
+					stop = min(start + window, length)
+				# Newlines are translated as when reading the file in text mode
+				yield m[start:stop].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+				# Mapped pages count towards the resident set until released
+				done = stop - stop % mmap.PAGESIZE
+				if hasattr(m, 'madvise') and done > released:
+					m.madvise(mmap.MADV_DONTNEED, released, done - released)
+					released = done
+				start = stop
+		finally:
+			m.close()
+
+# Offsets of the line starts of a file, built once while the file is read.
+# Any lexpos is resolved to its line and column by bisection instead of
+# rescanning the source.
+class LineIndex:
+	def __init__(self, data=None):
+		self.starts = array('Q', [0])
+		if data != None:
+			self.add(data, 0)
+
+	# Records the lines of text, found at offset base of the file
+	def add(self, text, base):
+		self.starts.extend(base + m.end() for m in newline.finditer(text))
+
+	# Returns (line, column) of a source offset, both starting at 1
+	def location(self, lexpos):
+		line = bisect_right(self.starts, lexpos)
+		return line, lexpos - self.starts[line - 1] + 1
+
+# Lexer wrapper that feeds the wrapped lexer (PLY lexer or scanner) from a
+# memory-mapped file. lexpos is kept relative to the start of the file.
+class StreamLexer:
+	def __init__(self, lexer, filename, size=CHUNK_SIZE):
+		self.lexer = lexer
+		self.filename = filename
+		self.size = size
+		self.pieces = None
+		self.base = 0
+		self.length = 0
+		self.lines = LineIndex()
+
+	# The file is the input, the data given by the parser is ignored
+	def input(self, data=None):
+		self.pieces = chunks(self.filename, self.size)
+		self.base = 0
+		self.length = 0
+		del self.lines.starts[1:]
+		self.lexer.input("")
+
+	# The words of the file a pattern finds, read chunk by chunk ahead of the
+	# lexing: a chunk ends on a newline, so no word is split
+	def findall(self, pattern):
+		words = set()
+		for piece in chunks(self.filename, self.size):
+			words.update(pattern.findall(piece))
+		return words
+
+	@property
+	def errors(self):
+		return self.lexer.errors
+
+	@errors.setter
+	def errors(self, value):
+		self.lexer.errors = value
+
+	@property
+	def lineno(self):
+		return self.lexer.lineno
+
+	@lineno.setter
+	def lineno(self, value):
+		self.lexer.lineno = value
+
+	def token(self):
+		if self.pieces == None:
+			self.input()
+		while True:
+			tok = self.lexer.token()
+			if tok != None:
+				tok.lexpos += self.base
+				return tok
+			piece = next(self.pieces, None)
+			if piece == None:
+				return None
+			self.base += self.length
+			self.length = len(piece)
+			self.lines.add(piece, self.base)
+			self.lexer.input(piece)
@@ -0,0 +1,435 @@
+#!/usr/bin/python3
+# Static single assignment form of the graphs of cfg.py
+#
+#     dominators(graph)      the immediate dominator of every block, by the
+#                            algorithm of Cooper, Harvey and Kennedy (iterate
+#                            over the blocks in reverse postorder, meeting the
+#                            predecessors by walking up the dominator tree)
+#     frontiers(graph, idom) the dominance frontier of every block
+#     construct(graph, fresh)
+#                            puts a graph in SSA form: a phi for every name
+#                            read in some block before being assigned in it,
+#                            at the iterated dominance frontier of the blocks
+#                            assigning it, then every assignment renamed to a
+#                            new version along the dominator tree
+#     destruct(graph, origin, fresh)
+#                            the graph in plain TAC again: every phi becomes
+#                            a copy on each incoming edge (on a new block when
+#                            the edge leaves an ifgoto), the copies of an edge
+#                            are ordered as a parallel copy, and the versions
+#                            of a name are renamed back to it unless two of
+#                            them are live at once
+#
+# A new version of a temporary is a fresh temporary, one of a variable x is
+# x.N, and origin maps every version to its original name. Every variable is
+# a global of the assembly, read and written by calls and read by the caller
+# after a return, so the versions of a variable always go back to the
+# variable itself: a pass over the SSA form must not make two of them live at
+# once. A call starts a new version of every variable, which no instruction
+# assigns; the version live at the entry of the function is the name itself.
+# The operand of "!, x" and "~, x" is updated in place and keeps its name.
+#
+# Usage: ./ssa.py [--destruct] file.ir
+#     prints the SSA form of the program, or with --destruct the program
+#     after going into SSA form and back
+###################################################################################################
+
+import sys
+import ir
+import cfg
+import tac
+import dataflow
+from ir import Instr, Op, TEMP, VAR, LABEL
+from dataflow import defined, defined_position, used_positions, isname
+
+# Fresh names for a program: temporaries and labels numbered after all those
+# it uses, and versions of its variables
+class Fresh:
+	def __init__(self, code):
+		self.temps = 0
+		self.labels = 0
+		for instr in code:
+			for name, kind in zip(instr.args, instr.kinds):
+				if kind == TEMP:
+					self.temps = max(self.temps, int(name[1:]) + 1)
+				elif kind == LABEL and name[1:].isdigit():
+					self.labels = max(self.labels, int(name[1:]) + 1)
+		self.versions = {}
+
+	def temp(self):
+		self.temps += 1
+		return ir.Temp("t" + str(self.temps - 1))
+
+	def label(self):
+		self.labels += 1
+		return "L" + str(self.labels - 1)
+
+	# A new version of a name
+	def version(self, name):
+		if ir.classify(name) == TEMP:
+			return self.temp()
+		n = self.versions.get(name, 0) + 1
+		self.versions[name] = n
+		return name + "." + str(n)
+
+# The immediate dominator of every block, as a list of block indexes (None for
+# the blocks not reachable from the entry, the entry its own), and the
+# reachable blocks in reverse postorder
+def dominators(graph):
+	blocks = graph.blocks
+	order = dataflow.reverse_postorder(graph)
+	number = [None] * len(blocks)
+	for i in range(len(order)):
+		# Reverse postorder number: a dominator always has a lower one
+		number[order[i].index] = i
+	idom = [None] * len(blocks)
+	if not order:
+		return idom, order
+	idom[0] = 0
+	changed = True
+	while changed:
+		changed = False
+		for block in order[1:]:
+			new = None
+			for pred in block.preds:
+				p = pred.index
+				if idom[p] == None:
+					continue
+				if new == None:
+					new = p
+					continue
+				# Walk up from both to their common dominator
+				while p != new:
+					while number[p] > number[new]:
+						p = idom[p]
+					while number[new] > number[p]:
+						new = idom[new]
+			if idom[block.index] != new:
+				idom[block.index] = new
+				changed = True
+	return idom, order
+
+# The dominance frontier of every block: the blocks where its dominance ends,
+# as lists of block indexes
+def frontiers(graph, idom):
+	df = [[] for block in graph.blocks]
+	for block in graph.blocks:
+		b = block.index
+		if idom[b] == None or len(block.preds) < 2:
+			continue
+		for pred in block.preds:
+			runner = pred.index
+			if idom[runner] == None:
+				continue
+			while runner != idom[b]:
+				if not df[runner] or df[runner][-1] != b:
+					df[runner].append(b)
+				runner = idom[runner]
+	return df
+
+# Puts a graph in SSA form, in place. Returns the original name of every
+# version.
+def construct(graph, fresh):
+	blocks = graph.blocks
+	idom, order = dominators(graph)
+	df = frontiers(graph, idom)
+	# The names read before being assigned in some block, which may need a
+	# phi, and the blocks assigning each name
+	pinned = set()
+	needed = set()
+	assigned = {}
+	variables = set()
+	calls = []
+	for block in order:
+		local = set()
+		after_call = False
+		for instr in block.code:
+			if (instr.op == Op.NOT or instr.op == Op.BNOT) and len(instr.args) == 1 and isname(instr, 0):
+				pinned.add(instr.args[0])
+			for name in dataflow.used(instr):
+				if name not in local and not (after_call and ir.classify(name) == VAR):
+					needed.add(name)
+			for name in dataflow.names(instr):
+				if ir.classify(name) == VAR:
+					variables.add(name)
+			if instr.op == Op.CALL:
+				if not after_call:
+					calls.append(block.index)
+				after_call = True
+			name = defined(instr)
+			if name != None:
+				local.add(name)
+				assigned.setdefault(name, set()).add(block.index)
+	variables -= pinned
+	# Phis at the iterated dominance frontier of the assignments
+	phis = [[] for block in blocks]
+	for name in sorted(needed - pinned):
+		sites = set(assigned.get(name, ()))
+		if name in variables:
+			sites.update(calls)
+		work = list(sites)
+		placed = set()
+		while work:
+			for d in df[work.pop()]:
+				if d not in placed:
+					placed.add(d)
+					phis[d].append(name)
+					if d not in sites:
+						sites.add(d)
+						work.append(d)
+	for block in order:
+		names = phis[block.index]
+		if names:
+			head = 1 if block.code and block.code[0].op == Op.LABEL else 0
+			block.code[head:head] = [Instr(Op.PHI, name, *([name] * len(block.preds))) for name in names]
+	return rename(graph, idom, order, phis, pinned, variables, fresh)
+
+# Renames every assignment to a new version, and every read to the version
+# reaching it, walking the dominator tree from the entry
+def rename(graph, idom, order, phis, pinned, variables, fresh):
+	blocks = graph.blocks
+	children = [[] for block in blocks]
+	for block in order[1:]:
+		children[idom[block.index]].append(block)
+	origin = {}
+	stacks = {}
+	called = sorted(variables)
+
+	def define(name):
+		version = fresh.version(name)
+		origin[version] = name
+		stacks.setdefault(name, []).append(version)
+		return version
+
+	if not order:
+		return origin
+	work = [(order[0], None)]
+	while work:
+		block, pushed = work.pop()
+		if pushed != None:
+			# Leaving the subtree of the block
+			for name in pushed:
+				stacks[name].pop()
+			continue
+		pushed = []
+		code = block.code
+		for i in range(len(code)):
+			instr = code[i]
+			if instr.op == Op.PHI:
+				pushed.append(instr.args[0])
+				code[i] = Instr(Op.PHI, define(instr.args[0]), *instr.args[1:])
+				continue
+			args = list(instr.args)
+			for j in used_positions(instr.op, len(args)):
+				if isname(instr, j) and args[j] not in pinned:
+					stack = stacks.get(args[j])
+					if stack:
+						args[j] = stack[-1]
+			if instr.op == Op.CALL:
+				for name in called:
+					pushed.append(name)
+					define(name)
+			j = defined_position(instr)
+			if j != None and args[j] not in pinned:
+				pushed.append(args[j])
+				args[j] = define(args[j])
+			if tuple(args) != instr.args:
+				code[i] = Instr(instr.op, *args)
+		for succ in block.succs:
+			j = succ.preds.index(block)
+			names = phis[succ.index]
+			head = 1 if succ.code and succ.code[0].op == Op.LABEL else 0
+			for k in range(len(names)):
+				phi = succ.code[head + k]
+				stack = stacks.get(names[k])
+				value = stack[-1] if stack else names[k]
+				args = list(phi.args)
+				args[1 + j] = value
+				succ.code[head + k] = Instr(Op.PHI, *args)
+		work.append((block, pushed))
+		for child in reversed(children[block.index]):
+			work.append((child, None))
+	return origin
+
+# Orders a parallel copy, a list of (destination, source) with distinct
+# destinations, as copies one after the other: a copy waits until no other
+# reads its destination, and a cycle is broken by saving one value in a
+# fresh temporary
+def sequentialize(copies, fresh):
+	pending = {}
+	readers = {}
+	for dest, source in copies:
+		if dest != source:
+			pending[dest] = source
+			readers[source] = readers.get(source, 0) + 1
+	result = []
+	ready = [dest for dest in pending if readers.get(dest, 0) == 0]
+	while pending:
+		while ready:
+			dest = ready.pop()
+			source = pending.pop(dest)
+			result.append(Instr(Op.ASSIGN, dest, source))
+			readers[source] -= 1
+			if readers[source] == 0 and source in pending:
+				ready.append(source)
+		if pending:
+			# Only cycles are left: free one destination
+			dest = next(iter(pending))
+			t = fresh.temp()
+			result.append(Instr(Op.ASSIGN, t, dest))
+			for d in pending:
+				if pending[d] == dest:
+					pending[d] = t
+			readers[t] = readers.pop(dest)
+			ready.append(dest)
+	return result
+
+# The code of a graph in SSA form back in plain TAC: a list of ir.Instr
+def destruct(graph, origin, fresh):
+	blocks = graph.blocks
+	code = []
+	# Blocks holding the copies of an edge leaving an ifgoto, placed where
+	# nothing falls into them
+	detached = []
+	made = set()
+	for block in blocks:
+		body = [instr for instr in block.code if instr.op != Op.PHI]
+		copies = []
+		for succ in block.succs:
+			j = succ.preds.index(block)
+			pairs = [(phi.args[0], phi.args[1 + j]) for phi in succ.code if phi.op == Op.PHI]
+			if pairs:
+				copies.append((succ, sequentialize(pairs, fresh)))
+		last = body[-1] if body else None
+		if not copies:
+			code += body
+		elif last != None and last.op == Op.IFGOTO:
+			falls = []
+			for succ, sequence in copies:
+				if not sequence:
+					continue
+				if graph.labels.get(last.args[-1]) is succ:
+					label = fresh.label()
+					made.add(label)
+					last = Instr(Op.IFGOTO, *(last.args[:-1] + (label,)))
+					detached += [Instr(Op.LABEL, label)] + sequence + [Instr(Op.GOTO, succ.code[0].args[0])]
+				if succ.index == block.index + 1:
+					falls = sequence
+			code += body[:-1] + [last] + falls
+		elif last != None and last.op == Op.GOTO:
+			code += body[:-1] + copies[0][1] + [last]
+		else:
+			code += body + copies[0][1]
+	if detached:
+		place(code, detached, fresh, made)
+	code = coalesce(code, origin)
+	return tidy(code, made)
+
+# Inserts blocks after the last instruction that does not fall through, or at
+# the end behind a jump over them
+def place(code, detached, fresh, made):
+	for k in range(len(code) - 1, -1, -1):
+		if code[k].op in (Op.GOTO, Op.RETURN, Op.EXIT):
+			code[k+1:k+1] = detached
+			return
+	label = fresh.label()
+	made.add(label)
+	code += [Instr(Op.GOTO, label)] + detached + [Instr(Op.LABEL, label)]
+
+# Renames the versions back to their original names: all those of a variable,
+# and those of a temporary unless two of them are live at once (then they stay
+# distinct temporaries). Copies of a name to itself are dropped.
+def coalesce(code, origin):
+	graph = cfg.build(code)[-1]
+	numbering, ins, outs = dataflow.liveness(graph)
+	# The versions of every temporary, as a set
+	versions = {}
+	for version, name in origin.items():
+		if ir.classify(name) == TEMP and version in numbering.index:
+			versions[name] = versions.get(name, 0) | numbering.bit(version)
+	for name in versions:
+		if name in numbering.index:
+			versions[name] |= numbering.bit(name)
+	overlapping = set()
+	for block in graph.blocks:
+		live = outs[block.index]
+		for instr, after in zip(reversed(block.code), dataflow.live_after(numbering, block, live)):
+			name = defined(instr)
+			if name == None:
+				continue
+			base = origin.get(name, name)
+			if base not in versions or base in overlapping:
+				continue
+			others = after & versions[base] & ~numbering.bit(name)
+			if instr.op == Op.ASSIGN and instr.args[1] in numbering.index:
+				# A copy does not overlap with what it copies
+				others &= ~numbering.bit(instr.args[1])
+			if others:
+				overlapping.add(base)
+	names = {}
+	for version, name in origin.items():
+		if ir.classify(name) == VAR or name not in overlapping:
+			names[version] = name
+	result = []
+	for instr in code:
+		args = tuple(names.get(a, a) if k == TEMP or k == VAR else a for a, k in zip(instr.args, instr.kinds))
+		if instr.op == Op.ASSIGN and args[0] == args[1]:
+			continue
+		if args != instr.args:
+			instr = Instr(instr.op, *args)
+		result.append(instr)
+	return result
+
+# Removes the blocks made for edge copies that are left without copies,
+# pointing their jumps back at the original target
+def tidy(code, made):
+	target = {}
+	result = []
+	i = 0
+	while i < len(code):
+		instr = code[i]
+		if instr.op == Op.LABEL and instr.args[0] in made and i + 1 < len(code):
+			after = code[i + 1]
+			if after.op == Op.GOTO:
+				target[instr.args[0]] = after.args[0]
+				i += 2
+				continue
+			if after.op == Op.LABEL and result and result[-1].op == Op.GOTO and result[-1].args[0] == instr.args[0]:
+				# An empty jump over the placed blocks
+				result.pop()
+				i += 1
+				continue
+		result.append(instr)
+		i += 1
+	for k in range(len(result)):
+		instr = result[k]
+		if (instr.op == Op.IFGOTO or instr.op == Op.GOTO) and instr.args[-1] in target:
+			result[k] = Instr(instr.op, *(instr.args[:-1] + (target[instr.args[-1]],)))
+	return result
+
+# The graphs of a program in SSA form, with the original names of their
+# versions and the fresh names used
+def to_ssa(code):
+	fresh = Fresh(code)
+	graphs = cfg.build(code)
+	origins = [construct(graph, fresh) for graph in graphs]
+	return graphs, origins, fresh
+
+# The code of a program in SSA form, in plain TAC
+def from_ssa(graphs, origins, fresh):
+	code = []
+	for graph, origin in zip(graphs, origins):
+		code += destruct(graph, origin, fresh)
+	return code
+
+if __name__ == '__main__':
+	args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+	if len(args) != 1:
+		print("Usage: ./ssa.py [--destruct] file.ir")
+		exit(0)
+	graphs, origins, fresh = to_ssa(ir.parse_listing(open(args[0], 'r').read()))
+	if '--destruct' in sys.argv:
+		code = from_ssa(graphs, origins, fresh)
+	else:
+		code = cfg.flatten(graphs)
+	sys.stdout.write(tac.listing(code))
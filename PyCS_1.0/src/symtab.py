@@ -1,13 +1,17 @@
 #!/usr/bin/python3
 # Symbol Table Implementation
 
-from copy import deepcopy
+import ir
+from lexer import intern
 
 
-base_table = None
 
-# Types
+# Types. A type is never changed once made: the types of the program come from
+# basic_type and array_type, which return one shared object per distinct type,
+# so two types are equal when they are the same object.
 class type:
+	__slots__ = ('name', 'isbasic', 'isarray', 'ispointer', 'width', 'elem_type', 'length')
+
 	def __init__(self, name, isbasic, isarray, ispointer, width, elem_type, length):
 		self.name = name
 		self.isbasic = isbasic
@@ -23,6 +27,48 @@ class type:
 		elif self.isarray:
 			return "array of " + self.elem_type.type_name() + ", length " + str(self.length)
 
+# The types made so far, by name for basic types and by (element type, length)
+# for arrays
+types = {}
+
+def basic_type(name, width):
+	t = types.get(name)
+	if t == None:
+		t = types[name] = type(name, True, False, False, width, None, None)
+	return t
+
+# An array of elem_type; length is None until an initializer gives it
+def array_type(elem_type, length=None):
+	key = (elem_type, length)
+	t = types.get(key)
+	if t == None:
+		width = None
+		if length != None:
+			width = length*elem_type.width
+		t = types[key] = type(None, False, True, False, width, elem_type, length)
+	return t
+
+# Symbol table entries. outer is the binding this one hides, for
+# scoped_environ.
+class symbol:
+	__slots__ = ('type', 'category', 'outer')
+	# What print_symbol_table shows
+	fields = ('type', 'category')
+
+	def __init__(self, var_type, category):
+		self.type = var_type
+		self.category = category
+		self.outer = None
+
+class function_symbol(symbol):
+	__slots__ = ('arg_num', 'arg_types')
+	fields = ('type', 'category', 'arg_num', 'arg_types')
+
+	def __init__(self, return_type, param_types, param_num):
+		symbol.__init__(self, return_type, 'function')
+		self.arg_num = param_num
+		self.arg_types = param_types
+
 class table:
 	def __init__(self, prev = None):
 		self.hash = {}
@@ -31,23 +77,17 @@ class table:
 		self.children = []
 
 	def insert_variable(self, var_type, identifier):
-		self.hash[identifier] = {}
-		self.hash[identifier]['type'] = var_type
-		self.hash[identifier]['category'] = 'variable'
+		self.hash[identifier] = symbol(var_type, 'variable')
 
 	def insert_temp(self, var_type, identifier):
 		if identifier not in self.hash:		
-			self.hash[identifier] = {}
-			self.hash[identifier]['type'] = var_type
-			self.hash[identifier]['category'] = 'temporary'
+			self.hash[identifier] = symbol(var_type, 'temporary')
 			return True	
 		else:
 			return False
 
 	def insert_array(self, var_type, identifier):
-		self.hash[identifier] = {}
-		self.hash[identifier]['type'] = var_type
-		self.hash[identifier]['category'] = 'array'
+		self.hash[identifier] = symbol(var_type, 'array')
 
 
 	# def lookup(self, identifier, table):
@@ -61,11 +101,7 @@ class table:
 
 	def insert_function(self, method_name, return_type, param_types, param_num):
 		if method_name not in self.hash:
-			self.hash[method_name] = {}
-			self.hash[method_name]['type'] = return_type
-			self.hash[method_name]['category'] = 'function'
-			self.hash[method_name]['arg_num'] = param_num
-			self.hash[method_name]['arg_types'] = param_types
+			self.hash[method_name] = function_symbol(return_type, param_types, param_num)
 		
 
 	def lookup_in_this(self, identifier):
@@ -78,45 +114,81 @@ class table:
 		print("")
 		for key in self.hash:
 			print("NAME: ", key)
-			for k in self.hash[key]:
-				if k == 'type' and not isinstance(self.hash[key][k], str):
-					print(k, ': ', self.hash[key][k].type_name())
+			entry = self.hash[key]
+			for k in entry.fields:
+				value = getattr(entry, k)
+				if k == 'type' and not isinstance(value, str):
+					print(k, ': ', value.type_name())
 				elif k == 'arg_types':
-					types = []
-					for t in self.hash[key][k]:
+					names = []
+					for t in value:
 						if not isinstance(t, str):
-							types.append(t.type_name())
+							names.append(t.type_name())
 						else:
-							types.append(t)
-					print(k, ': ', types)
+							names.append(t)
+					print(k, ': ', names)
 				else:
-					print(k, ': ', self.hash[key][k])
+					print(k, ': ', value)
 			print("")
 
 
 # A wrapper around the table class to maintain different scopes
 class environ:
-	def __init__(self):
+	def __init__(self, recycle_temps=True):
 		self.curr_table = table(None)
 		# global temp_count
 		# global label_count
-		global base_table
-		base_table = self.curr_table
+		self.base_table = self.curr_table
 		self.label_count = 0
 		self.temp_count = 0
+		# Temporaries of the current function whose value has been used, free
+		# to be handed out again by maketemp
+		self.recycle_temps = recycle_temps
+		self.free_temps = []
+		# The variables and parameters declared so far: their names are
+		# never handed out as temporaries
+		self.variables = set()
 
 	def maketemp(self, temp_type, table):
+		while self.free_temps:
+			name = self.free_temps.pop()
+			if name in self.variables:
+				continue
+			entry = table.lookup_in_this(name)
+			if entry == None:
+				self.insert_new_temp(temp_type, name, table)
+				return name
+			if entry.category == 'temporary':
+				entry.type = temp_type
+				return name
+			# else a variable of this scope has the name
 		success = False
 		while not success:
-			name = "t"+str(self.temp_count)
+			name = ir.Temp("t"+str(self.temp_count))
 			self.temp_count += 1
-			success = table.insert_temp(temp_type, name)
+			success = name not in self.variables and self.insert_new_temp(temp_type, name, table)
 		return name
 
+	def insert_new_temp(self, temp_type, name, table):
+		return table.insert_temp(temp_type, name)
+
+	# Frees a temporary once the instruction using its value has been emitted
+	def free_temp(self, name):
+		if self.recycle_temps and name != None and name not in self.free_temps:
+			entry = self.lookup(name, self.curr_table)
+			if entry != None and entry.category == 'temporary':
+				self.free_temps.append(name)
+
+	# Temporaries are reused only within a function: they are all globals in
+	# the assembly, so a function must not share one with its callers
+	def begin_function(self, params=None):
+		self.free_temps = []
+		if params != None:
+			self.variables.update(param[1] for param in params)
 
 	# Labels
 	def newlabel(self):
-		label = "L"+str(self.label_count)
+		label = intern("L"+str(self.label_count))
 		self.label_count += 1
 		return label
 
@@ -129,13 +201,20 @@ class environ:
 	def end_scope(self):
 		self.curr_table = self.curr_table.parent
 
+	# Drops the tables of the scopes closed below the current one, which
+	# print_symbol_table would otherwise show
+	def release_scopes(self):
+		self.curr_table.children = []
+
 	def insert_variable(self, var_type, identifier):
+		self.variables.add(identifier)
 		self.curr_table.insert_variable(var_type, identifier)
 
 	def insert_temp(self, var_type, identifier):
 		self.curr_table.insert_temp(var_type, identifier)
 
 	def insert_array(self, var_type, identifier):
+		self.variables.add(identifier)
 		self.curr_table.insert_array(var_type, identifier)
 
 	def lookup(self, identifier, table):
@@ -159,4 +238,67 @@ class environ:
 		print("----------------")
 		for c in t.children:
 			self.print_symbol_table(c)
-		 
\ No newline at end of file
+		 
+
+# The environ with constant time lookup (LeBlanc-Cook): one hash from a name
+# to the stack of its bindings, so lookup never walks the parent chain. The
+# stack is linked through the entries: the innermost binding is in the hash,
+# and each binding's outer is the one it hides. A scope is still a table;
+# its hash is the undo log of the names bound in it, popped by end_scope,
+# and the tables keep the children tree for print_symbol_table. lookup and
+# maketemp work on the current scope, which is the table the parser always
+# passes them.
+class scoped_environ(environ):
+	def __init__(self, recycle_temps=True):
+		environ.__init__(self, recycle_temps)
+		self.bindings = {}
+
+	# Makes the current table's entry for identifier its innermost binding;
+	# fresh is whether the name was new to the table
+	def bind(self, identifier, fresh):
+		entry = self.curr_table.hash[identifier]
+		if fresh:
+			entry.outer = self.bindings.get(identifier)
+		else:
+			entry.outer = self.bindings[identifier].outer
+		self.bindings[identifier] = entry
+
+	def insert_new_temp(self, temp_type, name, table):
+		if self.curr_table.insert_temp(temp_type, name):
+			self.bind(name, True)
+			return True
+		return False
+
+	def end_scope(self):
+		bindings = self.bindings
+		for identifier in self.curr_table.hash:
+			outer = bindings[identifier].outer
+			if outer == None:
+				del bindings[identifier]
+			else:
+				bindings[identifier] = outer
+		self.curr_table = self.curr_table.parent
+
+	def insert_variable(self, var_type, identifier):
+		fresh = identifier not in self.curr_table.hash
+		self.variables.add(identifier)
+		self.curr_table.insert_variable(var_type, identifier)
+		self.bind(identifier, fresh)
+
+	def insert_temp(self, var_type, identifier):
+		if self.curr_table.insert_temp(var_type, identifier):
+			self.bind(identifier, True)
+
+	def insert_array(self, var_type, identifier):
+		fresh = identifier not in self.curr_table.hash
+		self.variables.add(identifier)
+		self.curr_table.insert_array(var_type, identifier)
+		self.bind(identifier, fresh)
+
+	def insert_function(self, method_name, return_type, param_types, param_num):
+		if method_name not in self.curr_table.hash:
+			self.curr_table.insert_function(method_name, return_type, param_types, param_num)
+			self.bind(method_name, True)
+
+	def lookup(self, identifier, table=None):
+		return self.bindings.get(identifier)
@@ -0,0 +1,463 @@
+#!/usr/bin/python3
+# Syntax tree of a C# program, and the grammar that builds it (AST mode)
+#
+# The grammar is that of parser.py, but its actions only build nodes: no
+# symbol table and no code. The semantic passes (semantic.py) then run over
+# the whole tree before it is lowered to three address code (parser.lower).
+# Nodes are slotted; the unit rules of the expression grammar (primary ->
+# postfix -> unary -> ... -> expression) hand their child up unchanged.
+###################################################################################################
+
+import os
+import ply.yacc as yacc
+from lexer import tokens
+import symtab
+import tabcache
+
+# Start symbol of the grammar
+start = 'compilation_unit'
+
+# Precedence and associativity of operators, also used by parser.py
+precedence = (
+	('left', 'COR'),
+	('left', 'CAND'),
+	('left', 'OR'),
+	('left', 'XOR'),
+	('left', 'AND'),
+	('left', 'EQ', 'NE'),
+	('left', 'GT', 'GE', 'LT', 'LE'),
+	('left', 'RSHIFT', 'LSHIFT'),
+	('left', 'PLUS', 'MINUS'),
+	('left', 'TIMES', 'DIVIDE', 'MOD'),
+	('right', 'NOT', 'LNOT'),
+)
+
+###################################################################################################
+# Nodes
+#
+# The fields of a node are its syntax, in order; lexpos is the source offset
+# of the identifier a diagnostic points at. Two trees are equal when their
+# fields are.
+
+class Node:
+	__slots__ = ()
+	fields = ()
+
+	def __init__(self, *values):
+		for field, value in zip(self.fields, values):
+			setattr(self, field, value)
+
+	def __eq__(self, other):
+		return type(self) is type(other) and all(getattr(self, f) == getattr(other, f) for f in self.fields)
+
+	def __repr__(self):
+		return type(self).__name__ + "(" + ", ".join(repr(getattr(self, f)) for f in self.fields) + ")"
+
+# An expression also has the type semantic.check finds for it
+class Expression(Node):
+	__slots__ = ('type',)
+
+	def __init__(self, *values):
+		Node.__init__(self, *values)
+		self.type = None
+
+class Literal(Expression):
+	__slots__ = fields = ('value',)
+
+class Name(Expression):
+	__slots__ = fields = ('identifier', 'lexpos')
+
+# args is a list of expressions, or None
+class Call(Expression):
+	__slots__ = fields = ('identifier', 'args', 'lexpos')
+
+class Index(Expression):
+	__slots__ = fields = ('identifier', 'index', 'lexpos')
+
+# op is '+', '-', '!', '~', '++' or '--'
+class Unary(Expression):
+	__slots__ = fields = ('op', 'operand')
+
+# Arithmetic, shift, relational, equality, && and || operators
+class Binary(Expression):
+	__slots__ = fields = ('op', 'left', 'right')
+
+class Assign(Expression):
+	__slots__ = fields = ('target', 'value')
+
+class Block(Node):
+	__slots__ = fields = ('statements',)
+
+# A local variable or field declaration. declarators are (identifier,
+# initializer, lexpos), the initializer an expression, a list of them for an
+# array, or None.
+class Declaration(Node):
+	__slots__ = fields = ('type', 'declarators')
+
+class Print(Node):
+	__slots__ = fields = ('argument',)
+
+class Read(Node):
+	__slots__ = fields = ('argument',)
+
+# otherwise is None without an else
+class If(Node):
+	__slots__ = fields = ('condition', 'then', 'otherwise')
+
+class While(Node):
+	__slots__ = fields = ('condition', 'body')
+
+# initializer is a Declaration or a list of expressions, iterator a list
+class For(Node):
+	__slots__ = fields = ('initializer', 'condition', 'iterator', 'body')
+
+class Return(Node):
+	__slots__ = fields = ('value',)
+
+# params are (type, identifier), or None
+class Method(Node):
+	__slots__ = fields = ('return_type', 'identifier', 'params', 'body', 'lexpos')
+
+# members are Declaration and Method nodes, in order
+class Class(Node):
+	__slots__ = fields = ('identifier', 'members')
+
+class Namespace(Node):
+	__slots__ = fields = ('identifier', 'declaration')
+
+###################################################################################################
+# Grammar
+
+# C.2.2 Types
+def p_type(p):
+	"""type : non_array_type
+		| array_type
+	non_array_type : simple_type
+	simple_type : primitive_type
+	primitive_type : numeric_type
+	numeric_type : integral_type
+		| floating_point_type
+	"""
+	p[0] = p[1]
+
+def p_integral_type(p):
+	"""integral_type : INT
+		| CHAR
+	"""
+	if p[1] == 'int':
+		p[0] = symtab.basic_type('int', 4)
+	elif p[1] == 'char':
+		p[0] = symtab.basic_type('char', 1)
+
+def p_floating_point_type(p):
+	"""floating_point_type : FLOAT
+	"""
+	p[0] = symtab.basic_type('float', 8)
+
+def p_array_type(p):
+	"""array_type : simple_type LBRACKET RBRACKET
+	"""
+	p[0] = symtab.array_type(p[1])
+
+# C.2.4 Expressions
+def p_unit_expression(p):
+	"""argument : expression
+	primary_expression : parenthesized_expression
+		| primary_expression_no_parenthesis
+	primary_expression_no_parenthesis : literal
+		| invocation_expression
+		| element_access
+	postfix_expression : primary_expression
+	unary_expression_not_plusminus : postfix_expression
+	unary_expression : unary_expression_not_plusminus
+		| pre_increment_expression
+		| pre_decrement_expression
+	multiplicative_expression : unary_expression
+	additive_expression : multiplicative_expression
+	shift_expression : additive_expression
+	relational_expression : shift_expression
+	equality_expression : relational_expression
+	and_expression : equality_expression
+	exclusive_or_expression : and_expression
+	inclusive_or_expression : exclusive_or_expression
+	conditional_and_expression : inclusive_or_expression
+	conditional_or_expression : conditional_and_expression
+	conditional_expression : conditional_or_expression
+	expression : conditional_expression
+		| assignment
+	boolean_expression : expression
+	argument_list_opt : empty
+		| argument_list
+	expression_opt : empty
+		| expression
+	"""
+	p[0] = p[1]
+
+def p_list(p):
+	"""argument_list : argument
+		| argument_list COMMA argument
+	variable_declarators : variable_declarator
+		| variable_declarators COMMA variable_declarator
+	variable_initializer_list : variable_initializer
+		| variable_initializer_list COMMA variable_initializer
+	formal_parameter_list : formal_parameter
+		| formal_parameter_list COMMA formal_parameter
+	statement_expression_list : statement_expression
+		| statement_expression_list COMMA statement_expression
+	"""
+	if len(p) == 2:
+		p[0] = [p[1]]
+	else:
+		p[0] = p[1]
+		p[0].append(p[3])
+
+def p_name(p):
+	"""primary_expression_no_parenthesis : IDENTIFIER
+	"""
+	p[0] = Name(p[1], p.lexpos(1))
+
+def p_literal(p):
+	"""literal : INTCONST
+		| STRCONST
+		| CHCONST
+	"""
+	p[0] = Literal(p[1])
+
+def p_parenthesized_expression(p):
+	"""parenthesized_expression : LPAREN expression RPAREN
+	"""
+	p[0] = p[2]
+
+def p_invocation_expression(p):
+	"""invocation_expression : IDENTIFIER LPAREN argument_list_opt RPAREN
+	"""
+	p[0] = Call(p[1], p[3], p.lexpos(1))
+
+def p_element_access(p):
+	"""element_access : IDENTIFIER LBRACKET expression RBRACKET
+	"""
+	p[0] = Index(p[1], p[3], p.lexpos(1))
+
+def p_unary_expression(p):
+	"""unary_expression_not_plusminus : LNOT unary_expression
+		| NOT unary_expression
+	unary_expression : PLUS unary_expression
+		| MINUS unary_expression
+	pre_increment_expression : INCREMENT unary_expression
+	pre_decrement_expression : DECREMENT unary_expression
+	"""
+	p[0] = Unary(p[1], p[2])
+
+def p_binary_expression(p):
+	"""multiplicative_expression : multiplicative_expression TIMES unary_expression
+		| multiplicative_expression DIVIDE unary_expression
+		| multiplicative_expression MOD unary_expression
+	additive_expression : additive_expression PLUS multiplicative_expression
+		| additive_expression MINUS multiplicative_expression
+	shift_expression : shift_expression LSHIFT additive_expression
+		| shift_expression RSHIFT additive_expression
+	relational_expression : relational_expression LT shift_expression
+		| relational_expression GT shift_expression
+		| relational_expression GE shift_expression
+		| relational_expression LE shift_expression
+	equality_expression : equality_expression EQ relational_expression
+		| equality_expression NE relational_expression
+	conditional_and_expression : conditional_and_expression CAND inclusive_or_expression
+	conditional_or_expression : conditional_or_expression COR conditional_and_expression
+	"""
+	p[0] = Binary(p[2], p[1], p[3])
+
+def p_assignment(p):
+	"""assignment : unary_expression assignment_operator expression
+	"""
+	p[0] = Assign(p[1], p[3])
+
+def p_assignment_operator(p):
+	"""assignment_operator : EQUALS
+	"""
+	p[0] = p[1]
+
+# C.2.5 Statements
+def p_unit_statement(p):
+	"""statement : declaration_statement
+		| embedded_statement
+		| print_statement
+		| read_statement
+	embedded_statement : block
+		| expression_statement
+		| selection_statement
+		| iteration_statement
+		| jump_statement
+	statement_list_opt : empty
+		| statement_list
+	statement_expression : invocation_expression
+		| assignment
+		| pre_increment_expression
+		| pre_decrement_expression
+	selection_statement : if_statement
+	iteration_statement : while_statement
+		| for_statement
+	jump_statement : return_statement
+	for_initializer : local_variable_declaration
+		| statement_expression_list
+	for_condition : boolean_expression
+	for_iterator : statement_expression_list
+	variable_initializer : expression
+		| array_initializer
+	"""
+	p[0] = p[1]
+
+def p_terminated(p):
+	"""declaration_statement : local_variable_declaration STMT_TERMINATOR
+	expression_statement : statement_expression STMT_TERMINATOR
+	"""
+	p[0] = p[1]
+
+def p_block(p):
+	"""block : LBRACE statement_list_opt RBRACE
+	"""
+	p[0] = Block(p[2] or [])
+
+def p_statement_list(p):
+	"""statement_list : statement
+		| statement_list statement
+	"""
+	if len(p) == 2:
+		p[0] = [p[1]]
+	else:
+		p[0] = p[1]
+		p[0].append(p[2])
+
+def p_declaration(p):
+	"""local_variable_declaration : type variable_declarators
+	field_declaration : type variable_declarators STMT_TERMINATOR
+	"""
+	p[0] = Declaration(p[1], p[2])
+
+def p_variable_declarator(p):
+	"""variable_declarator : IDENTIFIER
+		| IDENTIFIER EQUALS variable_initializer
+	"""
+	if len(p) == 2:
+		p[0] = (p[1], None, p.lexpos(1))
+	else:
+		p[0] = (p[1], p[3], p.lexpos(1))
+
+def p_array_initializer(p):
+	"""array_initializer : LBRACE variable_initializer_list RBRACE
+	"""
+	p[0] = p[2]
+
+def p_print_statement(p):
+	"""print_statement : WRITELINE LPAREN argument RPAREN STMT_TERMINATOR
+	"""
+	p[0] = Print(p[3])
+
+def p_read_statement(p):
+	"""read_statement : READLINE LPAREN argument RPAREN STMT_TERMINATOR
+	"""
+	p[0] = Read(p[3])
+
+def p_if_statement(p):
+	"""if_statement : IF LPAREN boolean_expression RPAREN embedded_statement
+		| IF LPAREN boolean_expression RPAREN embedded_statement ELSE embedded_statement
+	"""
+	if len(p) == 6:
+		p[0] = If(p[3], p[5], None)
+	else:
+		p[0] = If(p[3], p[5], p[7])
+
+def p_while_statement(p):
+	"""while_statement : WHILE LPAREN boolean_expression RPAREN embedded_statement
+	"""
+	p[0] = While(p[3], p[5])
+
+def p_for_statement(p):
+	"""for_statement : FOR LPAREN for_initializer STMT_TERMINATOR for_condition STMT_TERMINATOR for_iterator RPAREN embedded_statement
+	"""
+	p[0] = For(p[3], p[5], p[7], p[9])
+
+def p_return_statement(p):
+	"""return_statement : RETURN expression_opt STMT_TERMINATOR
+	"""
+	p[0] = Return(p[2])
+
+# Compilation unit
+def p_unit_declaration(p):
+	"""compilation_unit : namespace_declaration
+	namespace_member_declarations_opt : empty
+		| namespace_member_declarations
+	namespace_member_declarations : namespace_member_declaration
+	namespace_member_declaration : type_declaration
+	type_declaration : class_declaration
+	class_member_declarations_opt : empty
+		| class_member_declarations
+	class_member_declaration : field_declaration
+		| method_declaration
+	formal_parameter_list_opt : empty
+		| formal_parameter_list
+	method_body : block
+	"""
+	p[0] = p[1]
+
+def p_namespace_declaration(p):
+	"""namespace_declaration : NAMESPACE IDENTIFIER namespace_body
+	"""
+	p[0] = Namespace(p[2], p[3])
+
+def p_body(p):
+	"""namespace_body : LBRACE namespace_member_declarations_opt RBRACE
+	class_body : LBRACE class_member_declarations_opt RBRACE
+	"""
+	p[0] = p[2]
+
+# C.2.6 Classes
+def p_class_declaration(p):
+	"""class_declaration : CLASS IDENTIFIER class_body
+	"""
+	p[0] = Class(p[2], p[3] or [])
+
+def p_class_member_declarations(p):
+	"""class_member_declarations : class_member_declaration
+		| class_member_declarations class_member_declaration
+	"""
+	if len(p) == 2:
+		p[0] = [p[1]]
+	else:
+		p[0] = p[1]
+		p[0].append(p[2])
+
+def p_method_declaration(p):
+	"""method_declaration : type IDENTIFIER LPAREN formal_parameter_list_opt RPAREN method_body
+	"""
+	p[0] = Method(p[1], p[2], p[4], p[6], p.lexpos(2))
+
+def p_formal_parameter(p):
+	"""formal_parameter : type IDENTIFIER
+	"""
+	p[0] = (p[1], p[2])
+
+def p_empty(p):
+	"""empty :"""
+	p[0] = None
+
+# Syntax errors are reported to the compilation (see parser.Compilation.syntax_error)
+def p_error(p):
+	if p == None:
+		print("Syntax error in input! Unexpected end of input")
+	else:
+		print("Syntax error in input! L", p.lexpos, p)
+
+###################################################################################################
+# The tables are cached like those of parser.py (see tabcache.py)
+parser = None
+
+def get_parser():
+	global parser
+	if parser == None:
+		picklefile = None
+		outputdir = tabcache.cache_dir()
+		if outputdir != None:
+			picklefile = os.path.join(outputdir, 'syntaxtab_' + tabcache.signature(globals(), 'p_') + '.pickle')
+		parser = yacc.yacc(debug=False, tabmodule='syntaxtab', picklefile=picklefile, outputdir=os.path.dirname(os.path.abspath(__file__)), errorlog=yacc.NullLogger())
+	return parser
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+# Persistent cache for the PLY lexer and parser tables
+#
+# Building the LALR tables (and validating every token regex) costs far more
+# than compiling a small program, so the tables are written once to a user
+# cache directory and reused by every later run. Table files are named after
+# a hash of the grammar they were built from, so editing the grammar simply
+# produces a new cache entry instead of loading stale tables.
+###################################################################################################
+
+import os
+import hashlib
+import importlib.util
+import ply
+
+# Returns the directory holding the cached tables, creating it if needed.
+# PYCS_CACHE_DIR overrides the default of $XDG_CACHE_HOME/pycs (~/.cache/pycs)
+def cache_dir():
+	path = os.environ.get('PYCS_CACHE_DIR')
+	if not path:
+		base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+		path = os.path.join(base, 'pycs')
+	try:
+		os.makedirs(path, exist_ok=True)
+	except OSError:
+		return None
+	return path
+
+# Hash of everything PLY reads from a lexer/parser module: the token list, the
+# precedence table and every rule with the given prefix, in definition order
+def signature(ldict, prefix):
+	h = hashlib.sha1()
+	h.update(ply.__version__.encode())
+	h.update(repr(ldict.get('tokens')).encode())
+	h.update(repr(ldict.get('precedence')).encode())
+	h.update(repr(ldict.get('start')).encode())
+	strings = []
+	funcs = []
+	for name in ldict:
+		if not name.startswith(prefix):
+			continue
+		rule = ldict[name]
+		if callable(rule):
+			funcs.append((rule.__code__.co_firstlineno, name, rule.__doc__))
+		else:
+			strings.append((name, rule))
+	for name, rule in sorted(strings):
+		h.update((name + ' ' + repr(rule) + '\n').encode())
+	for line, name, doc in sorted(funcs):
+		h.update((name + ' ' + repr(doc) + '\n').encode())
+	return h.hexdigest()[:16]
+
+# Loads a cached table module from its file without touching sys.path
+def load_module(name, path):
+	if path == None or not os.path.exists(path):
+		return None
+	spec = importlib.util.spec_from_file_location(name, path)
+	module = importlib.util.module_from_spec(spec)
+	try:
+		spec.loader.exec_module(module)
+	except Exception:
+		return None
+	return module
@@ -1,9 +1,77 @@
-def print_tac(pclass):
-	print("1, call, Main")
-	print("2, exit")
-	c = 3
-	for member in pclass:
-		for line in member['code']:
-			if line != "":
-				print(str(c) + ", " + line)
-				c = c + 1
\ No newline at end of file
+from ir import Instr, Op
+
+# Code fragments: the TAC instructions of a parse tree node, kept as an
+# immutable rope. Concatenation builds a new node sharing both operands in
+# O(1), so no semantic action ever copies code; the instructions are
+# collected once, in order, when the fragment is iterated (by instructions).
+class fragment:
+	__slots__ = ('left', 'right', 'size')
+
+	def __init__(self, left=(), right=()):
+		if isinstance(left, list):
+			left = tuple(left)
+		if isinstance(right, list):
+			right = tuple(right)
+		self.left = left
+		self.right = right
+		self.size = len(left) + len(right)
+
+	def __add__(self, other):
+		return fragment(self, other)
+
+	def __radd__(self, other):
+		return fragment(other, self)
+
+	def __len__(self):
+		return self.size
+
+	def __iter__(self):
+		# Explicit stack: a long statement list makes a very deep rope
+		stack = [self]
+		while stack:
+			node = stack.pop()
+			if isinstance(node, fragment):
+				stack.append(node.right)
+				stack.append(node.left)
+			else:
+				yield from node
+
+# Target of a jump that is not known yet, filled in by backpatch
+HOLE = ''
+
+# Points jumps (goto and ifgoto instructions) at a label
+def backpatch(jumps, label):
+	for jump in jumps:
+		jump.args = jump.args[:-1] + (label,)
+
+# The instructions (ir.Instr) of the program: the call to Main, then the code
+# of every class member
+def instructions(pclass):
+	yield from prologue()
+	for member in pclass:
+		yield from member_instructions(member)
+
+# The call to Main that starts every program
+def prologue():
+	return [Instr(Op.CALL, 'Main'), Instr(Op.EXIT)]
+
+def member_instructions(member):
+	return member['code']
+
+# The numbered listing of a list of instructions
+def listing(code):
+	return "".join(str(i+1) + ", " + str(code[i]) + "\n" for i in range(len(code)))
+
+# Writes the numbered listing one instruction at a time, as the instructions
+# are passed to it
+class listing_writer:
+	def __init__(self, out):
+		self.out = out
+		self.count = 0
+
+	def __call__(self, instr):
+		self.count += 1
+		self.out.write(str(self.count) + ", " + str(instr) + "\n")
+
+def print_tac(pclass):
+	print(listing(list(instructions(pclass))), end="")
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+# Compact token buffer
+#
+# Stores a whole token stream in four parallel array.array columns instead of
+# one LexToken object per token:
+#     types   - interned token type id
+#     values  - index of the lexeme in a string pool (each lexeme stored once)
+#     offsets - lexpos of the token
+#     lines   - lineno of the token
+# A TokenReader hands the tokens back to the parser one LexToken at a time,
+# so only the token currently being parsed exists as an object.
+###################################################################################################
+
+from array import array
+import ply.lex as lex
+
+class TokenBuffer:
+	def __init__(self):
+		self.types = array('B')
+		self.values = array('L')
+		self.offsets = array('Q')
+		self.lines = array('L')
+		# Interned token types and the lexeme pool
+		self.typenames = []
+		self.typeids = {}
+		self.pool = []
+		self.poolids = {}
+
+	# Lexes data with the given lexer (PLY lexer or scanner) into the buffer
+	def fill(self, lexer, data):
+		lexer.input(data)
+		token = lexer.token
+		typeids = self.typeids
+		poolids = self.poolids
+		append_type = self.types.append
+		append_value = self.values.append
+		append_offset = self.offsets.append
+		append_line = self.lines.append
+		while True:
+			tok = token()
+			if tok == None:
+				break
+			t = typeids.get(tok.type)
+			if t == None:
+				t = typeids[tok.type] = len(self.typenames)
+				self.typenames.append(tok.type)
+			v = poolids.get(tok.value)
+			if v == None:
+				v = poolids[tok.value] = len(self.pool)
+				self.pool.append(tok.value)
+			append_type(t)
+			append_value(v)
+			append_offset(tok.lexpos)
+			append_line(tok.lineno)
+		return self
+
+	def __len__(self):
+		return len(self.types)
+
+	def reader(self):
+		return TokenReader(self)
+
+# Lexer-like adapter over a TokenBuffer, accepted by parser.parse(lexer=...)
+class TokenReader:
+	def __init__(self, buf):
+		self.buf = buf
+		self.index = 0
+		self.lineno = 1
+
+	# The buffer already holds the tokens, the input is ignored
+	def input(self, data):
+		self.index = 0
+
+	# The words of the lexemes a pattern finds
+	def findall(self, pattern):
+		words = set()
+		for value in self.buf.pool:
+			if isinstance(value, str):
+				words.update(pattern.findall(value))
+		return words
+
+	def token(self):
+		buf = self.buf
+		i = self.index
+		if i >= len(buf.types):
+			return None
+		self.index = i + 1
+		tok = lex.LexToken()
+		tok.type = buf.typenames[buf.types[i]]
+		tok.value = buf.pool[buf.values[i]]
+		tok.lexpos = buf.offsets[i]
+		tok.lineno = self.lineno = buf.lines[i]
+		return tok
@@ -0,0 +1,29 @@
+namespace Names
+{
+	class Names
+	{
+		int t7;
+		int f(int t3)
+		{
+			t7 = t7 + t3;
+			return t3 * 2;
+		}
+		int Main()
+		{
+			int t0 = 5;
+			int t1 = 4;
+			int t2 = 0;
+			int i = 0;
+			while (i < 3)
+			{
+				int b = i * 3 + t1 * 4;
+				t2 = t2 + f(t1 + i) + b;
+				i = i + 1;
+			}
+			Writeline(t2);
+			Writeline(t7);
+			Writeline(t0);
+			return 0;
+		}
+	}
+}
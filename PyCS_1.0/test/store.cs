@@ -0,0 +1,20 @@
+namespace HelloWorld
+{
+	class Hello 
+	{
+		int Main() 
+		{
+			int[] a = {3, 1, 4, 1};
+			int i = 0;
+			int x = 5;
+			a[i + 1] = x * 2;
+			Writeline(a[1]);
+			a[i * 2 + 1] = a[i + 2] + x * 3;
+			Writeline(a[1]);
+			a[a[3] + 2] = a[i + 1] - a[i];
+			Writeline(a[3]);
+			Writeline(a[0] + a[1] + a[2] + a[3]);
+			return 0;
+		}
+	}
+}